@@ -251,6 +251,13 @@ class BatchProcessor:
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
+        # One loop serves every class; it keeps no per-run state
+        loop = RalphLoop(
+            llm=self.llm,
+            config=self.config.loop_config,
+            hooks=hooks,
+        )
+
         async def process_one(class_info: ClassInfo) -> LoopResult | None:
             async with semaphore:
                 if self._on_class_start:
@@ -261,11 +268,6 @@ class BatchProcessor:
                     if self.config.respect_rate_limits:
                         await asyncio.sleep(self.config.rate_limit_delay)
 
-                    loop = RalphLoop(
-                        llm=self.llm,
-                        config=self.config.loop_config,
-                        hooks=hooks,
-                    )
                     result = await loop.run(class_info)
 
                     if self._state:
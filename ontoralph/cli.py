@@ -23,7 +23,7 @@ from ontoralph.core.checklist import ChecklistEvaluator
 from ontoralph.core.loop import LoopConfig, LoopHooks, RalphLoop
 from ontoralph.core.models import CheckResult, ClassInfo, LoopResult, VerifyStatus
 from ontoralph.llm import ClaudeProvider, MockProvider, OpenAIProvider
-from ontoralph.output import ReportGenerator, TurtleGenerator
+from ontoralph.output import ReportGenerator, TurtleGenerator, TurtleValidationError
 
 console = Console()
 error_console = Console(stderr=True)
@@ -136,21 +136,38 @@ def output_result(
         format: Output format ('turtle', 'markdown', 'json').
         output_path: Output file path, or None for stdout.
         quiet: If True, suppress info messages.
+
+    Raises:
+        click.ClickException: If the format is unknown or the class cannot
+            be written as Turtle.
     """
     if format == "turtle":
         turtle_gen = TurtleGenerator()
-        content = turtle_gen.generate_from_result(result)
+        try:
+            content = turtle_gen.generate_from_result(result)
+        except TurtleValidationError as e:
+            raise click.ClickException(f"Cannot write Turtle output: {e}") from e
     elif format == "markdown":
         report_gen = ReportGenerator()
-        content = report_gen.generate_markdown(result)
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as fp:
+                report_gen.write_markdown(result, fp)
+        else:
+            content = report_gen.generate_markdown(result)
     elif format == "json":
         json_gen = ReportGenerator()
-        content = json_gen.generate_json(result)
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as fp:
+                json_gen.write_json(result, fp)
+        else:
+            content = json_gen.generate_json(result)
     else:
         raise click.ClickException(f"Unknown format: {format}")
 
     if output_path:
-        Path(output_path).write_text(content, encoding="utf-8")
+        # Reports are streamed to the file above; Turtle is written whole
+        if format == "turtle":
+            Path(output_path).write_text(content, encoding="utf-8")
         if not quiet:
             console.print(f"[green]Output written to:[/green] {output_path}")
     else:
@@ -620,7 +637,12 @@ def batch(
         # Create safe filename from IRI
         safe_name = result.class_info.iri.replace(":", "_").replace("/", "_")
         output_path = output_dir / f"{safe_name}{ext}"
-        output_result(result, format, str(output_path), quiet=True)
+        try:
+            output_result(result, format, str(output_path), quiet=True)
+        except click.ClickException as e:
+            error_console.print(
+                f"[red]Error:[/red] {result.class_info.label}: {e.message}"
+            )
 
     # Write summary report
     from ontoralph.output import BatchReportGenerator
@@ -651,11 +673,22 @@ def batch(
         from ontoralph.batch import BatchIntegrityChecker, TurtleValidator
         from ontoralph.output import TurtleGenerator
 
-        # Generate combined graph
+        # Generate combined graph, leaving out classes Turtle cannot write
         gen = TurtleGenerator()
-        combined_turtle = gen.generate_batch(
-            [(r.class_info, r.final_definition) for r in results]
-        )
+        writable = []
+        for r in results:
+            try:
+                gen.generate(r.class_info, r.final_definition)
+            except TurtleValidationError as e:
+                # Turtle output already reported the class when writing it
+                if format != "turtle":
+                    error_console.print(
+                        f"[red]Error:[/red] {r.class_info.label}: "
+                        f"Cannot write Turtle output: {e}"
+                    )
+                continue
+            writable.append((r.class_info, r.final_definition))
+        combined_turtle = gen.generate_batch(writable)
 
         graph = Graph()
         graph.parse(data=combined_turtle, format="turtle")
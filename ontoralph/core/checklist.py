@@ -11,6 +11,7 @@ It implements:
 from __future__ import annotations
 
 import re
+import threading
 from typing import TYPE_CHECKING
 
 from ontoralph.core.models import CheckResult, Severity, VerifyStatus
@@ -57,6 +58,28 @@ class RedFlagDetector:
         r"\bencoded as\b",
     ]
 
+    def __init__(self) -> None:
+        """Compile the red flag patterns once per detector."""
+        self._compiled = {
+            code: [re.compile(p, re.IGNORECASE) for p in patterns]
+            for code, patterns in (
+                ("R1", self.R1_PATTERNS),
+                ("R2", self.R2_PATTERNS),
+                ("R3", self.R3_PATTERNS),
+                ("R4", self.R4_PATTERNS),
+            )
+        }
+        # Single alternation used to clear clean definitions in one scan
+        self._any_red_flag = re.compile(
+            "|".join(
+                self.R1_PATTERNS
+                + self.R2_PATTERNS
+                + self.R3_PATTERNS
+                + self.R4_PATTERNS
+            ),
+            re.IGNORECASE,
+        )
+
     def check(self, definition: str) -> list[CheckResult]:
         """Check a definition for red flags.
 
@@ -68,9 +91,14 @@ class RedFlagDetector:
         """
         results = []
         definition_lower = definition.lower()
+        has_red_flag = self._any_red_flag.search(definition_lower) is not None
 
         # R1: Process verbs
-        r1_matches = self._find_matches(definition_lower, self.R1_PATTERNS)
+        r1_matches = (
+            self._find_matches(definition_lower, self._compiled["R1"])
+            if has_red_flag
+            else []
+        )
         results.append(
             CheckResult(
                 code="R1",
@@ -86,7 +114,11 @@ class RedFlagDetector:
         )
 
         # R2: "represents" instead of "denotes"
-        r2_matches = self._find_matches(definition_lower, self.R2_PATTERNS)
+        r2_matches = (
+            self._find_matches(definition_lower, self._compiled["R2"])
+            if has_red_flag
+            else []
+        )
         results.append(
             CheckResult(
                 code="R2",
@@ -102,7 +134,11 @@ class RedFlagDetector:
         )
 
         # R3: Functional language
-        r3_matches = self._find_matches(definition_lower, self.R3_PATTERNS)
+        r3_matches = (
+            self._find_matches(definition_lower, self._compiled["R3"])
+            if has_red_flag
+            else []
+        )
         results.append(
             CheckResult(
                 code="R3",
@@ -118,7 +154,11 @@ class RedFlagDetector:
         )
 
         # R4: Syntactic terms
-        r4_matches = self._find_matches(definition_lower, self.R4_PATTERNS)
+        r4_matches = (
+            self._find_matches(definition_lower, self._compiled["R4"])
+            if has_red_flag
+            else []
+        )
         results.append(
             CheckResult(
                 code="R4",
@@ -135,20 +175,19 @@ class RedFlagDetector:
 
         return results
 
-    def _find_matches(self, text: str, patterns: list[str]) -> list[str]:
+    def _find_matches(self, text: str, patterns: list[re.Pattern[str]]) -> list[str]:
         """Find all matching patterns in text.
 
         Args:
             text: The text to search (should be lowercase).
-            patterns: List of regex patterns to match.
+            patterns: List of compiled regex patterns to match.
 
         Returns:
             List of matched strings.
         """
         matches = []
         for pattern in patterns:
-            found = re.findall(pattern, text, re.IGNORECASE)
-            matches.extend(found)
+            matches.extend(pattern.findall(text))
         return matches
 
 
@@ -159,6 +198,17 @@ class CircularityChecker:
     either directly or through morphological variants.
     """
 
+    # Terms whose patterns are kept; the oldest is dropped beyond this
+    PATTERN_CACHE_SIZE = 1024
+
+    def __init__(self) -> None:
+        """Initialize the checker with an empty per-term pattern cache."""
+        self._pattern_cache: dict[
+            str, tuple[re.Pattern[str], list[tuple[str, re.Pattern[str]]]]
+        ] = {}
+        # Evaluators are shared across worker threads by the web server
+        self._pattern_lock = threading.Lock()
+
     def check(self, definition: str, term: str) -> CheckResult:
         """Check if the term appears in its own definition.
 
@@ -170,18 +220,14 @@ class CircularityChecker:
             Check result for circularity.
         """
         definition_lower = definition.lower()
-        term_lower = term.lower()
-
-        # Generate variants of the term to check
-        variants = self._generate_variants(term_lower)
+        any_variant, variant_patterns = self._get_patterns(term.lower())
 
         # Check for any variant in the definition
         found_variants = []
-        for variant in variants:
-            # Use word boundary matching to avoid false positives
-            pattern = r"\b" + re.escape(variant) + r"\b"
-            if re.search(pattern, definition_lower):
-                found_variants.append(variant)
+        if any_variant.search(definition_lower):
+            for variant, pattern in variant_patterns:
+                if pattern.search(definition_lower):
+                    found_variants.append(variant)
 
         passed = len(found_variants) == 0
 
@@ -197,6 +243,39 @@ class CircularityChecker:
             severity=Severity.REQUIRED,
         )
 
+    def _get_patterns(
+        self, term_lower: str
+    ) -> tuple[re.Pattern[str], list[tuple[str, re.Pattern[str]]]]:
+        """Get compiled variant patterns for a term, compiling on first use.
+
+        The same term is checked on every loop iteration, so the patterns
+        are built once per term. Safe to call from multiple threads.
+
+        Args:
+            term_lower: The lowercase term being defined.
+
+        Returns:
+            Tuple of (combined pattern matching any variant, list of
+            (variant, pattern) pairs).
+        """
+        with self._pattern_lock:
+            cached = self._pattern_cache.get(term_lower)
+        if cached is None:
+            # Use word boundary matching to avoid false positives
+            variant_patterns = [
+                (variant, re.compile(r"\b" + re.escape(variant) + r"\b"))
+                for variant in self._generate_variants(term_lower)
+            ]
+            any_variant = re.compile(
+                "|".join(p.pattern for _, p in variant_patterns) or r"(?!)"
+            )
+            cached = (any_variant, variant_patterns)
+            with self._pattern_lock:
+                if len(self._pattern_cache) >= self.PATTERN_CACHE_SIZE:
+                    del self._pattern_cache[next(iter(self._pattern_cache))]
+                self._pattern_cache[term_lower] = cached
+        return cached
+
     def _generate_variants(self, term: str) -> list[str]:
         """Generate morphological variants of a term.
 
@@ -317,6 +396,10 @@ class ChecklistEvaluator:
     - ITERATE: Core passes but Quality fails (needs refinement)
     """
 
+    # Checks whose automated result is exact rather than heuristic; these
+    # never need to be re-evaluated by the LLM.
+    DETERMINISTIC_CODES = frozenset({"C3", "C4", "I1", "I2", "R1", "R2", "R3", "R4"})
+
     def __init__(self, custom_rules: list[CustomRule] | None = None) -> None:
         """Initialize the checklist evaluator.
 
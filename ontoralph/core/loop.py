@@ -4,6 +4,7 @@ This module contains the main loop orchestration logic for the
 Generate -> Critique -> Refine -> Verify cycle.
 """
 
+import asyncio
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -85,6 +86,8 @@ class LoopConfig:
     use_hybrid_checking: bool = True
     fail_fast_on_red_flags: bool = True
     log_iterations: bool = True
+    # When set, the loop stops at the next iteration boundary
+    cancel_event: asyncio.Event | None = None
 
 
 @dataclass
@@ -126,6 +129,9 @@ class RalphLoop:
 
     Supports hybrid checking where automated checks (red flags, circularity)
     run before LLM-based semantic checks, potentially saving API calls.
+
+    A loop keeps no state between runs, so one instance can process many
+    classes, including concurrently.
     """
 
     def __init__(
@@ -149,6 +155,11 @@ class RalphLoop:
     async def run(self, class_info: ClassInfo) -> LoopResult:
         """Execute the full loop until PASS or max iterations.
 
+        Safe to await on a server's event loop: providers make their API
+        calls through async clients, and the only synchronous work is the
+        automated checklist, a handful of regex passes over one definition.
+        Hooks are called on the same thread, in order.
+
         Args:
             class_info: Information about the class to refine.
 
@@ -167,8 +178,12 @@ class RalphLoop:
         )
         self._call_hook("on_loop_start", state)
 
-        # Run iterations until complete
+        # Run iterations until complete or cancelled
+        cancel_event = self.config.cancel_event
         while not state.is_complete:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Ralph Loop cancelled for {class_info.label}")
+                break
             state = await self.step(state)
 
         # Build final result
@@ -352,9 +367,15 @@ class RalphLoop:
 
         # Step 2: Run LLM critique for semantic checks
         if not self.config.use_hybrid_checking:
-            # If hybrid checking is disabled, use LLM for everything
+            # If hybrid checking is disabled, use the LLM for every check
+            # that automated checking cannot decide exactly
+            decided = [
+                r for r in automated if r.code in self._evaluator.DETERMINISTIC_CODES
+            ]
             try:
-                llm_results = await self.llm.critique(class_info, definition)
+                llm_results = await self.llm.critique_semantic(
+                    class_info, definition, decided
+                )
                 result.llm_results = llm_results
                 result.combined_results = self._merge_results(automated, llm_results)
             except Exception as e:
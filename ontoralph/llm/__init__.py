@@ -9,7 +9,9 @@ from ontoralph.llm.base import (
     LLMError,
     LLMProvider,
     LLMRateLimitError,
+    LLMRequestError,
     LLMResponseError,
+    LLMServiceError,
     LLMTimeoutError,
     LoopPhase,
     SessionUsage,
@@ -19,6 +21,14 @@ from ontoralph.llm.claude import ClaudeProvider
 from ontoralph.llm.mock import FailingMockProvider, MockProvider
 from ontoralph.llm.openai import OpenAIProvider
 from ontoralph.llm.parser import ResponseParser
+from ontoralph.llm.prompts import (
+    SYSTEM_PROMPT,
+    PromptTemplateManager,
+    format_critique_prompt,
+    format_generate_prompt,
+    format_refine_prompt,
+    get_template_manager,
+)
 
 __all__ = [
     # Base classes and types
@@ -28,6 +38,8 @@ __all__ = [
     "LLMRateLimitError",
     "LLMTimeoutError",
     "LLMResponseError",
+    "LLMRequestError",
+    "LLMServiceError",
     "LoopPhase",
     "UsageStats",
     "SessionUsage",
@@ -36,6 +48,13 @@ __all__ = [
     "OpenAIProvider",
     "MockProvider",
     "FailingMockProvider",
+    # Prompts
+    "SYSTEM_PROMPT",
+    "PromptTemplateManager",
+    "format_generate_prompt",
+    "format_critique_prompt",
+    "format_refine_prompt",
+    "get_template_manager",
     # Utilities
     "ResponseParser",
 ]
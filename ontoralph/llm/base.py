@@ -45,6 +45,18 @@ class LLMResponseError(LLMError):
     pass
 
 
+class LLMRequestError(LLMResponseError):
+    """Raised when the API rejects a request as invalid (HTTP 4xx)."""
+
+    pass
+
+
+class LLMServiceError(LLMResponseError):
+    """Raised when the API is unreachable or fails with a server error."""
+
+    pass
+
+
 class LoopPhase(str, Enum):
     """Phases of the Ralph Loop that use LLM."""
 
@@ -195,6 +207,30 @@ class LLMProvider(ABC):
         """
         ...
 
+    async def critique_semantic(
+        self,
+        class_info: ClassInfo,
+        definition: str,
+        decided: list[CheckResult],
+    ) -> list[CheckResult]:
+        """Critique only the checks not already decided by automated checking.
+
+        Providers that build their own prompts override this to send a
+        shorter checklist. The default performs a full critique() and drops
+        results for the already-decided checks.
+
+        Args:
+            class_info: Information about the class.
+            definition: The definition to critique.
+            decided: Check results already determined locally.
+
+        Returns:
+            List of check results for the remaining checks.
+        """
+        decided_codes = {result.code for result in decided}
+        results = await self.critique(class_info, definition)
+        return [r for r in results if r.code not in decided_codes]
+
     @abstractmethod
     async def refine(
         self, class_info: ClassInfo, definition: str, issues: list[CheckResult]
@@ -13,7 +13,9 @@ from ontoralph.llm.base import (
     LLMAuthenticationError,
     LLMProvider,
     LLMRateLimitError,
+    LLMRequestError,
     LLMResponseError,
+    LLMServiceError,
     LLMTimeoutError,
     LoopPhase,
     UsageStats,
@@ -24,6 +26,7 @@ from ontoralph.llm.prompts import (
     format_critique_prompt,
     format_generate_prompt,
     format_refine_prompt,
+    format_semantic_critique_prompt,
 )
 
 try:
@@ -133,6 +136,26 @@ class OpenAIProvider(LLMProvider):
         response = await self._call_api(prompt, LoopPhase.CRITIQUE)
         return self._parser.parse_critique(response)
 
+    async def critique_semantic(
+        self,
+        class_info: ClassInfo,
+        definition: str,
+        decided: list[CheckResult],
+    ) -> list[CheckResult]:
+        """Critique only the checks not already decided locally.
+
+        Args:
+            class_info: Information about the class.
+            definition: The definition to critique.
+            decided: Check results already determined by automated checking.
+
+        Returns:
+            List of check results for the remaining checks.
+        """
+        prompt = format_semantic_critique_prompt(class_info, definition, decided)
+        response = await self._call_api(prompt, LoopPhase.CRITIQUE)
+        return self._parser.parse_critique(response)
+
     async def refine(
         self, class_info: ClassInfo, definition: str, issues: list[CheckResult]
     ) -> str:
@@ -233,18 +256,18 @@ class OpenAIProvider(LLMProvider):
                     raise last_error from None
                 elif e.status_code >= 500:
                     # Server errors are retryable
-                    last_error = LLMResponseError(f"Server error: {e.message}")
+                    last_error = LLMServiceError(f"Server error: {e.message}")
                     if attempt < self.MAX_RETRIES - 1:
                         await asyncio.sleep(self._get_backoff_delay(attempt))
                         continue
                     raise last_error from None
                 else:
-                    raise LLMResponseError(
+                    raise LLMRequestError(
                         f"API error ({e.status_code}): {e.message}"
                     ) from None
 
             except APIConnectionError as e:
-                last_error = LLMResponseError(f"Connection error: {e}")
+                last_error = LLMServiceError(f"Connection error: {e}")
                 if attempt < self.MAX_RETRIES - 1:
                     await asyncio.sleep(self._get_backoff_delay(attempt))
                     continue
@@ -10,10 +10,13 @@ Supports custom templates via configuration for project-specific needs.
 
 from __future__ import annotations
 
+import functools
 import logging
-from pathlib import Path
+import os
+import sys
+import threading
 from string import Template
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ontoralph.core.models import CheckResult, ClassInfo
 
@@ -34,54 +37,204 @@ Key principles:
 6. Avoid syntactic terms (noun phrase, verb phrase, encoded as) - definitions should be ontological, not syntactic
 7. The definition must be a single, complete sentence
 8. The term being defined must not appear in the definition (non-circular)"""
+SYSTEM_PROMPT = sys.intern(SYSTEM_PROMPT)
 
+# Invariant prompt fragments, assembled once at import so formatting a
+# prompt only joins these with the per-class values.
+_GENERATE_HEADER = "Generate a formal ontology definition for the following class:\n\n"
 
-def format_generate_prompt(class_info: ClassInfo) -> str:
-    """Format the prompt for definition generation.
-
-    Args:
-        class_info: Information about the class to define.
-
-    Returns:
-        Formatted prompt string.
+_GENERATE_ICE_NOTE = sys.intern(
     """
-    siblings_text = ""
-    if class_info.sibling_classes:
-        siblings_text = f"""
-Sibling classes (the definition should distinguish from these):
-{", ".join(class_info.sibling_classes)}
-"""
-
-    current_def_text = ""
-    if class_info.current_definition:
-        current_def_text = f"""
-Current definition (to improve):
-"{class_info.current_definition}"
-"""
-
-    ice_note = ""
-    if class_info.is_ice:
-        ice_note = """
 IMPORTANT: This is an Information Content Entity (ICE). The definition MUST:
 - Start with "An ICE that..." or "An Information Content Entity that..."
 - Use "denotes" or "is about" to specify what the ICE is about
 - NOT use "represents" (use "denotes" instead)
 """
+)
 
-    return f"""Generate a formal ontology definition for the following class:
-
-Class IRI: {class_info.iri}
-Label: {class_info.label}
-Parent class: {class_info.parent_class}
-{siblings_text}{current_def_text}{ice_note}
+_GENERATE_REQUIREMENTS = sys.intern(
+    """
 Requirements:
 1. Follow the genus-differentia pattern
 2. Reference the parent class as the genus
 3. Include differentia that distinguishes this class from siblings
 4. Be a single, complete sentence
-5. Do not include the term "{class_info.label}" in the definition
+5. Do not include the term \""""
+)
+
+_GENERATE_FOOTER = sys.intern(
+    """" in the definition
 
 Respond with ONLY the definition text, nothing else. Do not include quotes around it."""
+)
+
+# Checklist questions by code; every critique prompt's checklist is built
+# from these, so the full and partial prompts always ask the same questions
+_CHECK_QUESTIONS = {
+    "C1": "Is the genus (parent class) present or implied?",
+    "C2": "Is there differentia (distinguishing characteristics)?",
+    "C3": 'Is the definition non-circular (term "{label}" not in definition)?',
+    "C4": "Is it a single sentence?",
+    "I1": 'Does it start with "An ICE" or "An Information Content Entity"?',
+    "I2": 'Does it use "denotes" or "is about"?',
+    "I3": "Does it specify what the ICE denotes?",
+    "Q1": "Is the length appropriate (not too short or too long)?",
+    "Q2": "Is it clear and readable?",
+    "Q3": "Does it use standard ontology terminology?",
+    "R1": "Does it use process verbs (extracted, detected, identified, parsed)?",
+    "R2": 'Does it use "represents" instead of "denotes"?',
+    "R3": "Does it use functional language (serves to, used to, functions to)?",
+    "R4": "Does it use syntactic terms (noun phrase, verb phrase, encoded as)?",
+}
+
+
+def _check_lines(*codes: str) -> str:
+    """Render checklist questions as prompt bullet lines."""
+    return "".join(f"- {code}: {_CHECK_QUESTIONS[code]}\n" for code in codes)
+
+
+# The C3 question names the class label, which is spliced in per prompt
+_C3_BEFORE_LABEL, _C3_AFTER_LABEL = _CHECK_QUESTIONS["C3"].split("{label}")
+
+_CRITIQUE_CORE = sys.intern(
+    "\n\nEvaluate against these criteria and respond in JSON format:\n\n"
+    "Core Requirements:\n" + _check_lines("C1", "C2") + "- C3: " + _C3_BEFORE_LABEL
+)
+
+_CRITIQUE_SINGLE_SENTENCE = _C3_AFTER_LABEL + "\n" + _check_lines("C4")
+
+_CRITIQUE_ICE_CHECKS = sys.intern(
+    "\nICE-Specific Requirements:\n" + _check_lines("I1", "I2", "I3")
+)
+
+_CRITIQUE_JSON_EXAMPLE = """Respond with a JSON array of check results:
+```json
+[
+  {"code": "C1", "name": "Genus present", "passed": true, "evidence": "..."},
+  {"code": "C2", "name": "Differentia present", "passed": true, "evidence": "..."},
+  ...
+]
+```
+"""
+
+_CRITIQUE_CHECKLIST = sys.intern(
+    "\nQuality Checks:\n"
+    + _check_lines("Q1", "Q2", "Q3")
+    + "\nRed Flags (any of these is an automatic failure):\n"
+    + _check_lines("R1", "R2", "R3", "R4")
+    + "\n"
+    + _CRITIQUE_JSON_EXAMPLE
+    + "\nInclude ALL checks (C1-C4, Q1-Q3, R1-R4"
+)
+
+_CRITIQUE_FOOTER = """).
+For each check, provide evidence explaining why it passed or failed."""
+
+_REFINE_HEADER = "Refine this ontology definition to address the identified issues:\n\n"
+
+_REFINE_ICE_NOTE = sys.intern(
+    """
+Remember: This is an ICE, so the definition must:
+- Start with "An ICE that..." or "An Information Content Entity that..."
+- Use "denotes" or "is about"
+- NOT use "represents"
+"""
+)
+
+_REFINE_REQUIREMENTS = sys.intern(
+    """
+Requirements:
+1. Fix ALL identified issues
+2. Maintain the genus-differentia structure
+3. Keep it as a single sentence
+4. Do not introduce new problems (especially red flags)
+5. Do not include the term \""""
+)
+
+_REFINE_FOOTER = sys.intern(
+    """" in the definition
+
+Respond with ONLY the refined definition text, nothing else. Do not include quotes around it."""
+)
+
+# Only two variants of each prompt skeleton exist (ICE / non-ICE), so the
+# is_ice-dependent fragments are specialized once here, keyed by is_ice.
+_GENERATE_REQUIREMENTS_BY_ICE = {
+    True: _GENERATE_ICE_NOTE + _GENERATE_REQUIREMENTS,
+    False: _GENERATE_REQUIREMENTS,
+}
+
+_CRITIQUE_TAIL_BY_ICE = {
+    True: "".join(
+        (
+            _CRITIQUE_SINGLE_SENTENCE,
+            _CRITIQUE_ICE_CHECKS,
+            _CRITIQUE_CHECKLIST,
+            ", I1-I3",
+            _CRITIQUE_FOOTER,
+        )
+    ),
+    False: "".join((_CRITIQUE_SINGLE_SENTENCE, _CRITIQUE_CHECKLIST, _CRITIQUE_FOOTER)),
+}
+
+_REFINE_REQUIREMENTS_BY_ICE = {
+    True: _REFINE_ICE_NOTE + _REFINE_REQUIREMENTS,
+    False: _REFINE_REQUIREMENTS,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _join_siblings(siblings: tuple[str, ...]) -> str:
+    """Join sibling IRIs for a prompt (empty if none).
+
+    Every phase of every iteration lists the same siblings, so the joined
+    string is memoized by the siblings themselves.
+    """
+    return ", ".join(siblings)
+
+
+def format_generate_prompt(class_info: ClassInfo) -> str:
+    """Format the prompt for definition generation.
+
+    Args:
+        class_info: Information about the class to define.
+
+    Returns:
+        Formatted prompt string.
+    """
+    return _generate_prompt(
+        class_info.iri,
+        class_info.label,
+        class_info.parent_class,
+        _join_siblings(tuple(class_info.sibling_classes)),
+        class_info.is_ice,
+        class_info.current_definition,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _generate_prompt(
+    iri: str,
+    label: str,
+    parent_class: str,
+    siblings: str,
+    is_ice: bool,
+    current_definition: str | None,
+) -> str:
+    """Build the generate prompt; every input is static, so cache it whole."""
+    parts = [
+        _GENERATE_HEADER,
+        f"Class IRI: {iri}\nLabel: {label}\nParent class: {parent_class}\n",
+    ]
+    if siblings:
+        parts.append(
+            "\nSibling classes (the definition should distinguish from these):\n"
+            f"{siblings}\n"
+        )
+    if current_definition:
+        parts.append(f'\nCurrent definition (to improve):\n"{current_definition}"\n')
+    parts.extend((_GENERATE_REQUIREMENTS_BY_ICE[is_ice], label, _GENERATE_FOOTER))
+    return "".join(parts)
 
 
 def format_critique_prompt(class_info: ClassInfo, definition: str) -> str:
@@ -94,54 +247,75 @@ def format_critique_prompt(class_info: ClassInfo, definition: str) -> str:
     Returns:
         Formatted prompt string.
     """
-    ice_checks = ""
-    if class_info.is_ice:
-        ice_checks = """
-ICE-Specific Requirements:
-- I1: Does it start with "An ICE" or "An Information Content Entity"?
-- I2: Does it use "denotes" or "is about"?
-- I3: Does it specify what the ICE denotes?
-"""
+    header, footer = _critique_parts(
+        class_info.iri, class_info.label, class_info.parent_class, class_info.is_ice
+    )
+    return "".join((header, '"', definition, '"', footer))
 
-    return f"""Evaluate this ontology definition against the checklist:
 
-Class: {class_info.label} ({class_info.iri})
-Parent: {class_info.parent_class}
-Is ICE: {class_info.is_ice}
+@functools.lru_cache(maxsize=4096)
+def _critique_parts(
+    iri: str, label: str, parent_class: str, is_ice: bool
+) -> tuple[str, str]:
+    """Build the static text surrounding the definition in a critique prompt.
 
-Definition:
-"{definition}"
+    Returns:
+        Tuple of (header, footer) to place around the quoted definition.
+    """
+    header = (
+        "Evaluate this ontology definition against the checklist:\n\n"
+        f"Class: {label} ({iri})\nParent: {parent_class}\nIs ICE: {is_ice}\n\n"
+        "Definition:\n"
+    )
+    footer = "".join((_CRITIQUE_CORE, label, _CRITIQUE_TAIL_BY_ICE[is_ice]))
+    return header, footer
 
-Evaluate against these criteria and respond in JSON format:
 
-Core Requirements:
-- C1: Is the genus (parent class) present or implied?
-- C2: Is there differentia (distinguishing characteristics)?
-- C3: Is the definition non-circular (term "{class_info.label}" not in definition)?
-- C4: Is it a single sentence?
-{ice_checks}
-Quality Checks:
-- Q1: Is the length appropriate (not too short or too long)?
-- Q2: Is it clear and readable?
-- Q3: Does it use standard ontology terminology?
+def format_semantic_critique_prompt(
+    class_info: ClassInfo, definition: str, decided: list[CheckResult]
+) -> str:
+    """Format a critique prompt covering only checks not already decided.
 
-Red Flags (any of these is an automatic failure):
-- R1: Does it use process verbs (extracted, detected, identified, parsed)?
-- R2: Does it use "represents" instead of "denotes"?
-- R3: Does it use functional language (serves to, used to, functions to)?
-- R4: Does it use syntactic terms (noun phrase, verb phrase, encoded as)?
+    Used when deterministic checks (circularity, red flags, etc.) have been
+    evaluated locally, so the LLM only spends tokens on semantic checks.
 
-Respond with a JSON array of check results:
-```json
-[
-  {{"code": "C1", "name": "Genus present", "passed": true, "evidence": "..."}},
-  {{"code": "C2", "name": "Differentia present", "passed": true, "evidence": "..."}},
-  ...
-]
-```
+    Args:
+        class_info: Information about the class.
+        definition: The definition to critique.
+        decided: Check results already determined by automated checking.
 
-Include ALL checks (C1-C4, Q1-Q3, R1-R4{", I1-I3" if class_info.is_ice else ""}).
-For each check, provide evidence explaining why it passed or failed."""
+    Returns:
+        Formatted prompt string.
+    """
+    decided_codes = {result.code for result in decided}
+    codes = [
+        code
+        for code in _CHECK_QUESTIONS
+        if code not in decided_codes and (class_info.is_ice or code[0] != "I")
+    ]
+    header, _ = _critique_parts(
+        class_info.iri, class_info.label, class_info.parent_class, class_info.is_ice
+    )
+
+    parts = [header, '"', definition, '"\n\n']
+    if decided_codes:
+        parts.append(
+            f"Skip checks already evaluated: {', '.join(sorted(decided_codes))}.\n"
+        )
+    parts.append("Evaluate only these criteria and respond in JSON format:\n\n")
+    parts.extend(
+        f"- {code}: {_CHECK_QUESTIONS[code].format(label=class_info.label)}\n"
+        for code in codes
+    )
+    parts.extend(
+        (
+            "\n",
+            _CRITIQUE_JSON_EXAMPLE,
+            f"\nInclude ONLY checks {', '.join(codes)}.",
+            "\nFor each check, provide evidence explaining why it passed or failed.",
+        )
+    )
+    return "".join(parts)
 
 
 def format_refine_prompt(
@@ -157,38 +331,38 @@ def format_refine_prompt(
     Returns:
         Formatted prompt string.
     """
-    issues_text = "\n".join(
-        f"- {issue.code} ({issue.name}): {issue.evidence}" for issue in issues
+    header, footer = _refine_parts(
+        class_info.iri, class_info.label, class_info.parent_class, class_info.is_ice
     )
+    # Build the whole prompt in one list so the issue lines are copied once
+    parts = [header, '"', definition, '"\n\nIssues to address:\n']
+    parts.extend(
+        f"- {issue.code} ({issue.name}): {issue.evidence}\n" for issue in issues
+    )
+    if not issues:
+        parts.append("\n")
+    parts.append(footer)
+    return "".join(parts)
 
-    ice_note = ""
-    if class_info.is_ice:
-        ice_note = """
-Remember: This is an ICE, so the definition must:
-- Start with "An ICE that..." or "An Information Content Entity that..."
-- Use "denotes" or "is about"
-- NOT use "represents"
-"""
-
-    return f"""Refine this ontology definition to address the identified issues:
-
-Class: {class_info.label} ({class_info.iri})
-Parent: {class_info.parent_class}
-
-Current definition:
-"{definition}"
 
-Issues to address:
-{issues_text}
-{ice_note}
-Requirements:
-1. Fix ALL identified issues
-2. Maintain the genus-differentia structure
-3. Keep it as a single sentence
-4. Do not introduce new problems (especially red flags)
-5. Do not include the term "{class_info.label}" in the definition
+@functools.lru_cache(maxsize=4096)
+def _refine_parts(
+    iri: str, label: str, parent_class: str, is_ice: bool
+) -> tuple[str, str]:
+    """Build the static text surrounding the definition and issues in a refine prompt.
 
-Respond with ONLY the refined definition text, nothing else. Do not include quotes around it."""
+    Returns:
+        Tuple of (header, footer) to place around the definition and issues.
+    """
+    header = "".join(
+        (
+            _REFINE_HEADER,
+            f"Class: {label} ({iri})\nParent: {parent_class}\n\n",
+            "Current definition:\n",
+        )
+    )
+    footer = "".join((_REFINE_REQUIREMENTS_BY_ICE[is_ice], label, _REFINE_FOOTER))
+    return header, footer
 
 
 def format_class_context(class_info: ClassInfo) -> str:
@@ -208,7 +382,7 @@ def format_class_context(class_info: ClassInfo) -> str:
     ]
 
     if class_info.sibling_classes:
-        lines.append(f"Siblings: {', '.join(class_info.sibling_classes)}")
+        lines.append(f"Siblings: {_join_siblings(tuple(class_info.sibling_classes))}")
 
     if class_info.current_definition:
         lines.append(f"Current definition: {class_info.current_definition}")
@@ -224,6 +398,9 @@ class PromptTemplateManager:
     2. Template files in a specified directory
     3. Default built-in templates (fallback)
 
+    Templates are compiled once into ``string.Template`` objects when loaded
+    and rendered with ``safe_substitute``.
+
     Template variables:
     - ${iri}: Class IRI
     - ${label}: Class label
@@ -235,6 +412,11 @@ class PromptTemplateManager:
     - ${issues}: Formatted issues list (for refine)
     """
 
+    __slots__ = ("config", "_templates", "_compiled", "_prompt_cache")
+
+    # Upper bound on memoized custom-template renders per manager
+    PROMPT_CACHE_SIZE = 1024
+
     def __init__(self, config: PromptConfig | None = None) -> None:
         """Initialize the template manager.
 
@@ -243,7 +425,10 @@ class PromptTemplateManager:
         """
         self.config = config
         self._templates: dict[str, str] = {}
+        self._compiled: dict[str, Template] = {}
+        self._prompt_cache: dict[tuple[Any, ...], str] = {}
         self._load_templates()
+        self._compile_templates()
 
     def _load_templates(self) -> None:
         """Load custom templates from configuration."""
@@ -267,7 +452,20 @@ class PromptTemplateManager:
         if self.config.templates_dir and self.config.templates_dir.exists():
             self._load_from_directory(self.config.templates_dir)
 
-    def _load_from_directory(self, templates_dir: Path) -> None:
+    def _compile_templates(self) -> None:
+        """Compile loaded phase templates once so rendering skips parsing."""
+        for name, template_str in self._templates.items():
+            if name == "system":
+                continue
+            self._compiled[name] = self._compile_template(template_str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_template(template_str: str) -> Template:
+        """Build a string.Template, shared by managers with the same source."""
+        return Template(template_str)
+
+    def _load_from_directory(self, templates_dir: str | os.PathLike[str]) -> None:
         """Load templates from a directory.
 
         Args:
@@ -280,17 +478,27 @@ class PromptTemplateManager:
             "system": ["system.txt", "system.prompt", "system_template.txt"],
         }
 
+        # One directory scan instead of an exists() probe per candidate name
+        try:
+            with os.scandir(templates_dir) as it:
+                entries = {entry.name: entry for entry in it if entry.is_file()}
+        except OSError as e:
+            logger.warning(f"Failed to scan templates directory {templates_dir}: {e}")
+            return
+
         for template_name, filenames in template_files.items():
             for filename in filenames:
-                filepath = templates_dir / filename
-                if filepath.exists():
-                    try:
-                        content = filepath.read_text(encoding="utf-8")
-                        self._templates[template_name] = content
-                        logger.info(f"Loaded {template_name} template from {filepath}")
-                        break
-                    except Exception as e:
-                        logger.warning(f"Failed to load template {filepath}: {e}")
+                entry = entries.get(filename)
+                if entry is None:
+                    continue
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        content = f.read()
+                    self._templates[template_name] = content
+                    logger.info(f"Loaded {template_name} template from {entry.path}")
+                    break
+                except Exception as e:
+                    logger.warning(f"Failed to load template {entry.path}: {e}")
 
     def get_system_prompt(self) -> str:
         """Get the system prompt.
@@ -311,7 +519,7 @@ class PromptTemplateManager:
         """
         if "generate" in self._templates:
             return self._apply_template(
-                self._templates["generate"],
+                "generate",
                 class_info=class_info,
             )
         return format_generate_prompt(class_info)
@@ -328,7 +536,7 @@ class PromptTemplateManager:
         """
         if "critique" in self._templates:
             return self._apply_template(
-                self._templates["critique"],
+                "critique",
                 class_info=class_info,
                 definition=definition,
             )
@@ -355,7 +563,7 @@ class PromptTemplateManager:
                 f"- {issue.code} ({issue.name}): {issue.evidence}" for issue in issues
             )
             return self._apply_template(
-                self._templates["refine"],
+                "refine",
                 class_info=class_info,
                 definition=definition,
                 issues=issues_text,
@@ -364,15 +572,15 @@ class PromptTemplateManager:
 
     def _apply_template(
         self,
-        template_str: str,
+        name: str,
         class_info: ClassInfo,
         definition: str = "",
         issues: str = "",
     ) -> str:
-        """Apply variables to a template string.
+        """Apply variables to a compiled template.
 
         Args:
-            template_str: Template with ${variable} placeholders.
+            name: Name of the loaded template (generate, critique, refine).
             class_info: Class information.
             definition: Current definition (optional).
             issues: Formatted issues (optional).
@@ -380,41 +588,77 @@ class PromptTemplateManager:
         Returns:
             Filled template.
         """
+        # Refine loops re-render the same inputs, so memoize by value
+        key = (
+            name,
+            class_info.iri,
+            class_info.label,
+            class_info.parent_class,
+            _join_siblings(tuple(class_info.sibling_classes)),
+            class_info.is_ice,
+            class_info.current_definition,
+            definition,
+            issues,
+        )
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
         variables = {
             "iri": class_info.iri,
             "label": class_info.label,
             "parent_class": class_info.parent_class,
             "is_ice": str(class_info.is_ice),
-            "siblings": ", ".join(class_info.sibling_classes)
-            if class_info.sibling_classes
-            else "",
+            "siblings": _join_siblings(tuple(class_info.sibling_classes)),
             "current_definition": class_info.current_definition or "",
             "definition": definition,
             "issues": issues,
         }
 
         try:
-            template = Template(template_str)
-            return template.safe_substitute(variables)
+            prompt = self._compiled[name].safe_substitute(variables)
         except Exception as e:
             logger.warning(f"Template substitution failed: {e}, using original")
-            return template_str
+            return self._templates[name]
+
+        if len(self._prompt_cache) >= self.PROMPT_CACHE_SIZE:
+            self._prompt_cache.clear()
+        self._prompt_cache[key] = prompt
+        return prompt
 
 
 # Global template manager instance (uses defaults)
 _template_manager: PromptTemplateManager | None = None
+# Managers built per distinct configuration, keyed by the config's JSON dump
+_template_managers: dict[str, PromptTemplateManager] = {}
+_template_manager_lock = threading.Lock()
 
 
 def get_template_manager(config: PromptConfig | None = None) -> PromptTemplateManager:
     """Get or create the global template manager.
 
+    Managers are memoized per distinct configuration, so repeated calls with
+    an equal config reuse the already-loaded templates. Safe to call from
+    multiple threads.
+
     Args:
-        config: Optional configuration to use.
+        config: Optional configuration to use. When given, the matching
+            manager also becomes the global default.
 
     Returns:
         Template manager instance.
     """
     global _template_manager
-    if config is not None or _template_manager is None:
-        _template_manager = PromptTemplateManager(config)
-    return _template_manager
+    with _template_manager_lock:
+        if config is None:
+            if _template_manager is None:
+                _template_manager = PromptTemplateManager()
+            return _template_manager
+
+        key = config.model_dump_json()
+        manager = _template_managers.get(key)
+        if manager is None:
+            manager = PromptTemplateManager(config)
+            _template_managers[key] = manager
+        _template_manager = manager
+        return manager
@@ -5,7 +5,10 @@ in Markdown, HTML, and JSON formats.
 """
 
 import json
-from typing import Any
+from collections.abc import Iterator
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, TextIO
 
 from ontoralph.core.models import (
     CheckResult,
@@ -16,6 +19,192 @@ from ontoralph.core.models import (
 )
 from ontoralph.output.turtle import TurtleDiff
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+
+# Shared encoder for the standard-library JSON paths; encoding keeps no state.
+# Non-ASCII is written as-is, matching orjson.
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
+
+def _dumps_indented(data: Any) -> str:
+    """Serialize report data as 2-space indented JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    Both paths write non-ASCII characters unescaped, so every JSON report
+    writer produces the same text.
+
+    Args:
+        data: JSON-compatible report data.
+
+    Returns:
+        JSON string.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2).decode(
+            "utf-8"
+        )
+    return _JSON_ENCODER.encode(data)
+
+
+# CSS embedded in every HTML report
+_HTML_STYLES = """
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 20px;
+    line-height: 1.6;
+}
+h1, h2, h3 { color: #333; }
+code {
+    background: #f4f4f4;
+    padding: 2px 6px;
+    border-radius: 3px;
+}
+blockquote {
+    border-left: 4px solid #0066cc;
+    margin: 10px 0;
+    padding: 10px 20px;
+    background: #f9f9f9;
+}
+.status {
+    padding: 4px 12px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+.status.pass { background: #d4edda; color: #155724; }
+.status.fail { background: #f8d7da; color: #721c24; }
+.status.iterate { background: #fff3cd; color: #856404; }
+.iteration {
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 15px;
+    margin: 15px 0;
+}
+.iteration.pass { border-left: 4px solid #28a745; }
+.iteration.fail { border-left: 4px solid #dc3545; }
+.iteration.iterate { border-left: 4px solid #ffc107; }
+.checklist {
+    width: 100%;
+    border-collapse: collapse;
+    margin: 10px 0;
+}
+.checklist th, .checklist td {
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+.checklist th { background: #f4f4f4; }
+.checklist .passed { color: #28a745; }
+.checklist .failed { color: #dc3545; }
+.timestamp { color: #666; font-size: 0.9em; }
+"""
+
+# Static skeleton of the HTML report, filled with a single % substitution
+_HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<title>Ralph Loop Report: %(label)s</title>
+<style>
+%(styles)s
+</style>
+</head>
+<body>
+<h1>Ralph Loop Report: %(label)s</h1>
+
+<div class='summary'>
+<h2>Summary</h2>
+<p><strong>Class IRI:</strong> <code>%(iri)s</code></p>
+<p><strong>Status:</strong> <span class='status %(status_class)s'>%(status_label)s</span></p>
+<p><strong>Iterations:</strong> %(iterations)d</p>
+<p><strong>Converged:</strong> %(converged)s</p>
+<p><strong>Duration:</strong> %(duration).2fs</p>
+</div>
+
+<div class='final-definition'>
+<h2>Final Definition</h2>
+<blockquote>%(final_definition)s</blockquote>
+</div>
+
+<div class='iterations'>
+<h2>Iteration History</h2>
+%(iteration_html)s</div>
+</body>
+</html>"""
+
+# The styles never change, so splice them into the skeleton once
+_HTML_REPORT_TEMPLATE = _HTML_REPORT_TEMPLATE.replace(
+    "%(styles)s", _HTML_STYLES.replace("%", "%%")
+)
+
+
+# Per-result fields aggregated into batch statistics
+_SUMMARY_FIELDS = attrgetter("converged", "total_iterations", "duration_seconds")
+
+# Display order of checklist severities in Markdown reports
+_SEVERITY_ORDER = {
+    Severity.RED_FLAG: 0,
+    Severity.REQUIRED: 1,
+    Severity.ICE_REQUIRED: 2,
+    Severity.QUALITY: 3,
+}
+_CHECK_SEVERITY = attrgetter("severity")
+
+# Every CheckResult field that appears in a rendered report
+_CHECK_FIELDS = attrgetter("code", "name", "passed", "evidence", "severity")
+
+
+def _severity_rank(check: CheckResult) -> int:
+    """Sort key placing checks in severity display order."""
+    return _SEVERITY_ORDER[check.severity]
+
+
+# Checklist table rows for passed and failed checks, filled with code/name/evidence
+_CHECK_ROW_HTML = {
+    True: (
+        "<tr class='passed'><td>{}</td><td>{}</td>"
+        "<td class='passed'>&#x2713;</td><td>{}</td></tr>\n"
+    ),
+    False: (
+        "<tr class='failed'><td>{}</td><td>{}</td>"
+        "<td class='failed'>&#x2717;</td><td>{}</td></tr>\n"
+    ),
+}
+
+
+def _render_check_rows(checks: list[CheckResult], show_all: bool) -> str:
+    """Render checklist table rows for the HTML report.
+
+    Args:
+        checks: Check results for one iteration.
+        show_all: Whether to include passing checks.
+
+    Returns:
+        Concatenated ``<tr>`` rows.
+    """
+    return "".join(
+        [
+            _CHECK_ROW_HTML[check.passed].format(check.code, check.name, check.evidence)
+            for check in checks
+            if show_all or not check.passed
+        ]
+    )
+
 
 class ReportGenerator:
     """Generates reports of Ralph Loop execution.
@@ -43,6 +232,9 @@ class ReportGenerator:
         Severity.RED_FLAG: "Red Flag",
     }
 
+    # Upper bound on memoized Markdown iteration blocks per generator
+    ITERATION_CACHE_SIZE = 256
+
     def __init__(
         self,
         include_timestamps: bool = True,
@@ -60,6 +252,7 @@ class ReportGenerator:
         self.include_evidence = include_evidence
         self.show_all_checks = show_all_checks
         self._diff = TurtleDiff()
+        self._iteration_md_cache: dict[tuple[Any, ...], str] = {}
 
     def generate_markdown(self, result: LoopResult) -> str:
         """Generate a Markdown report of the loop execution.
@@ -70,66 +263,84 @@ class ReportGenerator:
         Returns:
             Markdown-formatted report.
         """
-        lines = []
+        return "".join(self._iter_markdown(result))[:-1]
 
-        # Header
-        lines.append(f"# Ralph Loop Report: {result.class_info.label}")
-        lines.append("")
+    def write_markdown(self, result: LoopResult, fp: TextIO) -> None:
+        """Write a Markdown report section by section to a file object.
 
-        # Summary section
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"- **Class IRI**: `{result.class_info.iri}`")
-        lines.append(f"- **Status**: **{self.STATUS_ICONS[result.status]}**")
-        lines.append(f"- **Iterations**: {result.total_iterations}")
-        lines.append(f"- **Converged**: {'Yes' if result.converged else 'No'}")
-        lines.append(f"- **Duration**: {result.duration_seconds:.2f}s")
+        Produces the same text as generate_markdown() without holding the
+        whole report in memory.
 
-        if self.include_timestamps:
-            lines.append(f"- **Started**: {result.started_at.isoformat()}")
-            lines.append(f"- **Completed**: {result.completed_at.isoformat()}")
+        Args:
+            result: The completed loop result.
+            fp: Text file object to write to.
+        """
+        sections = self._iter_markdown(result)
+        previous = next(sections)
+        for section in sections:
+            fp.write(previous)
+            previous = section
+        # The report drops the final section's trailing newline
+        fp.write(previous[:-1])
 
-        lines.append("")
+    def _iter_markdown(self, result: LoopResult) -> Iterator[str]:
+        """Yield the sections of a Markdown report.
 
-        # Class info
-        lines.append("## Class Information")
-        lines.append("")
-        lines.append(f"- **Parent Class**: `{result.class_info.parent_class}`")
-        lines.append(f"- **Is ICE**: {'Yes' if result.class_info.is_ice else 'No'}")
-
-        if result.class_info.sibling_classes:
-            siblings = ", ".join(f"`{s}`" for s in result.class_info.sibling_classes)
-            lines.append(f"- **Siblings**: {siblings}")
-
-        if result.class_info.current_definition:
-            lines.append(
-                f"- **Initial Definition**: {result.class_info.current_definition}"
+        The concatenated sections end with one newline more than the report.
+
+        Args:
+            result: The completed loop result.
+
+        Yields:
+            Markdown text for each report section.
+        """
+        info = result.class_info
+
+        # Header and summary section
+        report = (
+            f"# Ralph Loop Report: {info.label}\n\n"
+            "## Summary\n\n"
+            f"- **Class IRI**: `{info.iri}`\n"
+            f"- **Status**: **{self.STATUS_ICONS[result.status]}**\n"
+            f"- **Iterations**: {result.total_iterations}\n"
+            f"- **Converged**: {'Yes' if result.converged else 'No'}\n"
+            f"- **Duration**: {result.duration_seconds:.2f}s\n"
+        )
+        if self.include_timestamps:
+            report += (
+                f"- **Started**: {result.started_at.isoformat()}\n"
+                f"- **Completed**: {result.completed_at.isoformat()}\n"
             )
 
-        lines.append("")
+        # Class info
+        report += (
+            "\n## Class Information\n\n"
+            f"- **Parent Class**: `{info.parent_class}`\n"
+            f"- **Is ICE**: {'Yes' if info.is_ice else 'No'}\n"
+        )
+        if info.sibling_classes:
+            siblings = ", ".join(f"`{s}`" for s in info.sibling_classes)
+            report += f"- **Siblings**: {siblings}\n"
+        if info.current_definition:
+            report += f"- **Initial Definition**: {info.current_definition}\n"
 
         # Final definition
-        lines.append("## Final Definition")
-        lines.append("")
-        lines.append(f"> {result.final_definition}")
-        lines.append("")
-
-        # Iteration details
-        lines.append("## Iteration History")
-        lines.append("")
+        yield report + (
+            f"\n## Final Definition\n\n> {result.final_definition}\n\n"
+            "## Iteration History\n\n"
+        )
 
+        # Iteration details, one section per iteration
+        format_iteration = self._format_iteration_markdown
         for iteration in result.iterations:
-            lines.extend(self._format_iteration_markdown(iteration))
-            lines.append("")
+            yield f"{format_iteration(iteration)}\n\n"
 
         # Definition evolution
         if len(result.iterations) > 1:
-            lines.append("## Definition Evolution")
-            lines.append("")
-            lines.extend(self._format_evolution_markdown(result))
-            lines.append("")
-
-        return "\n".join(lines)
+            yield (
+                "## Definition Evolution\n\n"
+                f"{self._format_evolution_markdown(result)}\n\n"
+            )
 
     def generate_summary(self, result: LoopResult) -> str:
         """Generate a brief summary of the loop result.
@@ -157,7 +368,16 @@ class ReportGenerator:
             JSON-formatted report string.
         """
         data = self._result_to_dict(result)
-        return json.dumps(data, indent=2, default=str)
+        return _dumps_indented(data)
+
+    def write_json(self, result: LoopResult, fp: TextIO) -> None:
+        """Stream a JSON report to a file object.
+
+        Args:
+            result: The completed loop result.
+            fp: Text file object to write to.
+        """
+        fp.write(_dumps_indented(self._result_to_dict(result)))
 
     def generate_html(self, result: LoopResult) -> str:
         """Generate an HTML report of the loop execution.
@@ -168,205 +388,190 @@ class ReportGenerator:
         Returns:
             HTML-formatted report string.
         """
-        status_class = result.status.value
-        status_label = self.STATUS_ICONS[result.status]
-
-        html_parts = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            f"<title>Ralph Loop Report: {result.class_info.label}</title>",
-            "<style>",
-            self._get_html_styles(),
-            "</style>",
-            "</head>",
-            "<body>",
-            f"<h1>Ralph Loop Report: {result.class_info.label}</h1>",
-            "",
-            "<div class='summary'>",
-            "<h2>Summary</h2>",
-            f"<p><strong>Class IRI:</strong> <code>{result.class_info.iri}</code></p>",
-            f"<p><strong>Status:</strong> <span class='status {status_class}'>{status_label}</span></p>",
-            f"<p><strong>Iterations:</strong> {result.total_iterations}</p>",
-            f"<p><strong>Converged:</strong> {'Yes' if result.converged else 'No'}</p>",
-            f"<p><strong>Duration:</strong> {result.duration_seconds:.2f}s</p>",
-            "</div>",
-            "",
-            "<div class='final-definition'>",
-            "<h2>Final Definition</h2>",
-            f"<blockquote>{result.final_definition}</blockquote>",
-            "</div>",
-            "",
-            "<div class='iterations'>",
-            "<h2>Iteration History</h2>",
-        ]
-
-        for iteration in result.iterations:
-            html_parts.extend(self._format_iteration_html(iteration))
-
-        html_parts.extend(
-            [
-                "</div>",
-                "</body>",
-                "</html>",
-            ]
-        )
-
-        return "\n".join(html_parts)
+        return _HTML_REPORT_TEMPLATE % {
+            "label": result.class_info.label,
+            "iri": result.class_info.iri,
+            "status_class": result.status.value,
+            "status_label": self.STATUS_ICONS[result.status],
+            "iterations": result.total_iterations,
+            "converged": "Yes" if result.converged else "No",
+            "duration": result.duration_seconds,
+            "final_definition": result.final_definition,
+            "iteration_html": "".join(
+                [
+                    f"{block}\n"
+                    for block in map(self._format_iteration_html, result.iterations)
+                ]
+            ),
+        }
 
-    def _format_iteration_markdown(self, iteration: LoopIteration) -> list[str]:
+    def _format_iteration_markdown(self, iteration: LoopIteration) -> str:
         """Format a single iteration for Markdown output.
 
+        Blocks are memoized by the iteration's rendered fields and the
+        current display options, so regenerating a report reuses them.
+
         Args:
             iteration: The iteration to format.
 
         Returns:
-            List of Markdown lines.
+            Markdown block for the iteration.
         """
-        lines = []
+        key = (
+            self.include_timestamps,
+            self.include_evidence,
+            self.show_all_checks,
+            iteration.iteration_number,
+            iteration.verify_status,
+            iteration.timestamp,
+            iteration.generated_definition,
+            iteration.refined_definition,
+            tuple(map(_CHECK_FIELDS, iteration.critique_results)),
+        )
+        cache = self._iteration_md_cache
+        text = cache.get(key)
+        if text is None:
+            if len(cache) >= self.ITERATION_CACHE_SIZE:
+                cache.clear()
+            text = cache[key] = self._render_iteration_markdown(iteration)
+        return text
 
+    def _render_iteration_markdown(self, iteration: LoopIteration) -> str:
+        """Render a single iteration for Markdown output without caching.
+
+        Args:
+            iteration: The iteration to format.
+
+        Returns:
+            Markdown block for the iteration.
+        """
         status = self.STATUS_ICONS[iteration.verify_status]
-        lines.append(f"### Iteration {iteration.iteration_number} - {status}")
-        lines.append("")
+        text = f"### Iteration {iteration.iteration_number} - {status}\n\n"
 
         if self.include_timestamps:
-            lines.append(f"*{iteration.timestamp.isoformat()}*")
-            lines.append("")
+            text += f"*{iteration.timestamp.isoformat()}*\n\n"
 
         # Generated definition
-        lines.append("**Generated Definition:**")
-        lines.append(f"> {iteration.generated_definition}")
-        lines.append("")
+        text += f"**Generated Definition:**\n> {iteration.generated_definition}\n\n"
 
         # Refined definition (if different)
         if (
             iteration.refined_definition
             and iteration.refined_definition != iteration.generated_definition
         ):
-            lines.append("**Refined Definition:**")
-            lines.append(f"> {iteration.refined_definition}")
-            lines.append("")
+            text += f"**Refined Definition:**\n> {iteration.refined_definition}\n\n"
 
         # Checklist results
-        lines.append("**Checklist Results:**")
-        lines.append("")
+        text += "**Checklist Results:**\n\n"
 
         # Group by severity
         by_severity = self._group_checks_by_severity(iteration.critique_results)
 
-        for severity, checks in by_severity.items():
-            if checks:
-                lines.append(f"*{self.SEVERITY_LABELS[severity]}:*")
-                for check in checks:
-                    if self.show_all_checks or not check.passed:
-                        icon = self.CHECK_ICONS[check.passed]
-                        line = f"- {icon} **{check.code}** {check.name}"
-                        if self.include_evidence and check.evidence:
-                            line += f": {check.evidence}"
-                        lines.append(line)
-                lines.append("")
-
-        return lines
-
-    def _format_iteration_html(self, iteration: LoopIteration) -> list[str]:
+        # Bind per-check lookups once rather than per row
+        severity_label = self.SEVERITY_LABELS.__getitem__
+        check_icon = self.CHECK_ICONS.__getitem__
+        show_all = self.show_all_checks
+        include_evidence = self.include_evidence
+
+        for severity, checks in by_severity:
+            text += f"*{severity_label(severity)}:*\n"
+            for check in checks:
+                if show_all or not check.passed:
+                    text += (
+                        f"- {check_icon(check.passed)} **{check.code}** {check.name}"
+                    )
+                    if include_evidence and check.evidence:
+                        text += f": {check.evidence}"
+                    text += "\n"
+            text += "\n"
+
+        return text[:-1]
+
+    def _format_iteration_html(self, iteration: LoopIteration) -> str:
         """Format a single iteration for HTML output.
 
         Args:
             iteration: The iteration to format.
 
         Returns:
-            List of HTML lines.
+            HTML block for the iteration.
         """
         status_class = iteration.verify_status.value
         status_label = self.STATUS_ICONS[iteration.verify_status]
 
-        lines = [
-            f"<div class='iteration {status_class}'>",
-            f"<h3>Iteration {iteration.iteration_number} - <span class='status {status_class}'>{status_label}</span></h3>",
-        ]
+        html = (
+            f"<div class='iteration {status_class}'>\n"
+            f"<h3>Iteration {iteration.iteration_number} - <span class='status {status_class}'>{status_label}</span></h3>\n"
+        )
 
         if self.include_timestamps:
-            lines.append(f"<p class='timestamp'>{iteration.timestamp.isoformat()}</p>")
-
-        lines.append("<p><strong>Definition:</strong></p>")
-        lines.append(f"<blockquote>{iteration.final_definition}</blockquote>")
-
-        # Checklist table
-        lines.append("<table class='checklist'>")
-        lines.append(
-            "<tr><th>Check</th><th>Name</th><th>Status</th><th>Evidence</th></tr>"
+            html += f"<p class='timestamp'>{iteration.timestamp.isoformat()}</p>\n"
+
+        html += (
+            "<p><strong>Definition:</strong></p>\n"
+            f"<blockquote>{iteration.final_definition}</blockquote>\n"
+            # Checklist table
+            "<table class='checklist'>\n"
+            "<tr><th>Check</th><th>Name</th><th>Status</th><th>Evidence</th></tr>\n"
         )
 
-        for check in iteration.critique_results:
-            if self.show_all_checks or not check.passed:
-                status_icon = "&#x2713;" if check.passed else "&#x2717;"
-                status_td = "passed" if check.passed else "failed"
-                lines.append(
-                    f"<tr class='{status_td}'>"
-                    f"<td>{check.code}</td>"
-                    f"<td>{check.name}</td>"
-                    f"<td class='{status_td}'>{status_icon}</td>"
-                    f"<td>{check.evidence}</td>"
-                    f"</tr>"
-                )
-
-        lines.append("</table>")
-        lines.append("</div>")
+        html += _render_check_rows(iteration.critique_results, self.show_all_checks)
 
-        return lines
+        return html + "</table>\n</div>"
 
-    def _format_evolution_markdown(self, result: LoopResult) -> list[str]:
+    def _format_evolution_markdown(self, result: LoopResult) -> str:
         """Format definition evolution across iterations.
 
         Args:
             result: The loop result.
 
         Returns:
-            List of Markdown lines.
+            Markdown block describing each transition.
         """
-        lines = []
+        text = ""
+        differ = self._diff
+
+        # Adjacent pairs share definitions, so tokenize each distinct one once
+        token_ids: dict[str, frozenset[int]] = {}
+
+        def tokens(definition: str) -> frozenset[int]:
+            ids = token_ids.get(definition)
+            if ids is None:
+                ids = token_ids[definition] = differ.tokenize(definition)
+            return ids
 
         for i in range(len(result.iterations) - 1):
             prev = result.iterations[i]
             curr = result.iterations[i + 1]
-
-            lines.append(
-                f"### Iteration {prev.iteration_number} -> {curr.iteration_number}"
-            )
-            lines.append("")
-
-            diff_text = self._diff.format_diff_text(
-                prev.final_definition, curr.generated_definition
+            old = prev.final_definition
+            new = curr.generated_definition
+
+            if old == new:
+                diff_text = "(no changes)"
+            else:
+                diff_text = differ.format_diff_from_tokens(
+                    old, new, tokens(old), tokens(new)
+                )
+            text += (
+                f"### Iteration {prev.iteration_number} -> {curr.iteration_number}\n\n"
+                f"```\n{diff_text}\n```\n\n"
             )
-            lines.append("```")
-            lines.append(diff_text)
-            lines.append("```")
-            lines.append("")
 
-        return lines
+        return text[:-1]
 
     def _group_checks_by_severity(
         self, checks: list[CheckResult]
-    ) -> dict[Severity, list[CheckResult]]:
+    ) -> Iterator[tuple[Severity, Iterator[CheckResult]]]:
         """Group check results by severity.
 
         Args:
             checks: List of check results.
 
         Returns:
-            Dictionary mapping severity to checks.
+            Iterator of (severity, checks) pairs in display order, skipping
+            severities with no checks. Checks keep their original order.
         """
-        result: dict[Severity, list[CheckResult]] = {
-            Severity.RED_FLAG: [],
-            Severity.REQUIRED: [],
-            Severity.ICE_REQUIRED: [],
-            Severity.QUALITY: [],
-        }
-
-        for check in checks:
-            result[check.severity].append(check)
-
-        return result
+        return groupby(sorted(checks, key=_severity_rank), key=_CHECK_SEVERITY)
 
     def _result_to_dict(self, result: LoopResult) -> dict[str, Any]:
         """Convert a LoopResult to a dictionary for JSON serialization.
@@ -403,13 +608,15 @@ class ReportGenerator:
                     "timestamp": it.timestamp.isoformat(),
                     "critique_results": [
                         {
-                            "code": check.code,
-                            "name": check.name,
-                            "passed": check.passed,
-                            "evidence": check.evidence,
-                            "severity": check.severity.value,
+                            "code": code,
+                            "name": name,
+                            "passed": passed,
+                            "evidence": evidence,
+                            "severity": severity.value,
                         }
-                        for check in it.critique_results
+                        for code, name, passed, evidence, severity in map(
+                            _CHECK_FIELDS, it.critique_results
+                        )
                     ],
                 }
                 for it in result.iterations
@@ -422,58 +629,7 @@ class ReportGenerator:
         Returns:
             CSS style string.
         """
-        return """
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    max-width: 900px;
-    margin: 0 auto;
-    padding: 20px;
-    line-height: 1.6;
-}
-h1, h2, h3 { color: #333; }
-code {
-    background: #f4f4f4;
-    padding: 2px 6px;
-    border-radius: 3px;
-}
-blockquote {
-    border-left: 4px solid #0066cc;
-    margin: 10px 0;
-    padding: 10px 20px;
-    background: #f9f9f9;
-}
-.status {
-    padding: 4px 12px;
-    border-radius: 4px;
-    font-weight: bold;
-}
-.status.pass { background: #d4edda; color: #155724; }
-.status.fail { background: #f8d7da; color: #721c24; }
-.status.iterate { background: #fff3cd; color: #856404; }
-.iteration {
-    border: 1px solid #ddd;
-    border-radius: 8px;
-    padding: 15px;
-    margin: 15px 0;
-}
-.iteration.pass { border-left: 4px solid #28a745; }
-.iteration.fail { border-left: 4px solid #dc3545; }
-.iteration.iterate { border-left: 4px solid #ffc107; }
-.checklist {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 10px 0;
-}
-.checklist th, .checklist td {
-    border: 1px solid #ddd;
-    padding: 8px;
-    text-align: left;
-}
-.checklist th { background: #f4f4f4; }
-.checklist .passed { color: #28a745; }
-.checklist .failed { color: #dc3545; }
-.timestamp { color: #666; font-size: 0.9em; }
-"""
+        return _HTML_STYLES
 
 
 class BatchReportGenerator:
@@ -496,60 +652,45 @@ class BatchReportGenerator:
         Returns:
             Markdown summary report.
         """
-        lines = ["# Batch Processing Summary", ""]
-
         # Statistics
         total = len(results)
-        passed = sum(1 for r in results if r.converged)
+        passed, total_iterations, total_duration = self._summarize(results)
         failed = total - passed
 
-        lines.append("## Statistics")
-        lines.append("")
-        lines.append(f"- **Total Classes**: {total}")
-        lines.append(f"- **Passed**: {passed} ({100 * passed / total:.1f}%)")
-        lines.append(f"- **Failed**: {failed} ({100 * failed / total:.1f}%)")
-
-        total_iterations = sum(r.total_iterations for r in results)
-        total_duration = sum(r.duration_seconds for r in results)
-
-        lines.append(f"- **Total Iterations**: {total_iterations}")
-        lines.append(f"- **Average Iterations**: {total_iterations / total:.1f}")
-        lines.append(f"- **Total Duration**: {total_duration:.1f}s")
-        lines.append("")
-
-        # Results
-        lines.append("## Results")
-        lines.append("")
+        report = (
+            "# Batch Processing Summary\n\n"
+            "## Statistics\n\n"
+            f"- **Total Classes**: {total}\n"
+            f"- **Passed**: {passed} ({100 * passed / total:.1f}%)\n"
+            f"- **Failed**: {failed} ({100 * failed / total:.1f}%)\n"
+            f"- **Total Iterations**: {total_iterations}\n"
+            f"- **Average Iterations**: {total_iterations / total:.1f}\n"
+            f"- **Total Duration**: {total_duration:.1f}s\n\n"
+            "## Results\n\n"
+        )
 
         for result in results:
-            status = "PASS" if result.converged else "FAIL"
-            lines.append(
-                f"### [{status}] {result.class_info.label} (`{result.class_info.iri}`)"
-            )
-            lines.append("")
+            info = result.class_info
+            converged = result.converged
+            status = "PASS" if converged else "FAIL"
+            report += f"### [{status}] {info.label} (`{info.iri}`)\n\n"
 
-            if result.class_info.current_definition:
-                lines.append("**Original Definition:**  ")
-                lines.append(f'"{result.class_info.current_definition}"')
-                lines.append("")
+            if info.current_definition:
+                report += f'**Original Definition:**  \n"{info.current_definition}"\n\n'
 
-            lines.append("**Ralph:**  ")
-            lines.append(f"> {result.final_definition}")
-            lines.append("")
+            report += f"**Ralph:**  \n> {result.final_definition}\n\n"
 
             # Show failed checks for FAIL results
-            if not result.converged and result.iterations:
-                last = result.iterations[-1]
-                failed_checks = [c for c in last.critique_results if not c.passed]
-                if failed_checks:
-                    lines.append("**Failed Checks:**")
-                    for check in failed_checks:
-                        lines.append(
-                            f"- **{check.code}** {check.name}: {check.evidence}"
-                        )
-                    lines.append("")
+            if not converged and result.iterations:
+                failed_lines = [
+                    f"- **{check.code}** {check.name}: {check.evidence}\n"
+                    for check in result.iterations[-1].critique_results
+                    if not check.passed
+                ]
+                if failed_lines:
+                    report += f"**Failed Checks:**\n{''.join(failed_lines)}\n"
 
-        return "\n".join(lines)
+        return report[:-1]
 
     def generate_json(self, results: list[LoopResult]) -> str:
         """Generate a JSON report for multiple results.
@@ -560,14 +701,97 @@ class BatchReportGenerator:
         Returns:
             JSON report string.
         """
+        to_dict = self.report_generator._result_to_dict
         data = {
-            "summary": {
-                "total": len(results),
-                "passed": sum(1 for r in results if r.converged),
-                "failed": sum(1 for r in results if not r.converged),
-                "total_iterations": sum(r.total_iterations for r in results),
-                "total_duration_seconds": sum(r.duration_seconds for r in results),
-            },
-            "results": [self.report_generator._result_to_dict(r) for r in results],
+            "summary": self._summary_dict(results),
+            "results": [to_dict(result) for result in results],
+        }
+        return _dumps_indented(data)
+
+    def generate_msgpack(self, results: list[LoopResult]) -> bytes:
+        """Generate a MessagePack report for multiple results.
+
+        Same structure as generate_json(), in a compact binary encoding
+        for machine consumers. JSON remains the default report format.
+
+        Args:
+            results: List of loop results.
+
+        Returns:
+            MessagePack-encoded report.
+
+        Raises:
+            ImportError: If msgpack package is not installed.
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "msgpack package is required for MessagePack reports. "
+                "Install it with: pip install ontoralph[msgpack]"
+            )
+
+        to_dict = self.report_generator._result_to_dict
+        data = {
+            "summary": self._summary_dict(results),
+            "results": [to_dict(result) for result in results],
         }
-        return json.dumps(data, indent=2, default=str)
+        packed: bytes = msgpack.packb(data, use_bin_type=True)
+        return packed
+
+    def write_json(self, results: list[LoopResult], fp: TextIO) -> None:
+        """Stream a JSON report for multiple results to a file object.
+
+        Each result is converted and encoded on its own, so only one
+        result's dictionary is held in memory at a time. The output is
+        identical to generate_json().
+
+        Args:
+            results: List of loop results.
+            fp: Text file object to write to.
+        """
+        fp.write('{\n  "summary": ')
+        # Nested values are indented one level deeper than the encoder emits
+        fp.write(_dumps_indented(self._summary_dict(results)).replace("\n", "\n  "))
+        fp.write(',\n  "results": [')
+        to_dict = self.report_generator._result_to_dict
+        separator = "\n    "
+        for result in results:
+            fp.write(separator)
+            fp.write(_dumps_indented(to_dict(result)).replace("\n", "\n    "))
+            separator = ",\n    "
+        fp.write("\n  ]\n}" if results else "]\n}")
+
+    def _summary_dict(self, results: list[LoopResult]) -> dict[str, Any]:
+        """Build the summary section shared by the batch report formats.
+
+        Args:
+            results: List of loop results.
+
+        Returns:
+            Summary statistics dictionary.
+        """
+        passed, total_iterations, total_duration = self._summarize(results)
+        return {
+            "total": len(results),
+            "passed": passed,
+            "failed": len(results) - passed,
+            "total_iterations": total_iterations,
+            "total_duration_seconds": total_duration,
+        }
+
+    @staticmethod
+    def _summarize(results: list[LoopResult]) -> tuple[int, int, float]:
+        """Aggregate batch statistics in a single pass.
+
+        Args:
+            results: List of loop results.
+
+        Returns:
+            Tuple of (passed count, total iterations, total duration seconds).
+        """
+        passed = total_iterations = 0
+        total_duration: float = 0
+        for converged, iterations, duration in map(_SUMMARY_FIELDS, results):
+            passed += converged
+            total_iterations += iterations
+            total_duration += duration
+        return passed, total_iterations, total_duration
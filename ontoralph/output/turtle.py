@@ -1,16 +1,48 @@
 """Turtle output generation.
 
 This module generates valid OWL/Turtle syntax for refined definitions.
-Uses rdflib for proper RDF handling and validation.
+The fixed class schema is emitted directly; rdflib is used for IRI
+handling and validation.
 """
 
+import re
 from typing import Any
 
-from rdflib import Graph, Literal, Namespace, URIRef
-from rdflib.namespace import OWL, RDF, RDFS, SKOS, XSD
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import OWL, RDF, RDFS, SKOS, XSD, DefinedNamespace
 
 from ontoralph.core.models import ClassInfo, LoopResult
 
+# Local names that can be written as prefixed names without escaping
+_PN_LOCAL = re.compile(r"[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_-])?")
+
+# Characters that cannot appear inside an IRIREF
+_INVALID_IRI_CHARS = frozenset('<>" {}|\\^`')
+
+# Escapes for single-quoted Turtle string literals
+_TTL_ESCAPE = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+# Grammar of TurtleGenerator's own output, used to skip a full parse
+_QUICK_PREFIX = r"(?:[A-Za-z](?:[A-Za-z0-9_.-]*[A-Za-z0-9_-])?)?"
+_QUICK_IRI = r'<[^<>"{}|^`\\\x00-\x20]*>'
+_QUICK_TERM = rf"(?:{_QUICK_IRI}|{_QUICK_PREFIX}:{_PN_LOCAL.pattern})"
+_QUICK_LITERAL = r'"(?:[^"\\\n\r]|\\[tbnrf"\'\\])*"@en'
+_QUICK_TURTLE = re.compile(
+    r"(?:#[^\n]*\n)*\n?"
+    rf"(?:@prefix {_QUICK_PREFIX}: {_QUICK_IRI} \.\n)*\n"
+    rf"(?:{_QUICK_TERM} a owl:Class ;\n"
+    rf"    rdfs:label {_QUICK_LITERAL} ;\n"
+    rf"(?:    rdfs:subClassOf {_QUICK_TERM} ;\n)?"
+    rf"    skos:definition {_QUICK_LITERAL} \.\n\n)*"
+)
+_QUICK_DECLARED = re.compile(r"^@prefix ([^:]*):", re.MULTILINE)
+_QUICK_USED = re.compile(
+    rf"^(?:    rdfs:subClassOf )?({_QUICK_PREFIX}):\S*(?: a owl:Class)? ;$",
+    re.MULTILINE,
+)
+
 
 class TurtleValidationError(Exception):
     """Raised when Turtle validation fails."""
@@ -21,8 +53,8 @@ class TurtleValidationError(Exception):
 class TurtleGenerator:
     """Generates Turtle syntax for ontology class definitions.
 
-    Uses rdflib for proper IRI handling, literal escaping,
-    and Turtle validation.
+    Class blocks are written straight to Turtle text; rdflib is used
+    for IRI handling and, on request, to validate the output.
     """
 
     # Standard namespace definitions
@@ -64,75 +96,118 @@ class TurtleGenerator:
             self._namespaces[prefix] = Namespace(uri)
         for prefix, uri in self.additional_prefixes.items():
             self._namespaces[prefix] = Namespace(uri)
-
-    def generate(self, class_info: ClassInfo, definition: str) -> str:
+        self._base_ns = Namespace(self.base_namespace)
+        self._namespaces[""] = self._base_ns
+
+        # Standard, custom and base (empty prefix) namespace bindings
+        self._bindings: tuple[tuple[str, Namespace | type[DefinedNamespace]], ...] = (
+            ("owl", OWL),
+            ("rdf", RDF),
+            ("rdfs", RDFS),
+            ("skos", SKOS),
+            *self._namespaces.items(),
+        )
+
+        # Serialized @prefix blocks, shared by every generate_prefixes() call
+        custom_lines = [
+            f"@prefix {prefix}: <{uri}> ."
+            for prefix, uri in (
+                *self.CUSTOM_NAMESPACE_URIS.items(),
+                *self.additional_prefixes.items(),
+            )
+        ]
+        custom_lines.append(f"@prefix : <{self.base_namespace}> .")
+        self._prefix_block_custom = "\n".join(custom_lines)
+        self._prefix_block_full = "\n".join(
+            [f"@prefix {prefix}: <{ns}> ." for prefix, ns in self.NAMESPACES.items()]
+            + custom_lines
+        )
+
+        # Prefix lines by prefix, and namespaces tried longest-first when
+        # abbreviating IRIs in emitted Turtle
+        self._prefix_lines: dict[str, str] = {
+            prefix: f"@prefix {prefix}: <{ns}> ." for prefix, ns in self._bindings
+        }
+        self._qname_namespaces: tuple[tuple[str, str], ...] = tuple(
+            sorted(
+                ((str(ns), prefix) for prefix, ns in self._bindings),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+
+        # Resolved IRIs, keyed by the prefixed form
+        self._iri_cache: dict[str, URIRef] = {}
+        # Turtle terms and the prefix they use, keyed by the prefixed form
+        self._term_cache: dict[str, tuple[str, str | None]] = {}
+
+    def generate(
+        self, class_info: ClassInfo, definition: str, validate: bool = False
+    ) -> str:
         """Generate a Turtle block for a class definition.
 
         Args:
             class_info: Information about the class.
             definition: The refined definition.
+            validate: Whether to parse the output with rdflib before returning.
 
         Returns:
             Valid Turtle syntax as a string.
-        """
-        graph = self._create_graph()
-
-        # Resolve the class IRI
-        class_uri = self._resolve_iri(class_info.iri)
 
-        # Add class declaration
-        graph.add((class_uri, RDF.type, OWL.Class))
-
-        # Add label
-        graph.add((class_uri, RDFS.label, Literal(class_info.label, lang="en")))
-
-        # Add definition using skos:definition
-        graph.add((class_uri, SKOS.definition, Literal(definition, lang="en")))
-
-        # Add parent class (subClassOf)
-        if class_info.parent_class:
-            parent_uri = self._resolve_iri(class_info.parent_class)
-            graph.add((class_uri, RDFS.subClassOf, parent_uri))
-
-        # Serialize to Turtle
-        turtle_str = graph.serialize(format="turtle")
+        Raises:
+            TurtleValidationError: If an IRI contains characters Turtle cannot
+                represent, or if validate is set and the output is invalid.
+        """
+        turtle_str = self._fast_serialize(class_info, definition)
 
         # Add header comment if enabled
         if self.include_comments:
             header = self._generate_header_comment(class_info)
             turtle_str = header + turtle_str
 
+        if validate:
+            self.validate_or_raise(turtle_str)
+
         return turtle_str
 
-    def generate_batch(self, results: list[tuple[ClassInfo, str]]) -> str:
+    def generate_batch(
+        self, results: list[tuple[ClassInfo, str]], validate: bool = False
+    ) -> str:
         """Generate a Turtle file with multiple class definitions.
 
         Args:
             results: List of (ClassInfo, definition) tuples.
+            validate: Whether to parse the output with rdflib before returning.
 
         Returns:
             Combined Turtle syntax for all classes.
-        """
-        graph = self._create_graph()
 
+        Raises:
+            TurtleValidationError: If an IRI contains characters Turtle cannot
+                represent, or if validate is set and the output is invalid.
+        """
+        used_prefixes = {"owl", "rdfs", "skos"}
+        # Classes often share a parent, so each parent line is built once
+        parent_lines: dict[str, str] = {}
+        blocks = []
         for class_info, definition in results:
-            class_uri = self._resolve_iri(class_info.iri)
-
-            # Add class declaration
-            graph.add((class_uri, RDF.type, OWL.Class))
-            graph.add((class_uri, RDFS.label, Literal(class_info.label, lang="en")))
-            graph.add((class_uri, SKOS.definition, Literal(definition, lang="en")))
-
-            if class_info.parent_class:
-                parent_uri = self._resolve_iri(class_info.parent_class)
-                graph.add((class_uri, RDFS.subClassOf, parent_uri))
+            parent_line = parent_lines.get(class_info.parent_class)
+            if parent_line is None:
+                parent_line = self._parent_line(class_info.parent_class, used_prefixes)
+                parent_lines[class_info.parent_class] = parent_line
+            blocks.append(
+                self._class_block(class_info, definition, parent_line, used_prefixes)
+            )
 
-        turtle_str = graph.serialize(format="turtle")
+        turtle_str = self._prefix_header(used_prefixes) + "".join(blocks)
 
         if self.include_comments:
             header = f"# OntoRalph Generated Definitions\n# Classes: {len(results)}\n\n"
             turtle_str = header + turtle_str
 
+        if validate:
+            self.validate_or_raise(turtle_str)
+
         return turtle_str
 
     def generate_from_result(self, result: LoopResult) -> str:
@@ -143,18 +218,31 @@ class TurtleGenerator:
 
         Returns:
             Valid Turtle syntax for the refined definition.
+
+        Raises:
+            TurtleValidationError: If the class or parent IRI cannot be
+                written as Turtle.
         """
         return self.generate(result.class_info, result.final_definition)
 
-    def validate(self, turtle_str: str) -> tuple[bool, str | None]:
-        """Validate Turtle syntax by parsing with rdflib.
+    def validate(
+        self, turtle_str: str, *, deep: bool = False
+    ) -> tuple[bool, str | None]:
+        """Validate Turtle syntax.
+
+        Output shaped like this generator's own is accepted by a single
+        regex match; anything else is parsed with rdflib.
 
         Args:
             turtle_str: Turtle string to validate.
+            deep: Always parse with rdflib, skipping the structural check.
 
         Returns:
             Tuple of (is_valid, error_message).
         """
+        if not deep and self._quick_validate(turtle_str):
+            return True, None
+
         try:
             graph = Graph()
             graph.parse(data=turtle_str, format="turtle")
@@ -162,6 +250,26 @@ class TurtleGenerator:
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def _quick_validate(turtle_str: str) -> bool:
+        """Check whether Turtle matches the fixed shape emitted by this class.
+
+        A False result is inconclusive; the caller should fall back to a
+        full parse.
+
+        Args:
+            turtle_str: Turtle string to check.
+
+        Returns:
+            True if the text is known to be well-formed Turtle.
+        """
+        if _QUICK_TURTLE.fullmatch(turtle_str) is None:
+            return False
+        # Every prefixed name, including the fixed predicates, must be declared
+        declared = set(_QUICK_DECLARED.findall(turtle_str))
+        used = set(_QUICK_USED.findall(turtle_str))
+        return declared.issuperset(("owl", "rdfs", "skos", *used))
+
     def validate_or_raise(self, turtle_str: str) -> Graph:
         """Validate Turtle and return the parsed graph, or raise on error.
 
@@ -181,30 +289,105 @@ class TurtleGenerator:
         except Exception as e:
             raise TurtleValidationError(f"Invalid Turtle syntax: {e}") from e
 
-    def _create_graph(self) -> Graph:
-        """Create an RDF graph with namespace bindings.
+    def _fast_serialize(self, class_info: ClassInfo, definition: str) -> str:
+        """Serialize a single class to Turtle without building a graph.
+
+        Args:
+            class_info: Information about the class.
+            definition: The refined definition.
+
+        Returns:
+            Turtle syntax with the prefix declarations it uses.
+        """
+        used_prefixes = {"owl", "rdfs", "skos"}
+        parent_line = self._parent_line(class_info.parent_class, used_prefixes)
+        block = self._class_block(class_info, definition, parent_line, used_prefixes)
+        return self._prefix_header(used_prefixes) + block
+
+    def _parent_line(self, parent_class: str, used_prefixes: set[str]) -> str:
+        """Write the rdfs:subClassOf statement for a parent class.
+
+        Args:
+            parent_class: Parent class IRI, possibly empty.
+            used_prefixes: Set updated with the prefix the statement refers to.
+
+        Returns:
+            Turtle predicate-object line, or an empty string without a parent.
+        """
+        if not parent_class:
+            return ""
+        parent_term, prefix = self._turtle_term(parent_class)
+        if prefix is not None:
+            used_prefixes.add(prefix)
+        return f"    rdfs:subClassOf {parent_term} ;\n"
+
+    def _class_block(
+        self,
+        class_info: ClassInfo,
+        definition: str,
+        parent_line: str,
+        used_prefixes: set[str],
+    ) -> str:
+        """Write the Turtle statements for one class.
+
+        Args:
+            class_info: Information about the class.
+            definition: The refined definition.
+            parent_line: Pre-rendered rdfs:subClassOf line from _parent_line().
+            used_prefixes: Set updated with the prefixes the block refers to.
+
+        Returns:
+            Turtle block terminated by a blank line.
+        """
+        class_term, prefix = self._turtle_term(class_info.iri)
+        if prefix is not None:
+            used_prefixes.add(prefix)
+
+        return (
+            f"{class_term} a owl:Class ;\n"
+            f"    rdfs:label {_ttl_literal(class_info.label)}@en ;\n"
+            f"{parent_line}"
+            f"    skos:definition {_ttl_literal(definition)}@en .\n\n"
+        )
+
+    def _prefix_header(self, used_prefixes: set[str]) -> str:
+        """Build the @prefix declarations for the prefixes in use.
+
+        Args:
+            used_prefixes: Prefixes referenced by the emitted blocks.
 
         Returns:
-            Configured RDF graph.
+            Sorted prefix declarations followed by a blank line.
         """
-        graph = Graph()
+        lines = self._prefix_lines
+        return "".join(lines[prefix] + "\n" for prefix in sorted(used_prefixes)) + "\n"
 
-        # Bind standard namespaces
-        graph.bind("owl", OWL)
-        graph.bind("rdf", RDF)
-        graph.bind("rdfs", RDFS)
-        graph.bind("skos", SKOS)
+    def _turtle_term(self, iri: str) -> tuple[str, str | None]:
+        """Render an IRI as a Turtle term, abbreviating it where possible.
 
-        # Bind custom namespaces
-        for prefix, ns in self._namespaces.items():
-            graph.bind(prefix, ns)
+        Args:
+            iri: IRI string, possibly with prefix.
 
-        # Bind base namespace with empty prefix
-        base_ns = Namespace(self.base_namespace)
-        graph.bind("", base_ns)
-        self._namespaces[""] = base_ns
+        Returns:
+            Tuple of (Turtle term, prefix used or None).
 
-        return graph
+        Raises:
+            TurtleValidationError: If the IRI cannot be written as Turtle.
+        """
+        cached = self._term_cache.get(iri)
+        if cached is not None:
+            return cached
+
+        uri = str(self._resolve_iri(iri))
+        if not _INVALID_IRI_CHARS.isdisjoint(uri):
+            raise TurtleValidationError(f'"{uri}" is not a valid IRI')
+        term: tuple[str, str | None] = (f"<{uri}>", None)
+        for ns, prefix in self._qname_namespaces:
+            if uri.startswith(ns) and _PN_LOCAL.fullmatch(uri[len(ns) :]):
+                term = (f"{prefix}:{uri[len(ns) :]}", prefix)
+                break
+        self._term_cache[iri] = term
+        return term
 
     def _resolve_iri(self, iri: str) -> URIRef:
         """Resolve a prefixed IRI to a full URI.
@@ -212,6 +395,20 @@ class TurtleGenerator:
         Args:
             iri: IRI string, possibly with prefix (e.g., ':VerbPhrase', 'cco:ICE').
 
+        Returns:
+            Full URI reference.
+        """
+        uri = self._iri_cache.get(iri)
+        if uri is None:
+            uri = self._iri_cache[iri] = self._expand_iri(iri)
+        return uri
+
+    def _expand_iri(self, iri: str) -> URIRef:
+        """Expand a prefixed IRI without consulting the cache.
+
+        Args:
+            iri: IRI string, possibly with prefix.
+
         Returns:
             Full URI reference.
         """
@@ -259,29 +456,63 @@ class TurtleGenerator:
         Returns:
             Turtle prefix declarations.
         """
-        lines = []
+        if custom_only:
+            return self._prefix_block_custom
+        return self._prefix_block_full
 
-        if not custom_only:
-            lines.append(f"@prefix owl: <{OWL}> .")
-            lines.append(f"@prefix rdf: <{RDF}> .")
-            lines.append(f"@prefix rdfs: <{RDFS}> .")
-            lines.append(f"@prefix skos: <{SKOS}> .")
-            lines.append(f"@prefix xsd: <{XSD}> .")
 
-        for prefix, uri in self.CUSTOM_NAMESPACE_URIS.items():
-            lines.append(f"@prefix {prefix}: <{uri}> .")
+def _ttl_literal(value: str) -> str:
+    """Quote a string as a Turtle literal.
 
-        for prefix, uri in self.additional_prefixes.items():
-            lines.append(f"@prefix {prefix}: <{uri}> .")
-
-        lines.append(f"@prefix : <{self.base_namespace}> .")
+    Args:
+        value: Literal text.
 
-        return "\n".join(lines)
+    Returns:
+        Double-quoted, escaped Turtle string.
+    """
+    return '"' + value.translate(_TTL_ESCAPE) + '"'
 
 
 class TurtleDiff:
     """Computes differences between Turtle definitions."""
 
+    def __init__(self) -> None:
+        """Initialize the differ with an empty token table."""
+        # Lower-cased words interned to small integer ids, and the reverse map
+        self._token_cache: dict[str, int] = {}
+        self._tokens: list[str] = []
+
+    def tokenize(self, definition: str) -> frozenset[int]:
+        """Map the distinct lower-cased words of a definition to token ids.
+
+        Args:
+            definition: Definition text.
+
+        Returns:
+            Set of token ids.
+        """
+        cache = self._token_cache
+        ids = []
+        for word in set(definition.lower().split()):
+            token_id = cache.get(word)
+            if token_id is None:
+                token_id = cache[word] = len(self._tokens)
+                self._tokens.append(word)
+            ids.append(token_id)
+        return frozenset(ids)
+
+    def _words(self, token_ids: frozenset[int]) -> list[str]:
+        """Convert token ids back to a sorted word list.
+
+        Args:
+            token_ids: Token ids from tokenize().
+
+        Returns:
+            Sorted words.
+        """
+        tokens = self._tokens
+        return sorted([tokens[i] for i in token_ids])
+
     def diff(self, old_definition: str, new_definition: str) -> dict[str, Any]:
         """Compare two definitions and identify changes.
 
@@ -292,21 +523,18 @@ class TurtleDiff:
         Returns:
             Dictionary with diff information.
         """
-        old_words = set(old_definition.lower().split())
-        new_words = set(new_definition.lower().split())
-
-        added = new_words - old_words
-        removed = old_words - new_words
-        unchanged = old_words & new_words
+        old_ids = self.tokenize(old_definition)
+        new_ids = self.tokenize(new_definition)
+        unchanged = old_ids & new_ids
 
         return {
             "old_definition": old_definition,
             "new_definition": new_definition,
-            "added_words": sorted(added),
-            "removed_words": sorted(removed),
-            "unchanged_words": sorted(unchanged),
+            "added_words": self._words(new_ids - old_ids),
+            "removed_words": self._words(old_ids - new_ids),
+            "unchanged_words": self._words(unchanged),
             "changed": old_definition != new_definition,
-            "similarity": len(unchanged) / max(len(old_words | new_words), 1),
+            "similarity": len(unchanged) / max(len(old_ids | new_ids), 1),
         }
 
     def format_diff_text(
@@ -325,13 +553,44 @@ class TurtleDiff:
         if old_definition == new_definition:
             return "(no changes)"
 
-        diff = self.diff(old_definition, new_definition)
+        return self.format_diff_from_tokens(
+            old_definition,
+            new_definition,
+            self.tokenize(old_definition),
+            self.tokenize(new_definition),
+        )
+
+    def format_diff_from_tokens(
+        self,
+        old_definition: str,
+        new_definition: str,
+        old_ids: frozenset[int],
+        new_ids: frozenset[int],
+    ) -> str:
+        """Format a text diff from already tokenized definitions.
+
+        Lets callers that diff a chain of definitions tokenize each one once.
+
+        Args:
+            old_definition: The original definition.
+            new_definition: The updated definition.
+            old_ids: tokenize() result for the original definition.
+            new_ids: tokenize() result for the updated definition.
+
+        Returns:
+            Formatted diff string.
+        """
+        if old_definition == new_definition:
+            return "(no changes)"
+
+        removed_words = self._words(old_ids - new_ids)
+        added_words = self._words(new_ids - old_ids)
 
         lines = []
-        if diff["removed_words"]:
-            lines.append(f"- Removed: {', '.join(diff['removed_words'])}")
-        if diff["added_words"]:
-            lines.append(f"+ Added: {', '.join(diff['added_words'])}")
+        if removed_words:
+            lines.append(f"- Removed: {', '.join(removed_words)}")
+        if added_words:
+            lines.append(f"+ Added: {', '.join(added_words)}")
 
         lines.append("")
         lines.append(f"Old: {old_definition}")
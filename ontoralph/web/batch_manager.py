@@ -5,19 +5,71 @@ on multiple classes.
 """
 
 import asyncio
+import heapq
+import json
 import logging
-import secrets
+import os
+import pickle
+import tempfile
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from pathlib import Path
 from typing import Any
 
+from ontoralph.batch.processor import BatchConfig
 from ontoralph.core.loop import LoopConfig, RalphLoop
 from ontoralph.core.models import ClassInfo, LoopResult
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# Classes processed in parallel per job unless the request says otherwise
+DEFAULT_CONCURRENCY = BatchConfig.max_concurrency
+
+# Most class tasks scheduled at once; bounds fan-out on very large jobs
+DISPATCH_WINDOW_SIZE = 10
+
+# Pause between event batches so bursts reach the callback together
+EVENT_FLUSH_INTERVAL = 0.005
+
+# Event callback deliveries in flight across all jobs
+MAX_EVENT_DELIVERIES = 64
+
+# Jobs with at most this many classes go to the quick queue
+QUICK_JOB_MAX_CLASSES = 20
+
+# Classes in flight across all jobs of each queue
+QUICK_QUEUE_SLOTS = 4
+LONG_QUEUE_SLOTS = 8
+
+# Finished jobs whose definitions exceed this many characters are spilled
+# to disk, keeping only statuses in memory
+SPILL_THRESHOLD_CHARS = 64 * 1024
+
+# Finished jobs kept at most; the oldest is evicted beyond this
+MAX_FINISHED_JOBS = 256
+
+# Maps IRI characters that are unsafe in file names to replacements
+_IRI_SANITIZE = str.maketrans({":": "_", "/": "_", "\\": "_", "<": None, ">": None})
+
+
+class JobQueue(str, Enum):
+    """Queue a batch job is scheduled on, chosen by its size."""
+
+    QUICK = "quick"
+    LONG = "long"
+
 
 class JobStatus(str, Enum):
     """Status of a batch job."""
@@ -29,6 +81,22 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
+class ClassStatus(IntEnum):
+    """Compact per-class status codes, one byte each in BatchJob.status_codes."""
+
+    PENDING = 0
+    RUNNING = 1
+    PASS = 2
+    FAIL = 3
+    ERROR = 4
+    CANCELLED = 5
+    ITERATE = 6
+
+
+# ClassResult.status string -> status code
+_CLASS_STATUS = {s.name.lower(): s for s in ClassStatus}
+
+
 @dataclass
 class ClassResult:
     """Result for a single class in a batch job."""
@@ -42,6 +110,36 @@ class ClassResult:
     total_iterations: int | None = None
     duration_seconds: float | None = None
     failed_checks: list[dict[str, str]] | None = None  # [{code, name, evidence}]
+    safe_name: str | None = None
+    md_bytes: bytes | None = None
+    json_bytes: bytes | None = None
+
+    def render_files(self) -> None:
+        """Build this result's download files once it has passed.
+
+        Sets ``safe_name`` and the Markdown and JSON file contents, so
+        downloads write prebuilt bytes instead of formatting every class
+        on every request. Other results are left without files.
+        """
+        if self.status != "pass" or not self.final_definition:
+            return
+
+        self.safe_name = self.iri.translate(_IRI_SANITIZE)
+        self.md_bytes = (
+            f"# {self.label}\n\n"
+            f"**IRI:** `{self.iri}`\n\n"
+            "## Definition\n\n"
+            f"{self.final_definition}\n"
+        ).encode()
+        self.json_bytes = _dumps_indented(
+            {
+                "iri": self.iri,
+                "label": self.label,
+                "definition": self.final_definition,
+                "status": self.status,
+                "iterations": self.total_iterations,
+            }
+        )
 
 
 @dataclass
@@ -59,8 +157,68 @@ class BatchJob:
     completed_at: datetime | None = None
     cancelled_at: datetime | None = None
     results: list[ClassResult] = field(default_factory=list)
-    current_index: int = 0
+    concurrency: int = DEFAULT_CONCURRENCY
+    queue: JobQueue = JobQueue.QUICK
+    in_progress: set[int] = field(default_factory=set)
+    cancel_event: asyncio.Event = field(default_factory=asyncio.Event)
+    completed_order: list[int] = field(default_factory=list)
     task: asyncio.Task[None] | None = None
+    spill_path: Path | None = None
+    started_monotonic: float | None = None
+    ended_monotonic: float | None = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    status_codes: bytearray = field(init=False, repr=False)
+    _status_counts: list[int] = field(init=False, repr=False)
+    version: int = field(default=0, init=False, repr=False)
+    status_json_cache: tuple[tuple[Any, ...], bytes] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        # Status column mirroring results, plus a running count per status
+        self.status_codes = bytearray(_CLASS_STATUS[r.status] for r in self.results)
+        self._status_counts = [self.status_codes.count(s) for s in ClassStatus]
+
+    def notify_changed(self) -> None:
+        """Wake everyone waiting on the current ``changed`` event.
+
+        A fresh event replaces the old one, so watchers grab ``changed``
+        before reading job state and then wait on it without ever
+        clearing it, which would race with other watchers. Bumps
+        ``version`` so cached views of the job can tell they are stale.
+        """
+        self.version += 1
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def _set_code(self, index: int, status: str) -> None:
+        """Record a status change for a class in the column and counters."""
+        code = _CLASS_STATUS[status]
+        counts = self._status_counts
+        counts[self.status_codes[index]] -= 1
+        counts[code] += 1
+        self.status_codes[index] = code
+        self.notify_changed()
+
+    def set_result(self, index: int, result: ClassResult) -> None:
+        """Store the result for a class and update its status code.
+
+        Args:
+            index: Index of the class in the job
+            result: The new result
+        """
+        self.results[index] = result
+        self._set_code(index, result.status)
+
+    def set_status(self, index: int, status: str) -> None:
+        """Update the status of a class result in place.
+
+        Args:
+            index: Index of the class in the job
+            status: New status string
+        """
+        self.results[index].status = status
+        self._set_code(index, status)
 
     @property
     def total_classes(self) -> int:
@@ -70,60 +228,215 @@ class BatchJob:
     @property
     def completed_count(self) -> int:
         """Number of classes completed (passed or failed)."""
-        return sum(1 for r in self.results if r.status in ("pass", "fail", "error"))
+        return self.passed_count + self.failed_count
 
     @property
     def passed_count(self) -> int:
         """Number of classes that passed."""
-        return sum(1 for r in self.results if r.status == "pass")
+        return self._status_counts[ClassStatus.PASS]
 
     @property
     def failed_count(self) -> int:
         """Number of classes that failed or errored."""
-        return sum(1 for r in self.results if r.status in ("fail", "error"))
+        counts = self._status_counts
+        return counts[ClassStatus.FAIL] + counts[ClassStatus.ERROR]
 
     @property
     def current_class(self) -> str | None:
-        """IRI of the currently processing class."""
-        if self.status == JobStatus.RUNNING and self.current_index < len(self.classes):
-            return self.classes[self.current_index].iri
+        """IRI of the earliest class still being processed."""
+        if self.status == JobStatus.RUNNING and self.in_progress:
+            return self.classes[min(self.in_progress)].iri
         return None
 
+    @property
+    def in_progress_classes(self) -> list[str]:
+        """IRIs of all classes currently being processed, in batch order."""
+        return [self.classes[i].iri for i in sorted(self.in_progress)]
+
     @property
     def duration_seconds(self) -> float | None:
         """Total duration in seconds."""
-        if self.started_at is None:
+        if self.started_monotonic is None:
             return None
-        end = self.completed_at or self.cancelled_at or datetime.now()
-        return (end - self.started_at).total_seconds()
+        end = self.ended_monotonic
+        if end is None:
+            end = time.monotonic()
+        return end - self.started_monotonic
+
+    def mark_started(self) -> None:
+        """Move the job to RUNNING and record when it started."""
+        self.status = JobStatus.RUNNING
+        self.started_at = datetime.now()
+        self.started_monotonic = time.monotonic()
+
+    def mark_finished(self, status: JobStatus) -> None:
+        """Move the job to a terminal status and record when it ended.
+
+        Args:
+            status: COMPLETE, CANCELLED or FAILED
+        """
+        now = datetime.now()
+        self.status = status
+        if status == JobStatus.CANCELLED:
+            self.cancelled_at = now
+        else:
+            self.completed_at = now
+        self.ended_monotonic = time.monotonic()
+        self.notify_changed()
+
+
+class _EventSink:
+    """Queues a job's progress events and hands them to its callback.
+
+    Events are delivered in batches by a single dispatcher task, so classes
+    never wait on a slow subscriber. Deliveries from all jobs share a
+    bounded number of slots, so slow callbacks apply backpressure to the
+    dispatchers rather than piling up. A callback may define
+    ``has_subscribers()``; while it returns False, ``active`` is False and
+    callers skip building events at all.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[dict[str, Any]]], Awaitable[None]] | None,
+        delivery_slots: asyncio.Semaphore,
+    ) -> None:
+        """Start dispatching to the callback, if there is one.
+
+        Args:
+            callback: Optional callback awaited with lists of events
+            delivery_slots: Bounds callback deliveries shared across jobs
+        """
+        self._callback = callback
+        self._delivery_slots = delivery_slots
+        self._has_subscribers = getattr(callback, "has_subscribers", None)
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._dispatcher = (
+            asyncio.create_task(self._dispatch(callback))
+            if callback is not None
+            else None
+        )
+
+    @property
+    def active(self) -> bool:
+        """Whether events emitted now would reach anyone."""
+        if self._callback is None:
+            return False
+        return self._has_subscribers is None or bool(self._has_subscribers())
+
+    def emit(self, event: dict[str, Any]) -> None:
+        """Queue an event for the next batch."""
+        self._queue.put_nowait(event)
+
+    async def close(self, flush: bool = True) -> None:
+        """Stop the dispatcher.
+
+        Args:
+            flush: Deliver queued events first instead of dropping them
+        """
+        if self._dispatcher is None:
+            return
+        if flush:
+            self._queue.put_nowait(None)
+            await self._dispatcher
+        else:
+            self._dispatcher.cancel()
+
+    async def _dispatch(
+        self, callback: Callable[[list[dict[str, Any]]], Awaitable[None]]
+    ) -> None:
+        """Drain queued events and pass them to the callback in batches.
+
+        Everything queued since the last flush is delivered in one call,
+        followed by a short pause so bursts coalesce. A ``None`` entry
+        marks the end of the job.
+
+        Args:
+            callback: Callback awaited with each batch of events
+        """
+        queue = self._queue
+        done = False
+        while not done:
+            batch: list[dict[str, Any]] = []
+            event = await queue.get()
+            while True:
+                if event is None:
+                    done = True
+                    break
+                batch.append(event)
+                if queue.empty():
+                    break
+                event = queue.get_nowait()
+
+            if batch:
+                try:
+                    async with self._delivery_slots:
+                        await callback(batch)
+                except Exception:
+                    logger.exception("Batch event callback failed")
+
+            if not done:
+                await asyncio.sleep(EVENT_FLUSH_INTERVAL)
 
 
 class BatchJobManager:
     """Manages batch processing jobs.
 
-    Jobs are stored in memory and cleaned up after 1 hour.
+    Jobs are stored in memory and cleaned up after 1 hour, keeping at most
+    256 finished jobs. Small jobs run
+    on a separate quick queue so they are not starved by large ones.
+
+    The manager is only used from the event loop thread, so the job table
+    is accessed without a lock.
     """
 
-    def __init__(self, job_retention_seconds: int = 3600) -> None:
+    def __init__(
+        self,
+        job_retention_seconds: int = 3600,
+        quick_job_max_classes: int = QUICK_JOB_MAX_CLASSES,
+        quick_slots: int = QUICK_QUEUE_SLOTS,
+        long_slots: int = LONG_QUEUE_SLOTS,
+        max_finished_jobs: int = MAX_FINISHED_JOBS,
+    ) -> None:
         """Initialize the batch job manager.
 
         Args:
             job_retention_seconds: How long to keep completed jobs (default: 1 hour)
+            quick_job_max_classes: Largest job that goes to the quick queue
+            quick_slots: Classes in flight across all quick jobs
+            long_slots: Classes in flight across all long jobs
+            max_finished_jobs: Finished jobs kept before the oldest is evicted
         """
         self._jobs: dict[str, BatchJob] = {}
         self._retention_seconds = job_retention_seconds
-        self._lock = asyncio.Lock()
+        # (expiry time, job_id) for finished jobs, soonest first
+        self._expiry_heap: list[tuple[float, str]] = []
+        # Finished job IDs, oldest first
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self._max_finished_jobs = max_finished_jobs
+        self._quick_job_max_classes = quick_job_max_classes
+        self._spill_dir: Path | None = None
+        self._delivery_slots = asyncio.Semaphore(MAX_EVENT_DELIVERIES)
+        self._queue_slots = {
+            JobQueue.QUICK: asyncio.Semaphore(quick_slots),
+            JobQueue.LONG: asyncio.Semaphore(long_slots),
+        }
 
     def _generate_job_id(self) -> str:
-        """Generate a unique job ID."""
-        return f"batch_{secrets.token_urlsafe(16)}"
+        """Generate a unique job ID.
+
+        The ID is the only thing guarding a job's results on the status
+        endpoint, so it keeps 128 random bits from the OS CSPRNG.
+        """
+        return f"batch_{os.urandom(16).hex()}"
 
-    async def create_job(
+    def create_job(
         self,
         classes: list[ClassInfo],
         provider: str,
         api_key: str,
         max_iterations: int = 5,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ) -> BatchJob:
         """Create a new batch job.
 
@@ -132,11 +445,12 @@ class BatchJobManager:
             provider: LLM provider name
             api_key: API key for the provider
             max_iterations: Max iterations per class
+            concurrency: Max classes processed in parallel
 
         Returns:
             The created BatchJob
         """
-        await self._cleanup_old_jobs()
+        self._cleanup_old_jobs()
 
         job_id = self._generate_job_id()
         job = BatchJob(
@@ -146,28 +460,43 @@ class BatchJobManager:
             provider=provider,
             api_key=api_key,
             max_iterations=max_iterations,
+            concurrency=concurrency,
+            queue=(
+                JobQueue.QUICK
+                if len(classes) <= self._quick_job_max_classes
+                else JobQueue.LONG
+            ),
             created_at=datetime.now(),
             results=[
                 ClassResult(iri=c.iri, label=c.label, status="pending") for c in classes
             ],
         )
 
-        async with self._lock:
-            self._jobs[job_id] = job
+        self._jobs[job_id] = job
 
         return job
 
-    async def get_job(self, job_id: str) -> BatchJob | None:
+    async def get_job(
+        self, job_id: str, *, with_results: bool = True
+    ) -> BatchJob | None:
         """Get a job by ID.
 
         Args:
             job_id: The job ID
+            with_results: Whether spilled definitions are needed. When False
+                the job is returned as held in memory, which is enough for
+                its status and counts.
 
         Returns:
-            The BatchJob or None if not found
+            The BatchJob or None if not found. Spilled jobs are returned as
+            a copy with their full results loaded back from disk.
         """
-        async with self._lock:
-            return self._jobs.get(job_id)
+        job = self._jobs.get(job_id)
+
+        if with_results and job is not None and job.spill_path is not None:
+            results = await asyncio.to_thread(_load_results, job.spill_path)
+            return replace(job, results=results)
+        return job
 
     async def start_job(
         self,
@@ -180,17 +509,17 @@ class BatchJobManager:
         Args:
             job_id: The job ID to start
             llm_provider: LLM provider instance
-            event_callback: Optional callback for progress events
+            event_callback: Optional callback, awaited with lists of
+                progress events
         """
-        job = await self.get_job(job_id)
+        job = self._jobs.get(job_id)
         if job is None:
             raise ValueError(f"Job not found: {job_id}")
 
         if job.status != JobStatus.PENDING:
             raise ValueError(f"Job already started: {job_id}")
 
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.now()
+        job.mark_started()
 
         # Create background task
         job.task = asyncio.create_task(
@@ -206,15 +535,16 @@ class BatchJobManager:
         Returns:
             True if cancelled, False if not running
         """
-        job = await self.get_job(job_id)
+        job = self._jobs.get(job_id)
         if job is None:
             return False
 
         if job.status != JobStatus.RUNNING:
             return False
 
-        job.status = JobStatus.CANCELLED
-        job.cancelled_at = datetime.now()
+        job.mark_finished(JobStatus.CANCELLED)
+        job.cancel_event.set()
+        self._schedule_expiry(job)
 
         if job.task and not job.task.done():
             job.task.cancel()
@@ -232,22 +562,163 @@ class BatchJobManager:
         Args:
             job: The batch job to process
             llm_provider: LLM provider instance
-            event_callback: Optional callback for progress events
+            event_callback: Optional callback, awaited with lists of
+                progress events
         """
-        config = LoopConfig(max_iterations=job.max_iterations)
+        config = LoopConfig(
+            max_iterations=job.max_iterations, cancel_event=job.cancel_event
+        )
+        # One loop serves every class; it keeps no per-run state
+        loop = RalphLoop(llm=llm_provider, config=config)
+        semaphore = asyncio.Semaphore(job.concurrency)
+        queue_slots = self._queue_slots[job.queue]
+        window = max(DISPATCH_WINDOW_SIZE, job.concurrency)
+
+        events = _EventSink(event_callback, self._delivery_slots)
 
         try:
-            for i, class_info in enumerate(job.classes):
-                # Check if cancelled
-                if job.status == JobStatus.CANCELLED:
-                    break
+            # The task group owns every class task: if one fails unexpectedly
+            # or the job is cancelled, the rest are cancelled with it
+            async with asyncio.TaskGroup() as tg:
+                pending: set[asyncio.Task[None]] = set()
+                for i, class_info in enumerate(job.classes):
+                    if len(pending) >= window:
+                        # Start the next class as soon as any running one ends
+                        _, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                    if job.cancel_event.is_set():
+                        break
+
+                    pending.add(
+                        tg.create_task(
+                            self._process_one(
+                                job,
+                                i,
+                                class_info,
+                                semaphore,
+                                queue_slots,
+                                loop,
+                                events,
+                            )
+                        )
+                    )
 
-                job.current_index = i
-                job.results[i].status = "running"
+            # Job complete
+            if job.status != JobStatus.CANCELLED:
+                job.mark_finished(JobStatus.COMPLETE)
 
-                # Notify event callback
-                if event_callback:
-                    await event_callback(
+                if events.active:
+                    events.emit(
+                        {
+                            "event": "job_complete",
+                            "data": {
+                                "job_id": job.job_id,
+                                "total": job.total_classes,
+                                "passed": job.passed_count,
+                                "failed": job.failed_count,
+                                "duration_seconds": job.duration_seconds,
+                            },
+                        }
+                    )
+
+        except asyncio.CancelledError:
+            logger.info(f"Batch job {job.job_id} was cancelled")
+            job.mark_finished(JobStatus.CANCELLED)
+        except Exception as e:
+            logger.exception(f"Batch job {job.job_id} failed")
+            error = e.exceptions[0] if isinstance(e, ExceptionGroup) else e
+            job.mark_finished(JobStatus.FAILED)
+
+            if events.active:
+                events.emit(
+                    {
+                        "event": "job_error",
+                        "data": {
+                            "job_id": job.job_id,
+                            "error": str(error),
+                        },
+                    }
+                )
+        finally:
+            await events.close(flush=job.status != JobStatus.CANCELLED)
+
+            self._schedule_expiry(job)
+            await self._spill_results(job)
+
+    async def _spill_results(self, job: BatchJob) -> None:
+        """Move the definitions of a large finished job to disk.
+
+        Only statuses, errors and timings stay in memory; ``get_job``
+        loads the rest back when the job is requested.
+
+        Args:
+            job: The finished batch job
+        """
+        size = sum(
+            len(r.final_definition or "") + len(r.original_definition or "")
+            for r in job.results
+        )
+        if size <= SPILL_THRESHOLD_CHARS:
+            return
+
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="ontoralph_batch_"))
+        path = self._spill_dir / f"{job.job_id}.pkl"
+
+        try:
+            await asyncio.to_thread(_dump_results, path, job.results)
+        except OSError:
+            logger.warning(f"Could not spill results of batch job {job.job_id}")
+            return
+
+        # Swap in stripped copies; downloads already iterating the old list
+        # keep their complete results
+        job.results = [
+            replace(
+                r,
+                final_definition=None,
+                original_definition=None,
+                failed_checks=None,
+                md_bytes=None,
+                json_bytes=None,
+            )
+            for r in job.results
+        ]
+        job.spill_path = path
+        job.status_json_cache = None
+
+    async def _process_one(
+        self,
+        job: BatchJob,
+        i: int,
+        class_info: ClassInfo,
+        semaphore: asyncio.Semaphore,
+        queue_slots: asyncio.Semaphore,
+        loop: RalphLoop,
+        events: _EventSink,
+    ) -> None:
+        """Process a single class once a concurrency slot is free.
+
+        Args:
+            job: The batch job the class belongs to
+            i: Index of the class in the job
+            class_info: The class to process
+            semaphore: Limits how many classes of this job run at once
+            queue_slots: Limits classes in flight across the job's queue
+            loop: Ralph Loop shared by the job's classes
+            events: Sink for the job's progress events
+        """
+        async with semaphore, queue_slots:
+            # Check if cancelled while waiting for a slot
+            if job.cancel_event.is_set():
+                return
+
+            job.in_progress.add(i)
+            try:
+                job.set_status(i, "running")
+                if events.active:
+                    events.emit(
                         {
                             "event": "class_start",
                             "data": {
@@ -259,12 +730,16 @@ class BatchJobManager:
                         }
                     )
 
-                start_time = time.time()
+                start_time = time.monotonic()
 
                 try:
-                    loop = RalphLoop(llm=llm_provider, config=config)
                     result: LoopResult = await loop.run(class_info)
 
+                    # The loop stopped early because the job was cancelled
+                    if job.cancel_event.is_set():
+                        job.set_status(i, "cancelled")
+                        return
+
                     # Extract failed checks from last iteration
                     failed_checks = None
                     if not result.converged and result.iterations:
@@ -280,19 +755,19 @@ class BatchJobManager:
                                 for c in failed
                             ]
 
-                    job.results[i] = ClassResult(
-                        iri=class_info.iri,
-                        label=class_info.label,
-                        status=result.status.value,
-                        final_definition=result.final_definition,
-                        original_definition=class_info.current_definition,
-                        total_iterations=result.total_iterations,
-                        duration_seconds=time.time() - start_time,
-                        failed_checks=failed_checks,
-                    )
-
-                    if event_callback:
-                        await event_callback(
+                    # Fill in the placeholder result in place
+                    class_result = job.results[i]
+                    class_result.final_definition = result.final_definition
+                    class_result.original_definition = class_info.current_definition
+                    class_result.total_iterations = result.total_iterations
+                    class_result.duration_seconds = time.monotonic() - start_time
+                    class_result.failed_checks = failed_checks
+                    job.set_status(i, result.status.value)
+                    class_result.render_files()
+                    job.completed_order.append(i)
+
+                    if events.active:
+                        events.emit(
                             {
                                 "event": "class_complete",
                                 "data": {
@@ -308,20 +783,22 @@ class BatchJobManager:
                         )
 
                 except asyncio.CancelledError:
-                    job.results[i].status = "cancelled"
+                    job.set_status(i, "cancelled")
                     raise
                 except Exception as e:
                     logger.exception(f"Error processing {class_info.iri}")
-                    job.results[i] = ClassResult(
-                        iri=class_info.iri,
-                        label=class_info.label,
-                        status="error",
-                        error=str(e),
-                        duration_seconds=time.time() - start_time,
-                    )
-
-                    if event_callback:
-                        await event_callback(
+                    job.completed_order.append(i)
+                    class_result = job.results[i]
+                    class_result.final_definition = None
+                    class_result.original_definition = None
+                    class_result.total_iterations = None
+                    class_result.failed_checks = None
+                    class_result.error = str(e)
+                    class_result.duration_seconds = time.monotonic() - start_time
+                    job.set_status(i, "error")
+
+                    if events.active:
+                        events.emit(
                             {
                                 "event": "class_error",
                                 "data": {
@@ -331,71 +808,61 @@ class BatchJobManager:
                                 },
                             }
                         )
+            finally:
+                job.in_progress.discard(i)
 
-            # Job complete
-            if job.status != JobStatus.CANCELLED:
-                job.status = JobStatus.COMPLETE
-                job.completed_at = datetime.now()
+    def _schedule_expiry(self, job: BatchJob) -> None:
+        """Schedule a finished job for removal.
 
-                if event_callback:
-                    await event_callback(
-                        {
-                            "event": "job_complete",
-                            "data": {
-                                "job_id": job.job_id,
-                                "total": job.total_classes,
-                                "passed": job.passed_count,
-                                "failed": job.failed_count,
-                                "duration_seconds": job.duration_seconds,
-                            },
-                        }
-                    )
+        The job expires after the retention period, or earlier if more
+        than ``max_finished_jobs`` jobs finish after it.
 
-        except asyncio.CancelledError:
-            logger.info(f"Batch job {job.job_id} was cancelled")
-            job.status = JobStatus.CANCELLED
-            job.cancelled_at = datetime.now()
-        except Exception as e:
-            logger.exception(f"Batch job {job.job_id} failed")
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.now()
+        Args:
+            job: The job that reached a terminal state
+        """
+        heapq.heappush(
+            self._expiry_heap,
+            (time.monotonic() + self._retention_seconds, job.job_id),
+        )
 
-            if event_callback:
-                await event_callback(
-                    {
-                        "event": "job_error",
-                        "data": {
-                            "job_id": job.job_id,
-                            "error": str(e),
-                        },
-                    }
-                )
+        finished = self._finished
+        finished[job.job_id] = None
+        finished.move_to_end(job.job_id)
+        while len(finished) > self._max_finished_jobs:
+            oldest, _ = finished.popitem(last=False)
+            self._drop_job(oldest)
 
-    async def _cleanup_old_jobs(self) -> None:
+    def _drop_job(self, job_id: str) -> bool:
+        """Forget a job and delete its spill file.
+
+        Args:
+            job_id: The job ID to remove
+
+        Returns:
+            True if the job was still tracked
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is None:
+            return False
+        self._finished.pop(job_id, None)
+        if job.spill_path is not None:
+            job.spill_path.unlink(missing_ok=True)
+        return True
+
+    def _cleanup_old_jobs(self) -> None:
         """Remove jobs older than retention period."""
-        now = datetime.now()
-        to_remove = []
-
-        async with self._lock:
-            for job_id, job in self._jobs.items():
-                # Only clean up completed/cancelled/failed jobs
-                if job.status in (
-                    JobStatus.COMPLETE,
-                    JobStatus.CANCELLED,
-                    JobStatus.FAILED,
-                ):
-                    end_time = job.completed_at or job.cancelled_at
-                    if (
-                        end_time
-                        and (now - end_time).total_seconds() > self._retention_seconds
-                    ):
-                        to_remove.append(job_id)
-
-            for job_id in to_remove:
-                del self._jobs[job_id]
-
-        if to_remove:
-            logger.info(f"Cleaned up {len(to_remove)} old batch jobs")
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] <= now:
+            _, job_id = heapq.heappop(heap)
+            # A job can be scheduled twice or already evicted
+            if self._drop_job(job_id):
+                removed += 1
+
+        if removed:
+            logger.info(f"Cleaned up {removed} old batch jobs")
 
     def job_count(self) -> int:
         """Number of jobs currently tracked."""
@@ -406,6 +873,37 @@ class BatchJobManager:
 _batch_manager: BatchJobManager | None = None
 
 
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize a downloaded file's contents as 2-space indented JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+    Both paths write non-ASCII characters unescaped, so downloaded files
+    are the same either way.
+
+    Args:
+        data: JSON-compatible file contents.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dump_results(path: Path, results: list[ClassResult]) -> None:
+    """Write job results to a spill file."""
+    with open(path, "wb") as f:
+        pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_results(path: Path) -> list[ClassResult]:
+    """Read job results back from a spill file."""
+    with open(path, "rb") as f:
+        results: list[ClassResult] = pickle.load(f)
+    return results
+
+
 def get_batch_manager() -> BatchJobManager:
     """Get the global batch job manager instance.
 
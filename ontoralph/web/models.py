@@ -237,6 +237,9 @@ class BatchRequest(BaseModel):
     max_iterations: int = Field(
         default=5, ge=1, le=10, description="Max iterations per class"
     )
+    concurrency: int = Field(
+        default=3, ge=1, le=10, description="Max classes processed in parallel"
+    )
     provider: str = Field(default="claude", description="LLM provider")
     api_key: str | None = Field(
         default=None, description="API key (not needed for mock)"
@@ -288,6 +291,9 @@ class BatchStatusResponse(BaseModel):
     current_class: str | None = Field(
         default=None, description="Currently processing class IRI"
     )
+    in_progress: list[str] = Field(
+        default_factory=list, description="IRIs of all classes being processed"
+    )
     duration_seconds: float | None = Field(
         default=None, description="Total duration (if complete)"
     )
@@ -297,6 +303,9 @@ class BatchStatusResponse(BaseModel):
     cancelled_at: datetime | None = Field(
         default=None, description="Cancellation timestamp (if cancelled)"
     )
+    next_since: int = Field(
+        default=0, description="Cursor to pass as 'since' for later completions"
+    )
 
 
 # =============================================================================
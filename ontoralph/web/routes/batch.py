@@ -1,22 +1,24 @@
 """Batch processing endpoints."""
 
 import asyncio
+import contextlib
 import io
 import json
 import logging
 import zipfile
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
 from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 
 from ontoralph.core.models import ClassInfo
 from ontoralph.llm import ClaudeProvider, MockProvider, OpenAIProvider
 from ontoralph.web.batch_manager import (
     BatchJob,
+    ClassResult,
     JobStatus,
     get_batch_manager,
 )
@@ -30,24 +32,93 @@ from ontoralph.web.models import (
 )
 from ontoralph.web.session_store import get_session_store
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 router = APIRouter(tags=["batch"])
 logger = logging.getLogger(__name__)
 
+# Longest wait for a job change before re-checking the client connection
+STREAM_IDLE_TIMEOUT = 15.0
+
+# Longest a status request may be held open waiting for completions
+LONG_POLL_MAX_WAIT = 30.0
+
+# Most completed classes sent in a single batch_update event
+STREAM_MAX_RESULTS_PER_EVENT = 50
+
+# Most recent completions listed in a stream's status event; clients fetch
+# the rest from GET /batch/{job_id}
+STREAM_INITIAL_RESULTS = 100
+
+# Events buffered per stream subscriber before its backlog is replaced by a
+# fresh status event
+STREAM_SUBSCRIBER_QUEUE_SIZE = 256
+
+# Labels for class statuses in the downloaded summary
+_STATUS_EMOJI = {
+    "pass": "[PASS]",
+    "fail": "[FAIL]",
+    "error": "[ERROR]",
+    "cancelled": "[CANCELLED]",
+}
+
+# Name of the downloaded results archive, stamped with the download time
+_DOWNLOAD_FILENAME_FORMAT = "ontoralph_batch_%Y%m%d_%H%M%S.zip"
+
+
+def _dumps(data: Any) -> str:
+    """Serialize an SSE event payload as compact JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+
+    Args:
+        data: JSON-compatible payload.
+
+    Returns:
+        JSON string.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+# Provider factories by name, each taking the API key
+_PROVIDER_FACTORIES: dict[str, Callable[[str], Any]] = {
+    "mock": lambda _api_key: MockProvider(),
+    "claude": lambda api_key: ClaudeProvider(api_key=api_key),
+    "openai": lambda api_key: OpenAIProvider(api_key=api_key),
+}
+
 
 def get_llm_provider(provider: str, api_key: str) -> Any:
     """Create an LLM provider instance."""
-    if provider == "mock":
-        return MockProvider()
-    elif provider == "claude":
-        return ClaudeProvider(api_key=api_key)
-    elif provider == "openai":
-        return OpenAIProvider(api_key=api_key)
-    else:
-        raise ValueError(f"Invalid provider: {provider}")
+    try:
+        factory = _PROVIDER_FACTORIES[provider]
+    except KeyError:
+        raise ValueError(f"Invalid provider: {provider}") from None
+    return factory(api_key)
 
 
-def job_to_status_response(job: BatchJob) -> BatchStatusResponse:
-    """Convert a BatchJob to API response."""
+def job_to_status_response(
+    job: BatchJob, results: list[ClassResult] | None = None
+) -> BatchStatusResponse:
+    """Convert a BatchJob to API response.
+
+    Args:
+        job: The batch job
+        results: Class results to list, all of the job's by default
+
+    Returns:
+        The status response
+    """
+    if results is None:
+        results = job.results
     return BatchStatusResponse(
         job_id=job.job_id,
         status=BatchJobStatus(job.status.value),
@@ -56,6 +127,7 @@ def job_to_status_response(job: BatchJob) -> BatchStatusResponse:
         passed=job.passed_count,
         failed=job.failed_count,
         current_class=job.current_class,
+        in_progress=job.in_progress_classes,
         duration_seconds=job.duration_seconds,
         results=[
             BatchClassResult(
@@ -65,12 +137,37 @@ def job_to_status_response(job: BatchJob) -> BatchStatusResponse:
                 error=r.error,
                 total_iterations=r.total_iterations,
             )
-            for r in job.results
+            for r in results
         ],
         cancelled_at=job.cancelled_at,
+        next_since=len(job.completed_order),
     )
 
 
+def job_to_status_json(job: BatchJob) -> bytes:
+    """Serialize a BatchJob's status response, reusing the last encoding.
+
+    The encoded response is cached on the job and rebuilt only when the
+    job has changed since, so repeated polls of an idle or finished job
+    skip building and validating a model per class. While the job runs
+    its duration keeps growing, so those polls still rebuild.
+
+    Args:
+        job: The batch job
+
+    Returns:
+        The status response as JSON bytes
+    """
+    key = (job.version, job.status, job.duration_seconds)
+    cached = job.status_json_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    content = job_to_status_response(job).model_dump_json().encode()
+    job.status_json_cache = (key, content)
+    return content
+
+
 @router.post("/batch", response_model=BatchResponse)
 async def create_batch_job(request: BatchRequest) -> BatchResponse:
     """Create a new batch processing job.
@@ -95,32 +192,25 @@ async def create_batch_job(request: BatchRequest) -> BatchResponse:
         )
 
     # Validate provider
-    if request.provider not in ("claude", "openai", "mock"):
+    if request.provider not in _PROVIDER_FACTORIES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid provider: {request.provider}",
         )
 
-    # Convert request classes to ClassInfo
-    class_infos = [
-        ClassInfo(
-            iri=c.iri,
-            label=c.label,
-            parent_class=c.parent_class,
-            sibling_classes=c.sibling_classes,
-            is_ice=c.is_ice,
-            current_definition=c.current_definition,
-        )
-        for c in request.classes
-    ]
+    # Convert request classes to ClassInfo. The inputs were validated with
+    # the same fields and types, so the classes are built without
+    # validating them a second time.
+    class_infos = [ClassInfo.model_construct(**c.__dict__) for c in request.classes]
 
     # Create job
     manager = get_batch_manager()
-    job = await manager.create_job(
+    job = manager.create_job(
         classes=class_infos,
         provider=request.provider,
         api_key=request.api_key or "",
         max_iterations=request.max_iterations,
+        concurrency=request.concurrency,
     )
 
     # Start processing in background
@@ -135,18 +225,40 @@ async def create_batch_job(request: BatchRequest) -> BatchResponse:
     )
 
 
-@router.get("/batch/{job_id}", response_model=BatchStatusResponse)
-async def get_batch_status(job_id: str) -> BatchStatusResponse:
+@router.get("/batch/{job_id}", responses={200: {"model": BatchStatusResponse}})
+async def get_batch_status(
+    job_id: str,
+    summary: bool = Query(False, description="Return counts without results"),
+    since: int | None = Query(
+        None, ge=0, description="Only return classes completed after this cursor"
+    ),
+    wait: float = Query(
+        0,
+        ge=0,
+        le=LONG_POLL_MAX_WAIT,
+        description="Seconds to wait for new completions",
+    ),
+) -> Response:
     """Get the status of a batch job.
 
+    With ``since`` set to the ``next_since`` of an earlier response, only
+    the classes completed after it are returned. Adding ``wait`` turns the
+    request into a long poll: while the job runs and nothing new has
+    completed, the response is held back until something does or the
+    wait runs out.
+
     Args:
         job_id: The job ID
+        summary: Leave out the per-class results, for clients that only
+            need progress counts
+        since: Completion cursor from an earlier response
+        wait: Longest time to hold the response waiting for completions
 
     Returns:
         Current job status and results
     """
     manager = get_batch_manager()
-    job = await manager.get_job(job_id)
+    job = await manager.get_job(job_id, with_results=not summary)
 
     if job is None:
         raise HTTPException(
@@ -157,7 +269,30 @@ async def get_batch_status(job_id: str) -> BatchStatusResponse:
             },
         )
 
-    return job_to_status_response(job)
+    cursor = since or 0
+    if wait > 0 and job.status == JobStatus.RUNNING:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while job.status == JobStatus.RUNNING and len(job.completed_order) <= cursor:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(job.changed.wait(), timeout=remaining)
+
+        # The job may have finished and been spilled while we waited
+        if not summary and job.spill_path is not None:
+            job = await manager.get_job(job_id) or job
+
+    if summary:
+        results: list[ClassResult] = []
+    elif since is not None:
+        results = [job.results[i] for i in job.completed_order[since:]]
+    else:
+        return Response(content=job_to_status_json(job), media_type="application/json")
+
+    content = job_to_status_response(job, results)
+    return Response(content=content.model_dump_json(), media_type="application/json")
 
 
 @router.delete("/batch/{job_id}")
@@ -174,7 +309,7 @@ async def cancel_batch_job(job_id: str) -> dict[str, str]:
     cancelled = await manager.cancel_job(job_id)
 
     if not cancelled:
-        job = await manager.get_job(job_id)
+        job = await manager.get_job(job_id, with_results=False)
         if job is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -201,9 +336,9 @@ async def stream_batch_progress(
     """Stream batch job progress via SSE.
 
     Event types:
-    - class_start: Starting to process a class
-    - class_complete: Class processing complete
-    - class_error: Class processing failed
+    - status: Current job status and most recent completions, on connect
+      and again whenever a slow client's backlog is dropped
+    - batch_update: Progress plus the classes completed since the last update
     - job_complete: All classes processed
     - job_error: Job failed
 
@@ -223,7 +358,7 @@ async def stream_batch_progress(
         async def error_generator() -> AsyncGenerator[dict[str, str], None]:
             yield {
                 "event": "error",
-                "data": json.dumps(
+                "data": _dumps(
                     {
                         "code": ErrorCode.INVALID_TOKEN.value,
                         "message": "Invalid or expired session token",
@@ -234,14 +369,14 @@ async def stream_batch_progress(
         return EventSourceResponse(error_generator())
 
     manager = get_batch_manager()
-    job = await manager.get_job(job_id)
+    job = await manager.get_job(job_id, with_results=False)
 
     if job is None:
 
         async def not_found_generator() -> AsyncGenerator[dict[str, str], None]:
             yield {
                 "event": "error",
-                "data": json.dumps(
+                "data": _dumps(
                     {
                         "code": ErrorCode.NOT_FOUND.value,
                         "message": f"Job not found: {job_id}",
@@ -251,92 +386,235 @@ async def stream_batch_progress(
 
         return EventSourceResponse(not_found_generator())
 
+    # A finished job may have spilled the definitions its first event lists
+    if job.spill_path is not None:
+        job = await manager.get_job(job_id) or job
+
     async def stream_generator() -> AsyncGenerator[dict[str, str], None]:
-        # Send initial status
-        yield {
-            "event": "status",
-            "data": json.dumps(
-                {
-                    "job_id": job.job_id,
-                    "status": job.status.value,
-                    "total": job.total_classes,
-                    "completed": job.completed_count,
-                }
-            ),
-        }
+        # Running jobs are followed through the job's shared fan-out, whose
+        # cursor marks where this stream's updates will pick up
+        fanout = None
+        queue = None
+        if job.status == JobStatus.RUNNING:
+            fanout = _stream_fanouts.get(job.job_id)
+            if fanout is None:
+                fanout = _stream_fanouts[job.job_id] = _StreamFanout(job)
+            queue = fanout.subscribe()
+            last_completed = fanout.cursor
+        else:
+            last_completed = len(job.completed_order)
+
+        # Send initial status with the most recent completions, so a client
+        # joining a running job needs no separate status request
+        yield _status_event(job, last_completed)
 
         # If job is already complete, send final status
-        if job.status in (JobStatus.COMPLETE, JobStatus.CANCELLED, JobStatus.FAILED):
-            yield {
-                "event": "job_complete",
-                "data": json.dumps(
-                    {
-                        "status": job.status.value,
-                        "total": job.total_classes,
-                        "passed": job.passed_count,
-                        "failed": job.failed_count,
-                        "duration_seconds": job.duration_seconds,
-                    }
-                ),
-            }
+        if fanout is None or queue is None:
+            yield _job_complete_event(job)
             return
 
-        # Poll for updates until complete
-        last_completed = job.completed_count
-        while job.status == JobStatus.RUNNING:
-            # Check for client disconnect
-            if await request.is_disconnected():
-                break
+        # Relay the fan-out's events until it ends the stream
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_IDLE_TIMEOUT
+                    )
+                except TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    continue
+                if event is None:
+                    break
+                yield event
+        finally:
+            fanout.unsubscribe(queue)
 
-            # Check for new completions
-            current_completed = job.completed_count
-            if current_completed > last_completed:
-                # Send updates for newly completed classes
-                for i in range(last_completed, current_completed):
-                    result = job.results[i]
-                    yield {
-                        "event": "class_complete",
-                        "data": json.dumps(
-                            {
-                                "index": i,
-                                "iri": result.iri,
-                                "label": result.label,
-                                "status": result.status,
-                                "final_definition": result.final_definition,
-                            }
-                        ),
-                    }
-                last_completed = current_completed
+    return EventSourceResponse(stream_generator())
 
-            # Send progress update
-            yield {
-                "event": "progress",
-                "data": json.dumps(
-                    {
-                        "completed": job.completed_count,
-                        "total": job.total_classes,
-                        "current_class": job.current_class,
-                    }
-                ),
+
+def _status_event(job: BatchJob, last_completed: int) -> dict[str, str]:
+    """Build the SSE event describing a job's current status.
+
+    Only the last ``STREAM_INITIAL_RESULTS`` completions are listed; a
+    client that sees ``completed`` exceed the listed results fetches the
+    rest from GET /batch/{job_id}.
+
+    Args:
+        job: The batch job
+        last_completed: Position in the completion log the event covers up to
+
+    Returns:
+        The status event
+    """
+    recent = job.completed_order[
+        max(0, last_completed - STREAM_INITIAL_RESULTS) : last_completed
+    ]
+    return {
+        "event": "status",
+        "data": _dumps(
+            {
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "total": job.total_classes,
+                "completed": job.completed_count,
+                "passed": job.passed_count,
+                "failed": job.failed_count,
+                "results": [_result_event_data(job, i) for i in recent],
+            }
+        ),
+    }
+
+
+def _job_complete_event(job: BatchJob) -> dict[str, str]:
+    """Build the SSE event that ends a finished job's stream.
+
+    Args:
+        job: The finished batch job
+
+    Returns:
+        The job_complete event
+    """
+    return {
+        "event": "job_complete",
+        "data": _dumps(
+            {
+                "status": job.status.value,
+                "total": job.total_classes,
+                "passed": job.passed_count,
+                "failed": job.failed_count,
+                "duration_seconds": job.duration_seconds,
             }
+        ),
+    }
 
-            await asyncio.sleep(0.5)
 
-        # Send final status
-        yield {
-            "event": "job_complete",
-            "data": json.dumps(
+class _StreamFanout:
+    """Publishes a running job's stream events to all of its subscribers.
+
+    One task follows the job and builds each update once, however many
+    clients stream the job. Every subscriber has its own bounded queue;
+    when one falls too far behind, its queued updates are replaced by a
+    single status event. Updates carry cumulative counts, so only the
+    per-class detail is coalesced, and the client fills that in from the
+    status event. ``None`` ends a subscriber's stream.
+    """
+
+    def __init__(self, job: BatchJob) -> None:
+        self.job = job
+        self.cursor = len(job.completed_order)
+        self._subscribers: set[asyncio.Queue[dict[str, str] | None]] = set()
+        self._task = asyncio.create_task(self._run())
+
+    def subscribe(self) -> asyncio.Queue[dict[str, str] | None]:
+        """Add a subscriber, which receives events from ``cursor`` on.
+
+        Returns:
+            The queue the subscriber's events are put on
+        """
+        queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(
+            maxsize=STREAM_SUBSCRIBER_QUEUE_SIZE
+        )
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, str] | None]) -> None:
+        """Remove a subscriber, stopping the fan-out once none are left.
+
+        Args:
+            queue: The subscriber's queue
+        """
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self._task.cancel()
+            self._forget()
+
+    def _forget(self) -> None:
+        """Drop this fan-out from the registry, if it is still there."""
+        if _stream_fanouts.get(self.job.job_id) is self:
+            del _stream_fanouts[self.job.job_id]
+
+    def _publish(self, event: dict[str, str] | None) -> None:
+        """Put an event on every subscriber's queue."""
+        resync = None
+        for queue in self._subscribers:
+            if queue.full():
+                # Coalesce a slow subscriber's backlog into one status event
+                while not queue.empty():
+                    queue.get_nowait()
+                if resync is None:
+                    resync = _status_event(self.job, self.cursor)
+                queue.put_nowait(resync)
+            queue.put_nowait(event)
+
+    def _publish_completions(self) -> None:
+        """Publish classes completed since the cursor in bounded batches."""
+        job = self.job
+        current_completed = len(job.completed_order)
+        while self.cursor < current_completed:
+            batch_end = min(
+                self.cursor + STREAM_MAX_RESULTS_PER_EVENT, current_completed
+            )
+            new_results = [
+                _result_event_data(job, i)
+                for i in job.completed_order[self.cursor : batch_end]
+            ]
+            self.cursor = batch_end
+            self._publish(
                 {
-                    "status": job.status.value,
-                    "total": job.total_classes,
-                    "passed": job.passed_count,
-                    "failed": job.failed_count,
-                    "duration_seconds": job.duration_seconds,
+                    "event": "batch_update",
+                    "data": _dumps(
+                        {
+                            "completed": job.completed_count,
+                            "total": job.total_classes,
+                            "passed": job.passed_count,
+                            "failed": job.failed_count,
+                            "current_class": job.current_class,
+                            "new_results": new_results,
+                        }
+                    ),
                 }
-            ),
-        }
+            )
 
-    return EventSourceResponse(stream_generator())
+    async def _run(self) -> None:
+        """Follow the job until it finishes, then end every stream."""
+        job = self.job
+        try:
+            while job.status == JobStatus.RUNNING:
+                # Grab the event before reading state so no change is missed
+                changed = job.changed
+                self._publish_completions()
+                await changed.wait()
+
+            self._publish_completions()
+            self._publish(_job_complete_event(job))
+            self._publish(None)
+        finally:
+            self._forget()
+
+
+# Stream fan-outs of running jobs, by job ID
+_stream_fanouts: dict[str, _StreamFanout] = {}
+
+
+def _result_event_data(job: BatchJob, index: int) -> dict[str, Any]:
+    """Build the SSE payload describing one completed class.
+
+    Args:
+        job: The batch job
+        index: Index of the class in the job
+
+    Returns:
+        JSON-compatible payload for the class
+    """
+    result = job.results[index]
+    return {
+        "index": index,
+        "iri": result.iri,
+        "label": result.label,
+        "status": result.status,
+        "final_definition": result.final_definition,
+    }
 
 
 @router.get("/batch/{job_id}/download")
@@ -368,112 +646,101 @@ async def download_batch_results(job_id: str) -> StreamingResponse:
             detail="Job is not complete",
         )
 
-    # Create ZIP in memory
-    zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Create summary
-        summary_lines = [
-            "# Batch Processing Summary",
-            "",
-            f"**Job ID:** {job.job_id}",
-            f"**Status:** {job.status.value}",
-            f"**Created:** {job.created_at.isoformat()}",
-            f"**Duration:** {job.duration_seconds:.1f}s"
-            if job.duration_seconds
-            else "",
-            "",
-            "## Results",
-            "",
-            f"- **Total:** {job.total_classes}",
-            f"- **Passed:** {job.passed_count}",
-            f"- **Failed:** {job.failed_count}",
-            "",
-            "## Classes",
-            "",
-        ]
+    filename = datetime.now().strftime(_DOWNLOAD_FILENAME_FORMAT)
+
+    # A plain iterator is advanced in Starlette's thread pool, so the
+    # deflate work never blocks the event loop
+    return StreamingResponse(
+        _iter_zip_chunks(job),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+class _ZipChunkSink(io.RawIOBase):
+    """Unseekable file that collects what zipfile writes to it.
+
+    zipfile falls back to data descriptors for unseekable output, so an
+    archive can be handed out entry by entry instead of built in memory.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        """Return and forget everything written since the last call."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip_chunks(job: BatchJob) -> Iterator[bytes]:
+    """Build the results ZIP for a job, yielding it entry by entry.
+
+    Args:
+        job: A finished batch job
+
+    Yields:
+        Consecutive chunks of the ZIP file
+    """
+    sink = _ZipChunkSink()
+
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        # One pass over the results: each class adds its section to the
+        # summary and its files to the archive. The summary is complete
+        # only at the end, so it is the last entry.
+        summary = io.StringIO()
+        write = summary.write
+        duration = job.duration_seconds
+        write("# Batch Processing Summary\n\n")
+        write(f"**Job ID:** {job.job_id}\n")
+        write(f"**Status:** {job.status.value}\n")
+        write(f"**Created:** {job.created_at.isoformat()}\n")
+        write(f"**Duration:** {duration:.1f}s\n" if duration else "\n")
+        write("\n## Results\n\n")
+        write(f"- **Total:** {job.total_classes}\n")
+        write(f"- **Passed:** {job.passed_count}\n")
+        write(f"- **Failed:** {job.failed_count}\n")
+        write("\n## Classes\n\n")
 
         for result in job.results:
-            status_emoji = {
-                "pass": "[PASS]",
-                "fail": "[FAIL]",
-                "error": "[ERROR]",
-                "cancelled": "[CANCELLED]",
-            }.get(result.status, "[?]")
+            status_emoji = _STATUS_EMOJI.get(result.status, "[?]")
 
-            summary_lines.append(f"### {status_emoji} {result.label} (`{result.iri}`)")
-            summary_lines.append("")
+            write(f"### {status_emoji} {result.label} (`{result.iri}`)\n\n")
 
             if result.original_definition:
-                summary_lines.append("**Original Definition:**  ")
-                summary_lines.append(f'"{result.original_definition}"')
-                summary_lines.append("")
+                write(f'**Original Definition:**  \n"{result.original_definition}"\n\n')
 
             if result.final_definition:
-                summary_lines.append("**Ralph:**  ")
-                summary_lines.append(f"> {result.final_definition}")
+                write(f"**Ralph:**  \n> {result.final_definition}\n\n")
             elif result.error:
-                summary_lines.append(f"Error: {result.error}")
+                write(f"Error: {result.error}\n\n")
             else:
-                summary_lines.append("No definition generated.")
-
-            summary_lines.append("")
+                write("No definition generated.\n\n")
 
             if result.status == "fail" and result.failed_checks:
-                summary_lines.append("**Failed Checks:**")
+                write("**Failed Checks:**\n")
                 for check in result.failed_checks:
-                    summary_lines.append(
-                        f"- **{check['code']}** {check['name']}: {check['evidence']}"
+                    write(
+                        f"- **{check['code']}** {check['name']}: {check['evidence']}\n"
                     )
-                summary_lines.append("")
+                write("\n")
 
-        zf.writestr("SUMMARY.md", "\n".join(summary_lines))
+            # Add the prebuilt files of successful results
+            if result.md_bytes is not None and result.json_bytes is not None:
+                zf.writestr(f"definitions/{result.safe_name}.md", result.md_bytes)
+                zf.writestr(f"definitions/{result.safe_name}.json", result.json_bytes)
+                yield sink.take()
 
-        # Add individual files for successful results
-        for result in job.results:
-            if result.status == "pass" and result.final_definition:
-                # Sanitize filename
-                safe_name = (
-                    result.iri.replace(":", "_")
-                    .replace("/", "_")
-                    .replace("\\", "_")
-                    .replace("<", "")
-                    .replace(">", "")
-                )
-
-                # Markdown file
-                md_content = [
-                    f"# {result.label}",
-                    "",
-                    f"**IRI:** `{result.iri}`",
-                    "",
-                    "## Definition",
-                    "",
-                    result.final_definition,
-                    "",
-                ]
-                zf.writestr(f"definitions/{safe_name}.md", "\n".join(md_content))
-
-                # JSON file
-                json_content = {
-                    "iri": result.iri,
-                    "label": result.label,
-                    "definition": result.final_definition,
-                    "status": result.status,
-                    "iterations": result.total_iterations,
-                }
-                zf.writestr(
-                    f"definitions/{safe_name}.json",
-                    json.dumps(json_content, indent=2),
-                )
-
-    zip_buffer.seek(0)
+        zf.writestr("SUMMARY.md", summary.getvalue())
+        yield sink.take()
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"ontoralph_batch_{timestamp}.zip"
-
-    return StreamingResponse(
-        zip_buffer,
-        media_type="application/zip",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
+    # Central directory
+    yield sink.take()
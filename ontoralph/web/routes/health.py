@@ -1,18 +1,34 @@
 """Health check endpoint."""
 
 from fastapi import APIRouter
+from fastapi.responses import Response
 
 from ontoralph import __version__
 from ontoralph.web.models import HealthResponse
 
 router = APIRouter(tags=["health"])
 
+# The health response never changes, so it is encoded once at import
+_HEALTH_CONTENT = (
+    HealthResponse(status="ok", version=__version__).model_dump_json().encode()
+)
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+# Lets probes and intermediaries reuse a health response briefly
+_HEALTH_CACHE_CONTROL = "max-age=1"
+
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
     """Check service health.
 
+    A new Response is built per request around the prebuilt body, since
+    middleware may add headers to the response it is given.
+
     Returns:
         Health status and version information
     """
-    return HealthResponse(status="ok", version=__version__)
+    return Response(
+        content=_HEALTH_CONTENT,
+        media_type="application/json",
+        headers={"Cache-Control": _HEALTH_CACHE_CONTROL},
+    )
@@ -1,7 +1,6 @@
 """Ralph Loop execution endpoints."""
 
 import asyncio
-import contextlib
 import json
 import logging
 from collections.abc import AsyncGenerator
@@ -19,7 +18,16 @@ from ontoralph.core.models import (
     LoopState,
     VerifyStatus,
 )
-from ontoralph.llm import ClaudeProvider, MockProvider, OpenAIProvider
+from ontoralph.llm import (
+    ClaudeProvider,
+    LLMAuthenticationError,
+    LLMRateLimitError,
+    LLMRequestError,
+    LLMServiceError,
+    LLMTimeoutError,
+    MockProvider,
+    OpenAIProvider,
+)
 from ontoralph.web.models import (
     CheckResultResponse,
     ErrorCode,
@@ -30,9 +38,82 @@ from ontoralph.web.models import (
 from ontoralph.web.routes.validate import check_result_to_response
 from ontoralph.web.session_store import get_session_store
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
 router = APIRouter(tags=["run"])
 logger = logging.getLogger(__name__)
 
+# Longest wait for a loop event before re-checking the client connection
+STREAM_IDLE_TIMEOUT = 15.0
+
+# Seconds a rate-limited client is told to wait when the provider gave none
+DEFAULT_RETRY_AFTER = 60
+
+# Most queued events sent together after a single wait
+STREAM_BURST_SIZE = 8
+
+# Most loop events held for a client that is not keeping up
+STREAM_QUEUE_SIZE = 32
+
+# Longest wait for a cancelled loop to stop before the stream moves on
+STREAM_CANCEL_TIMEOUT = 1.0
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize an SSE event payload as compact JSON.
+
+    Uses orjson when it is installed, falling back to the standard library.
+
+    Args:
+        data: JSON-compatible payload.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _sse_frame(event: str, payload: bytes) -> bytes:
+    """Frame an encoded payload as one SSE event.
+
+    EventSourceResponse passes bytes through untouched, so the frame is
+    written out as built here. Compact JSON never contains a line break,
+    so the payload always fits on a single data line.
+
+    Args:
+        event: SSE event name.
+        payload: Compact UTF-8 JSON payload.
+
+    Returns:
+        The complete event, including its terminating blank line.
+    """
+    return b"event: %s\r\ndata: %s\r\n\r\n" % (event.encode(), payload)
+
+
+def _offer_event(
+    event_queue: asyncio.Queue[dict[str, Any]], event: dict[str, Any]
+) -> None:
+    """Queue a progress event, dropping the oldest one when the queue is full.
+
+    One slot is always left free so the terminal complete or error event
+    can be queued without dropping anything.
+
+    Args:
+        event_queue: Bounded queue of events for one stream
+        event: Event to queue
+    """
+    if event_queue.qsize() >= event_queue.maxsize - 1:
+        event_queue.get_nowait()
+    event_queue.put_nowait(event)
+
 
 def get_llm_provider(provider: str, api_key: str | None) -> Any:
     """Create an LLM provider instance.
@@ -67,6 +148,51 @@ def get_llm_provider(provider: str, api_key: str | None) -> Any:
         )
 
 
+def _classify_error(exc: Exception) -> tuple[int, dict[str, Any]]:
+    """Map an error from running the loop to an HTTP status and detail.
+
+    Providers raise typed LLM errors, so the mapping follows the exception
+    type rather than its message. Only requests the provider rejected are
+    reported as client errors; outages stay retryable 5xx responses.
+
+    Args:
+        exc: The error raised while running the loop
+
+    Returns:
+        HTTP status code and the error detail for the client
+    """
+    if isinstance(exc, LLMRateLimitError):
+        return status.HTTP_429_TOO_MANY_REQUESTS, {
+            "code": ErrorCode.RATE_LIMIT.value,
+            "message": "API rate limit exceeded",
+            "retryable": True,
+            "retry_after": exc.retry_after or DEFAULT_RETRY_AFTER,
+        }
+    if isinstance(exc, (LLMTimeoutError, TimeoutError)):
+        return status.HTTP_504_GATEWAY_TIMEOUT, {
+            "code": ErrorCode.TIMEOUT.value,
+            "message": "LLM request timed out",
+            "retryable": True,
+        }
+    if isinstance(exc, (LLMAuthenticationError, LLMRequestError)):
+        return status.HTTP_400_BAD_REQUEST, {
+            "code": ErrorCode.API_ERROR.value,
+            "message": str(exc),
+            "retryable": False,
+        }
+    if isinstance(exc, LLMServiceError):
+        return status.HTTP_502_BAD_GATEWAY, {
+            "code": ErrorCode.PROVIDER_UNAVAILABLE.value,
+            "message": str(exc),
+            "retryable": True,
+        }
+    return status.HTTP_500_INTERNAL_SERVER_ERROR, {
+        "code": ErrorCode.INTERNAL_ERROR.value,
+        "message": f"An error occurred: {exc}",
+        "retryable": False,
+    }
+
+
 def loop_result_to_response(result: LoopResult) -> RunResponse:
     """Convert a LoopResult to the API response model."""
     iterations = []
@@ -134,46 +260,8 @@ async def run_ralph_loop(request: RunRequest) -> RunResponse:
         return loop_result_to_response(result)
 
     except Exception as e:
-        # Map known exceptions to error codes
-        error_message = str(e)
-
-        if "rate" in error_message.lower() or "429" in error_message:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "code": ErrorCode.RATE_LIMIT.value,
-                    "message": "API rate limit exceeded",
-                    "retryable": True,
-                    "retry_after": 60,
-                },
-            ) from None
-        elif "timeout" in error_message.lower():
-            raise HTTPException(
-                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-                detail={
-                    "code": ErrorCode.TIMEOUT.value,
-                    "message": "LLM request timed out",
-                    "retryable": True,
-                },
-            ) from None
-        elif "api" in error_message.lower() or "key" in error_message.lower():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "code": ErrorCode.API_ERROR.value,
-                    "message": error_message,
-                    "retryable": False,
-                },
-            ) from None
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "code": ErrorCode.INTERNAL_ERROR.value,
-                    "message": f"An error occurred: {error_message}",
-                    "retryable": False,
-                },
-            ) from None
+        status_code, detail = _classify_error(e)
+        raise HTTPException(status_code=status_code, detail=detail) from None
 
 
 @router.get("/run/stream")
@@ -220,17 +308,17 @@ async def run_ralph_loop_stream(
 
     if session is None:
         # Return error event immediately
-        async def error_generator() -> AsyncGenerator[dict[str, str], None]:
-            yield {
-                "event": "error",
-                "data": json.dumps(
+        async def error_generator() -> AsyncGenerator[bytes, None]:
+            yield _sse_frame(
+                "error",
+                _dumps(
                     {
                         "code": ErrorCode.INVALID_TOKEN.value,
                         "message": "Invalid or expired session token",
                         "retryable": False,
                     }
                 ),
-            }
+            )
 
         return EventSourceResponse(error_generator())
 
@@ -253,42 +341,41 @@ async def run_ralph_loop_stream(
     llm = get_llm_provider(session.provider, session.api_key)
 
     # Create the SSE generator
-    async def stream_generator() -> AsyncGenerator[dict[str, str], None]:
+    async def stream_generator() -> AsyncGenerator[bytes, None]:
         # Event queue for hook callbacks
-        event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=STREAM_QUEUE_SIZE
+        )
         cancelled = False
 
-        def make_hook_sync(coro_func: Any) -> Any:
-            """Wrap an async callback for sync hook invocation."""
-
-            def sync_wrapper(*args: Any, **kwargs: Any) -> None:
-                # Put event in queue to be processed by async generator
-                asyncio.create_task(coro_func(*args, **kwargs))
-
-            return sync_wrapper
-
-        async def on_iteration_start(iteration: int, state: LoopState) -> None:
-            await event_queue.put(
+        # The loop calls its hooks synchronously on the event loop, so each
+        # hook queues its event directly, in order. A slow client loses the
+        # oldest progress events rather than growing the queue.
+        def on_iteration_start(iteration: int, state: LoopState) -> None:
+            _offer_event(
+                event_queue,
                 {
                     "event": "iteration_start",
                     "data": {
                         "iteration": iteration,
                         "max_iterations": state.max_iterations,
                     },
-                }
+                },
             )
 
-        async def on_generate(definition: str) -> None:
-            await event_queue.put(
+        def on_generate(definition: str) -> None:
+            _offer_event(
+                event_queue,
                 {
                     "event": "generate",
                     "data": {"definition": definition},
-                }
+                },
             )
 
-        async def on_critique(results: list[CheckResult]) -> None:
+        def on_critique(results: list[CheckResult]) -> None:
             failed = [r for r in results if not r.passed]
-            await event_queue.put(
+            _offer_event(
+                event_queue,
                 {
                     "event": "critique",
                     "data": {
@@ -296,22 +383,22 @@ async def run_ralph_loop_stream(
                         "failed_count": len(failed),
                         "failed_checks": [r.code for r in failed],
                     },
-                }
+                },
             )
 
-        async def on_refine(definition: str) -> None:
-            await event_queue.put(
+        def on_refine(definition: str) -> None:
+            _offer_event(
+                event_queue,
                 {
                     "event": "refine",
                     "data": {"definition": definition},
-                }
+                },
             )
 
-        async def on_verify(
-            verify_status: VerifyStatus, results: list[CheckResult]
-        ) -> None:
+        def on_verify(verify_status: VerifyStatus, results: list[CheckResult]) -> None:
             failed = [r for r in results if not r.passed]
-            await event_queue.put(
+            _offer_event(
+                event_queue,
                 {
                     "event": "verify",
                     "data": {
@@ -319,11 +406,12 @@ async def run_ralph_loop_stream(
                         "passed_count": len(results) - len(failed),
                         "failed_count": len(failed),
                     },
-                }
+                },
             )
 
-        async def on_iteration_end(iteration: LoopIteration) -> None:
-            await event_queue.put(
+        def on_iteration_end(iteration: LoopIteration) -> None:
+            _offer_event(
+                event_queue,
                 {
                     "event": "iteration_end",
                     "data": {
@@ -331,47 +419,16 @@ async def run_ralph_loop_stream(
                         "definition": iteration.final_definition,
                         "status": iteration.verify_status.value,
                     },
-                }
-            )
-
-        # Create hooks with queue-based callbacks
-        def _wrap_iteration_start(i: int, s: LoopState) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_iteration_start(i, s))
-            )
-
-        def _wrap_generate(d: str) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_generate(d))
-            )
-
-        def _wrap_critique(r: list[CheckResult]) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_critique(r))
-            )
-
-        def _wrap_refine(d: str) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_refine(d))
-            )
-
-        def _wrap_verify(s: VerifyStatus, r: list[CheckResult]) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_verify(s, r))
-            )
-
-        def _wrap_iteration_end(it: LoopIteration) -> None:
-            asyncio.get_event_loop().call_soon_threadsafe(
-                lambda: asyncio.create_task(on_iteration_end(it))
+                },
             )
 
         hooks = LoopHooks(
-            on_iteration_start=_wrap_iteration_start,
-            on_generate=_wrap_generate,
-            on_critique=_wrap_critique,
-            on_refine=_wrap_refine,
-            on_verify=_wrap_verify,
-            on_iteration_end=_wrap_iteration_end,
+            on_iteration_start=on_iteration_start,
+            on_generate=on_generate,
+            on_critique=on_critique,
+            on_refine=on_refine,
+            on_verify=on_verify,
+            on_iteration_end=on_iteration_end,
         )
 
         # Create loop config and runner
@@ -384,49 +441,68 @@ async def run_ralph_loop_stream(
         )
 
         try:
-            # Stream events from queue until complete
-            while not loop_task.done() or not event_queue.empty():
-                # Check for client disconnect
-                if await request.is_disconnected():
-                    cancelled = True
-                    loop_task.cancel()
-                    break
-
+            # Stream events from queue until complete. Events are sent as
+            # soon as they are queued; the client connection is only
+            # re-checked when the loop has been quiet for a while.
+            finished = False
+            while not finished:
                 try:
-                    # Get next event with timeout
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                    yield {
-                        "event": event["event"],
-                        "data": json.dumps(event["data"]),
-                    }
+                    event = await asyncio.wait_for(
+                        event_queue.get(), timeout=STREAM_IDLE_TIMEOUT
+                    )
+                except TimeoutError:
+                    if await request.is_disconnected():
+                        cancelled = True
+                        loop_task.cancel()
+                        break
+                    if loop_task.done() and event_queue.empty():
+                        break
+                    continue
+
+                # Send events queued right behind it in the same step
+                burst = [event]
+                while len(burst) < STREAM_BURST_SIZE and not event_queue.empty():
+                    burst.append(event_queue.get_nowait())
+
+                for event in burst:
+                    # Events may carry their payload pre-encoded as "raw"
+                    raw = event.get("raw")
+                    yield _sse_frame(
+                        event["event"],
+                        raw if raw is not None else _dumps(event["data"]),
+                    )
 
                     # If complete or error, we're done
                     if event["event"] in ("complete", "error"):
+                        finished = True
                         break
 
-                except TimeoutError:
-                    # No event yet, continue checking
-                    continue
-
         except asyncio.CancelledError:
             cancelled = True
         finally:
             if not loop_task.done():
                 loop_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await loop_task
+                # asyncio.wait does not re-cancel on timeout, so a loop slow
+                # to unwind cannot hold up the stream
+                done, _ = await asyncio.wait({loop_task}, timeout=STREAM_CANCEL_TIMEOUT)
+                if not done:
+                    logger.warning(
+                        "Loop for %s did not stop within %.1fs of cancellation",
+                        class_info.iri,
+                        STREAM_CANCEL_TIMEOUT,
+                    )
 
         if cancelled:
-            yield {
-                "event": "error",
-                "data": json.dumps(
+            yield _sse_frame(
+                "error",
+                _dumps(
                     {
                         "code": "CANCELLED",
                         "message": "Request cancelled by client",
                         "retryable": False,
                     }
                 ),
-            }
+            )
 
     return EventSourceResponse(stream_generator())
 
@@ -436,16 +512,20 @@ async def run_loop_with_error_handling(
     class_info: ClassInfo,
     event_queue: asyncio.Queue[dict[str, Any]],
 ) -> LoopResult | None:
-    """Run the loop and handle errors/completion."""
+    """Run the loop and handle errors/completion.
+
+    Progress events leave a free slot in the queue, so the final event is
+    always queued without waiting on the client.
+    """
     try:
         result = await loop.run(class_info)
 
-        # Send complete event
+        # Send complete event, already encoded by pydantic
         response = loop_result_to_response(result)
-        await event_queue.put(
+        event_queue.put_nowait(
             {
                 "event": "complete",
-                "data": response.model_dump(),
+                "raw": response.model_dump_json().encode(),
             }
         )
 
@@ -454,33 +534,11 @@ async def run_loop_with_error_handling(
     except asyncio.CancelledError:
         raise
     except Exception as e:
-        error_message = str(e)
-        error_code = ErrorCode.INTERNAL_ERROR.value
-        retryable = False
-        retry_after = None
-
-        if "rate" in error_message.lower() or "429" in error_message:
-            error_code = ErrorCode.RATE_LIMIT.value
-            error_message = "API rate limit exceeded"
-            retryable = True
-            retry_after = 60
-        elif "timeout" in error_message.lower():
-            error_code = ErrorCode.TIMEOUT.value
-            error_message = "LLM request timed out"
-            retryable = True
-        elif "api" in error_message.lower() or "key" in error_message.lower():
-            error_code = ErrorCode.API_ERROR.value
-            retryable = False
-
-        await event_queue.put(
+        _, detail = _classify_error(e)
+        event_queue.put_nowait(
             {
                 "event": "error",
-                "data": {
-                    "code": error_code,
-                    "message": error_message,
-                    "retryable": retryable,
-                    "retry_after": retry_after,
-                },
+                "data": {"retry_after": None, **detail},
             }
         )
 
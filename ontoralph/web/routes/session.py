@@ -47,6 +47,6 @@ async def create_session(request: SessionRequest) -> SessionResponse:
 
     return SessionResponse(
         session_token=session.token,
-        expires_at=session.expires_at,
+        expires_at=session.expires_datetime,
         provider=session.provider,
     )
@@ -1,5 +1,7 @@
 """Definition validation endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status
 
 from ontoralph.core.checklist import ChecklistEvaluator
@@ -9,12 +11,28 @@ from ontoralph.web.models import (
     ValidateBatchRequest,
     ValidateBatchResponse,
     ValidateComparisonItem,
+    ValidateDefinitionItem,
     ValidateRequest,
     ValidateResponse,
 )
 
 router = APIRouter(tags=["validate"])
 
+# Shared evaluator; evaluation keeps no per-request state
+_evaluator: ChecklistEvaluator | None = None
+
+
+def get_evaluator() -> ChecklistEvaluator:
+    """Get the shared checklist evaluator, creating it on first use.
+
+    Returns:
+        The singleton ChecklistEvaluator instance
+    """
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = ChecklistEvaluator()
+    return _evaluator
+
 
 def check_result_to_response(result: CheckResult) -> CheckResultResponse:
     """Convert a CheckResult to the API response model."""
@@ -53,6 +71,33 @@ def evaluate_definition(
     return status.value, response_results, passed, failed
 
 
+def evaluate_definitions(
+    items: list[ValidateDefinitionItem],
+    evaluator: ChecklistEvaluator,
+) -> list[tuple[str, list[CheckResultResponse], int, int]]:
+    """Evaluate several definitions in turn.
+
+    Runs in a worker thread for batch requests. Concurrent requests share
+    the evaluator from different threads; its pattern cache is locked.
+
+    Args:
+        items: Definitions to evaluate
+        evaluator: Checklist evaluator to use
+
+    Returns:
+        One (status, results, passed_count, failed_count) tuple per item
+    """
+    return [
+        evaluate_definition(
+            definition=item.definition,
+            term=item.term,
+            is_ice=item.is_ice,
+            evaluator=evaluator,
+        )
+        for item in items
+    ]
+
+
 @router.post("/validate", response_model=ValidateResponse | ValidateBatchResponse)
 async def validate_definition(
     request: ValidateRequest | ValidateBatchRequest,
@@ -67,13 +112,11 @@ async def validate_definition(
 
     No LLM is used - this is purely checklist-based validation.
     """
-    evaluator = ChecklistEvaluator()
+    evaluator = get_evaluator()
 
     # Check if this is a batch request
     if isinstance(request, ValidateBatchRequest):
         # Batch comparison mode
-        comparisons = []
-
         for item in request.definitions:
             if not item.definition or not item.definition.strip():
                 raise HTTPException(
@@ -81,22 +124,24 @@ async def validate_definition(
                     detail=f"Definition for '{item.label}' cannot be empty",
                 )
 
-            status_val, results, passed, failed = evaluate_definition(
-                definition=item.definition,
-                term=item.term,
-                is_ice=item.is_ice,
-                evaluator=evaluator,
-            )
+        # Evaluate off the event loop so a large batch doesn't stall
+        # other requests
+        evaluations = await asyncio.to_thread(
+            evaluate_definitions, request.definitions, evaluator
+        )
 
-            comparisons.append(
-                ValidateComparisonItem(
-                    label=item.label,
-                    status=status_val,
-                    passed_count=passed,
-                    failed_count=failed,
-                    results=results,
-                )
+        comparisons = [
+            ValidateComparisonItem(
+                label=item.label,
+                status=status_val,
+                passed_count=passed,
+                failed_count=failed,
+                results=results,
+            )
+            for item, (status_val, results, passed, failed) in zip(
+                request.definitions, evaluations, strict=True
             )
+        ]
 
         return ValidateBatchResponse(comparisons=comparisons)
 
@@ -91,15 +91,18 @@ def create_app(
         call_next: Callable[[Request], Awaitable[Response]],
     ) -> Response:
         """Log all requests with timing."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         response: Response = await call_next(request)
-        duration = time.time() - start_time
 
-        logger.info(
-            f"{request.method} {request.url.path} "
-            f"status={response.status_code} "
-            f"duration={duration:.3f}s"
-        )
+        # Skip building the request URL when INFO records are filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s %s status=%s duration=%.3fs",
+                request.method,
+                request.url.path,
+                response.status_code,
+                time.perf_counter() - start_time,
+            )
         return response
 
     # Register API routes with /api prefix
@@ -113,6 +116,10 @@ def create_app(
     if STATIC_DIR.exists():
         app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
+        # Stylesheets and scripts are referenced from the page root
+        app.mount("/css", StaticFiles(directory=STATIC_DIR / "css"), name="css")
+        app.mount("/js", StaticFiles(directory=STATIC_DIR / "js"), name="js")
+
         @app.get("/")
         async def serve_index() -> Response:
             """Serve the main index.html."""
@@ -124,22 +131,6 @@ def create_app(
                 content={"message": "Frontend not built. Use /api endpoints."},
             )
 
-        @app.get("/css/{path:path}")
-        async def serve_css(path: str) -> Response:
-            """Serve CSS files."""
-            file_path = STATIC_DIR / "css" / path
-            if file_path.exists():
-                return FileResponse(file_path, media_type="text/css")
-            return JSONResponse(status_code=404, content={"message": "Not found"})
-
-        @app.get("/js/{path:path}")
-        async def serve_js(path: str) -> Response:
-            """Serve JavaScript files."""
-            file_path = STATIC_DIR / "js" / path
-            if file_path.exists():
-                return FileResponse(file_path, media_type="application/javascript")
-            return JSONResponse(status_code=404, content={"message": "Not found"})
-
     else:
 
         @app.get("/")
@@ -6,19 +6,30 @@ Tokens are used to authenticate SSE connections without exposing API keys.
 
 import secrets
 import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 
 
 @dataclass
 class Session:
-    """A session containing provider and API key information."""
+    """A session containing provider and API key information.
+
+    expires_at is a time.monotonic() deadline, which is cheap to compare
+    and unaffected by wall-clock changes. created_at is a time.time()
+    timestamp.
+    """
 
     token: str
     provider: str
     api_key: str
-    expires_at: datetime
-    created_at: datetime
+    expires_at: float
+    created_at: float
+
+    @property
+    def expires_datetime(self) -> datetime:
+        """Wall-clock time at which the session expires."""
+        return datetime.fromtimestamp(time.time() + self.expires_at - time.monotonic())
 
 
 class SessionStore:
@@ -39,8 +50,8 @@ class SessionStore:
             ttl_minutes: Token TTL in minutes (default: 30)
         """
         self._sessions: dict[str, Session] = {}
-        self._lock = threading.RLock()
-        self._ttl = timedelta(minutes=ttl_minutes)
+        self._lock = threading.Lock()
+        self._ttl = ttl_minutes * 60.0
 
     def create_session(self, provider: str, api_key: str) -> Session:
         """Create a new session token.
@@ -56,18 +67,18 @@ class SessionStore:
         random_bytes = secrets.token_urlsafe(self.TOKEN_BYTES)
         token = f"{self.TOKEN_PREFIX}{random_bytes}"
 
-        now = datetime.now()
+        now = time.monotonic()
         session = Session(
             token=token,
             provider=provider,
             api_key=api_key,
             expires_at=now + self._ttl,
-            created_at=now,
+            created_at=time.time(),
         )
 
         with self._lock:
             # Clean up expired sessions periodically
-            self._cleanup_expired()
+            self._cleanup_expired(now)
             self._sessions[token] = session
 
         return session
@@ -81,18 +92,19 @@ class SessionStore:
         Returns:
             Session if valid, None if invalid or expired
         """
+        now = time.monotonic()
         with self._lock:
             session = self._sessions.get(token)
             if session is None:
                 return None
 
             # Check if expired
-            if datetime.now() > session.expires_at:
+            if now > session.expires_at:
                 del self._sessions[token]
                 return None
 
             # Extend TTL on successful validation
-            session.expires_at = datetime.now() + self._ttl
+            session.expires_at = now + self._ttl
             return session
 
     def get_session(self, token: str) -> Session | None:
@@ -104,12 +116,13 @@ class SessionStore:
         Returns:
             Session if valid, None if invalid or expired
         """
+        now = time.monotonic()
         with self._lock:
             session = self._sessions.get(token)
             if session is None:
                 return None
 
-            if datetime.now() > session.expires_at:
+            if now > session.expires_at:
                 del self._sessions[token]
                 return None
 
@@ -130,13 +143,17 @@ class SessionStore:
                 return True
             return False
 
-    def _cleanup_expired(self) -> int:
+    def _cleanup_expired(self, now: float) -> int:
         """Remove all expired sessions.
 
+        The caller must hold the lock.
+
+        Args:
+            now: Current time.monotonic() reading, taken by the caller
+
         Returns:
             Number of sessions removed
         """
-        now = datetime.now()
         expired = [
             token
             for token, session in self._sessions.items()
@@ -161,7 +178,7 @@ class SessionStore:
     def session_count(self) -> int:
         """Number of active sessions."""
         with self._lock:
-            self._cleanup_expired()
+            self._cleanup_expired(time.monotonic())
             return len(self._sessions)
 
 
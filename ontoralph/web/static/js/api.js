@@ -276,10 +276,12 @@ const api = {
     /**
      * Get batch job status
      * @param {string} jobId - Job ID
+     * @param {number|null} since - Only list classes completed after this cursor
      * @returns {Promise<object>}
      */
-    async getBatchStatus(jobId) {
-        return request(`/batch/${jobId}`);
+    async getBatchStatus(jobId, since = null) {
+        const query = since === null ? '' : `?since=${since}`;
+        return request(`/batch/${jobId}${query}`);
     },
 
     /**
@@ -331,10 +333,7 @@ const api = {
                 // Event handlers for each event type
                 const eventTypes = [
                     'status',
-                    'progress',
-                    'class_start',
-                    'class_complete',
-                    'class_error',
+                    'batch_update',
                     'job_complete',
                     'error'
                 ];
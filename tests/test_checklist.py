@@ -6,6 +6,9 @@ This module tests:
 - ChecklistEvaluator: Full evaluation and scoring logic
 """
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from ontoralph.core.checklist import (
@@ -133,6 +136,38 @@ class TestCircularityChecker:
         assert result.code == "C3"
         assert result.severity == Severity.REQUIRED
 
+    def test_pattern_cache_is_bounded(
+        self, checker: CircularityChecker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the oldest term is dropped once the cache is full."""
+        monkeypatch.setattr(CircularityChecker, "PATTERN_CACHE_SIZE", 2)
+        for term in ("Alpha", "Beta", "Gamma"):
+            checker.check("A thing that exists", term)
+
+        assert list(checker._pattern_cache) == ["beta", "gamma"]
+
+    def test_pattern_cache_shared_across_threads(
+        self, checker: CircularityChecker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent checks can evict from the cache safely."""
+        monkeypatch.setattr(CircularityChecker, "PATTERN_CACHE_SIZE", 4)
+        # Switch threads often so unguarded evictions would collide
+        previous = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def check_terms(worker: int) -> None:
+            for i in range(200):
+                checker.check("A thing that exists", f"term{worker}_{i}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for future in [pool.submit(check_terms, w) for w in range(8)]:
+                    future.result()
+        finally:
+            sys.setswitchinterval(previous)
+
+        assert len(checker._pattern_cache) <= 4
+
     def test_partial_term_in_definition(self, checker: CircularityChecker) -> None:
         """Test detection of partial term (individual words)."""
         result = checker.check(
@@ -165,6 +200,15 @@ class TestCircularityChecker:
         )
         assert not result.passed
 
+    def test_patterns_reused_across_checks(self, checker: CircularityChecker) -> None:
+        """Test that repeated checks of one term reuse compiled patterns."""
+        first = checker.check("A person who walks", "Person")
+        second = checker.check("An agent who walks", "Person")
+
+        assert not first.passed
+        assert second.passed
+        assert list(checker._pattern_cache) == ["person"]
+
 
 class TestChecklistEvaluator:
     """Tests for ChecklistEvaluator."""
@@ -15,6 +15,7 @@ import pytest
 from click.testing import CliRunner
 
 from ontoralph.cli import EXIT_FAILURE, EXIT_SUCCESS, main
+from ontoralph.output import TurtleValidationError
 
 
 @pytest.fixture
@@ -160,6 +161,36 @@ class TestRunCommand:
         content = output_file.read_text()
         assert "owl:Class" in content or "a owl:Class" in content
 
+    def test_run_turtle_with_unwritable_iri(
+        self, runner: CliRunner, temp_dir: Path
+    ) -> None:
+        """Test that an IRI Turtle cannot represent gives a clean error."""
+        output_file = temp_dir / "output.ttl"
+
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--iri",
+                "http://example.org/Bad Class",
+                "--label",
+                "Bad Class",
+                "--parent",
+                "owl:Thing",
+                "--provider",
+                "mock",
+                "--output",
+                str(output_file),
+                "--format",
+                "turtle",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert not isinstance(result.exception, TurtleValidationError)
+        assert "Cannot write Turtle output" in result.output
+        assert not output_file.exists()
+
     def test_run_with_mock_json_format(self, runner: CliRunner) -> None:
         """Test run with JSON output format."""
         result = runner.invoke(
@@ -321,6 +352,44 @@ classes:
         assert output_dir.exists()
         assert (output_dir / "SUMMARY.md").exists()
 
+    def test_batch_validate_output_skips_unwritable_iri(
+        self, runner: CliRunner, temp_dir: Path
+    ) -> None:
+        """Test that a class Turtle cannot write does not abort validation."""
+        input_file = temp_dir / "classes.yaml"
+        input_file.write_text("""\
+classes:
+  - iri: ":Class1"
+    label: "Class 1"
+    parent: "owl:Thing"
+
+  - iri: "http://example.org/Bad Class"
+    label: "Bad Class"
+    parent: "owl:Thing"
+""")
+        output_dir = temp_dir / "results"
+
+        result = runner.invoke(
+            main,
+            [
+                "batch",
+                str(input_file),
+                "--output",
+                str(output_dir),
+                "--provider",
+                "mock",
+                "--format",
+                "markdown",
+                "--validate-output",
+            ],
+        )
+
+        assert not isinstance(result.exception, TurtleValidationError)
+        assert result.exit_code in [EXIT_SUCCESS, EXIT_FAILURE]
+        assert "Bad Class: Cannot write Turtle output" in result.output
+        assert "Cannot validate" not in result.output
+        assert (output_dir / "_Class1.md").exists()
+
     def test_batch_invalid_yaml(self, runner: CliRunner, temp_dir: Path) -> None:
         """Test batch with invalid YAML."""
         input_file = temp_dir / "invalid.yaml"
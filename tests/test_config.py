@@ -9,6 +9,7 @@ This module tests:
 """
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 
@@ -427,6 +428,49 @@ class TestCustomPromptTemplates:
         assert ":Sibling2" in prompt
         assert "Old definition" in prompt
 
+    def test_unknown_placeholder_preserved(self) -> None:
+        """Test unknown placeholders are left untouched."""
+        config = PromptConfig(generate_template="${label} ${unknown}")
+        manager = PromptTemplateManager(config)
+
+        class_info = ClassInfo(iri=":T", label="Thing", parent_class="owl:Thing")
+
+        assert manager.format_generate(class_info) == "Thing ${unknown}"
+
+    def test_rendered_prompts_memoized(self) -> None:
+        """Test identical inputs reuse the rendered custom prompt."""
+        config = PromptConfig(critique_template="Critique ${definition}")
+        manager = PromptTemplateManager(config)
+
+        class_info = ClassInfo(iri=":T", label="Thing", parent_class="owl:Thing")
+        first = manager.format_critique(class_info, "A definition.")
+        second = manager.format_critique(class_info, "A definition.")
+        other = manager.format_critique(class_info, "Another definition.")
+
+        assert first is second
+        assert other == "Critique Another definition."
+        assert not hasattr(manager, "__dict__")
+
+    @pytest.mark.parametrize("jinja2_importable", [True, False])
+    def test_string_template_semantics(
+        self, monkeypatch: pytest.MonkeyPatch, jinja2_importable: bool
+    ) -> None:
+        """Test custom templates render the same with or without jinja2."""
+        if not jinja2_importable:
+            monkeypatch.setitem(sys.modules, "jinja2", None)
+        config = PromptConfig(
+            generate_template=(
+                "$label costs $$5 {# note #} ${label.upper()} ${ label } ${label}"
+            ),
+        )
+        manager = PromptTemplateManager(config)
+
+        class_info = ClassInfo(iri=":T", label="Thing", parent_class="owl:Thing")
+
+        assert manager.format_generate(class_info) == (
+            "Thing costs $5 {# note #} ${label.upper()} ${ label } Thing"
+        )
+
 
 class TestLoadSettings:
     """Tests for the load_settings convenience function."""
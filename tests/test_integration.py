@@ -11,6 +11,7 @@ This module contains end-to-end integration tests covering:
 These tests verify that all components work together correctly.
 """
 
+import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -671,3 +672,31 @@ class TestBatchReportGenerator:
         # Should contain summary statistics
         assert "Total" in report or "Summary" in report
         assert "Passed" in report or "passed" in report
+
+    def test_batch_json_summary_counts(self) -> None:
+        """Test batch JSON summary aggregates results in one pass."""
+        results = [
+            make_loop_result(
+                class_info=ClassInfo(
+                    iri=":A", label="A", parent_class="owl:Thing", is_ice=True
+                ),
+                definition="An ICE that denotes A.",
+                iterations=2,
+            ),
+            make_loop_result(
+                class_info=ClassInfo(
+                    iri=":B", label="B", parent_class="owl:Thing", is_ice=True
+                ),
+                definition="An ICE that denotes B.",
+                status=VerifyStatus.FAIL,
+                iterations=3,
+            ),
+        ]
+
+        data = json.loads(BatchReportGenerator().generate_json(results))
+
+        assert data["summary"]["total"] == 2
+        assert data["summary"]["passed"] == 1
+        assert data["summary"]["failed"] == 1
+        assert data["summary"]["total_iterations"] == 5
+        assert [r["class_info"]["iri"] for r in data["results"]] == [":A", ":B"]
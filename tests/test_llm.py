@@ -499,6 +499,60 @@ class TestPromptTemplates:
         assert "R2" in prompt  # Issue code
         assert "represents" in prompt  # Issue evidence
 
+    def test_semantic_critique_prompt_skips_decided_checks(
+        self, sample_class_info: ClassInfo
+    ) -> None:
+        from ontoralph.llm.prompts import format_semantic_critique_prompt
+
+        decided = [
+            CheckResult(
+                code=code,
+                name=code,
+                passed=True,
+                evidence="Checked locally",
+                severity=Severity.RED_FLAG,
+            )
+            for code in ("C3", "C4", "R1", "R2", "R3", "R4")
+        ]
+        prompt = format_semantic_critique_prompt(
+            sample_class_info, "An ICE that denotes something.", decided
+        )
+
+        assert "An ICE that denotes something." in prompt
+        assert "Skip checks already evaluated: C3, C4, R1, R2, R3, R4." in prompt
+        assert "- C1:" in prompt
+        assert "- I3:" in prompt
+        assert "- C3:" not in prompt
+        assert "- R1:" not in prompt
+        assert "Include ONLY checks C1, C2, I1, I2, I3, Q1, Q2, Q3." in prompt
+
+    def test_critique_prompt_reuses_static_parts(
+        self, sample_class_info: ClassInfo
+    ) -> None:
+        from ontoralph.llm.prompts import _critique_parts, format_critique_prompt
+
+        format_critique_prompt(sample_class_info, "First definition.")
+        hits = _critique_parts.cache_info().hits
+        prompt = format_critique_prompt(sample_class_info, "Second definition.")
+
+        assert _critique_parts.cache_info().hits == hits + 1
+        assert '"Second definition."' in prompt
+
+    def test_prompt_siblings_follow_class_info_changes(
+        self, sample_class_info: ClassInfo
+    ) -> None:
+        from ontoralph.llm.prompts import format_class_context
+
+        assert ":NounPhrase" in format_class_context(sample_class_info)
+
+        copied = sample_class_info.model_copy(update={"sibling_classes": [":Clause"]})
+        lines = format_class_context(copied).splitlines()
+        assert "Siblings: :Clause" in lines
+
+        sample_class_info.sibling_classes = [":Sentence"]
+        lines = format_class_context(sample_class_info).splitlines()
+        assert "Siblings: :Sentence" in lines
+
 
 # Integration-style tests using mock
 class TestMockProviderIntegration:
@@ -763,3 +817,16 @@ class TestPromptTemplateManagerExtended:
 
         prompt = manager.format_generate(class_info)
         assert "Test template Test" in prompt
+
+    def test_get_template_manager_memoized_per_config(self) -> None:
+        """Test equal configs share one manager and distinct configs do not."""
+        from ontoralph.config import PromptConfig
+        from ontoralph.llm.prompts import get_template_manager
+
+        first = get_template_manager(PromptConfig(generate_template="A ${label}"))
+        again = get_template_manager(PromptConfig(generate_template="A ${label}"))
+        other = get_template_manager(PromptConfig(generate_template="B ${label}"))
+
+        assert first is again
+        assert other is not first
+        assert get_template_manager() is other
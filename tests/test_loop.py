@@ -8,8 +8,11 @@ This module tests:
 - State serialization: JSON round-trip
 """
 
+import asyncio
+
 import pytest
 
+from ontoralph.core.checklist import ChecklistEvaluator
 from ontoralph.core.loop import (
     CountingHooks,
     HybridCheckResult,
@@ -430,6 +433,56 @@ class TestLoopConfig:
         # and automated checks pass
         # Note: This depends on implementation details
 
+    @pytest.mark.asyncio
+    async def test_non_hybrid_critique_skips_decided_checks(
+        self, sample_class_info: ClassInfo
+    ) -> None:
+        """Test the LLM critique is told which checks were decided locally."""
+        received: list[str] = []
+
+        class RecordingProvider(MockProvider):
+            async def critique_semantic(
+                self,
+                class_info: ClassInfo,
+                definition: str,
+                decided: list[CheckResult],
+            ) -> list[CheckResult]:
+                received.extend(r.code for r in decided)
+                return await super().critique_semantic(class_info, definition, decided)
+
+        provider = RecordingProvider(
+            generate_response="An ICE that denotes something in formal speech.",
+        )
+        loop = RalphLoop(
+            llm=provider,
+            config=LoopConfig(max_iterations=1, use_hybrid_checking=False),
+        )
+
+        await loop.run(sample_class_info)
+
+        assert len(provider.critique_calls) >= 1
+        assert "R1" in received
+        assert set(received) <= ChecklistEvaluator.DETERMINISTIC_CODES
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_at_iteration_boundary(
+        self, sample_class_info: ClassInfo
+    ) -> None:
+        """Test that setting the cancel event stops the loop between iterations."""
+        cancel_event = asyncio.Event()
+        provider = MockProvider(
+            generate_response="An ICE that represents something.",
+        )
+        loop = RalphLoop(
+            llm=provider,
+            config=LoopConfig(max_iterations=5, cancel_event=cancel_event),
+            hooks=LoopHooks(on_iteration_end=lambda _: cancel_event.set()),
+        )
+
+        result = await loop.run(sample_class_info)
+
+        assert result.total_iterations == 1
+
 
 class TestIterationTracking:
     """Tests for iteration history tracking."""
@@ -8,6 +8,7 @@ This module tests:
 - BatchReportGenerator: Multi-result reports
 """
 
+import io
 import json
 from datetime import datetime, timedelta
 
@@ -349,6 +350,59 @@ class TestTurtleGenerator:
         assert "@prefix skos:" in prefixes
         assert "@prefix cco:" in prefixes
 
+    def test_generate_batch_keeps_input_order(self) -> None:
+        """Test batch output keeps every class in input order."""
+        generator = TurtleGenerator(include_comments=False)
+        classes = [
+            (ClassInfo(iri=":A", label="A", parent_class=":P1"), "Def A."),
+            (ClassInfo(iri=":B", label="B", parent_class=":P2"), "Def B."),
+            (ClassInfo(iri=":C", label="C", parent_class=":P1"), "Def C."),
+        ]
+
+        turtle = generator.generate_batch(classes, validate=True)
+
+        assert turtle.index(":A a") < turtle.index(":B a") < turtle.index(":C a")
+        graph = Graph()
+        graph.parse(data=turtle, format="turtle")
+        assert len(list(graph.subjects(RDFS.subClassOf, None))) == 3
+
+    def test_generate_escapes_literals(self, sample_class_info: ClassInfo) -> None:
+        """Test that quotes, backslashes and newlines round-trip through rdflib."""
+        generator = TurtleGenerator()
+        definition = 'An ICE that "denotes" a path like C:\\tmp\nacross\tlines.'
+        turtle = generator.generate(sample_class_info, definition, validate=True)
+
+        graph = Graph()
+        graph.parse(data=turtle, format="turtle")
+        literals = [str(o) for o in graph.objects(None, SKOS.definition)]
+        assert literals == [definition]
+
+    def test_generate_rejects_invalid_iri(self, sample_definition: str) -> None:
+        """Test that IRIs which cannot be written as Turtle raise."""
+        generator = TurtleGenerator()
+        class_info = ClassInfo(
+            iri="http://example.org/not valid",
+            label="Bad",
+            parent_class="cco:InformationContentEntity",
+            is_ice=True,
+        )
+
+        with pytest.raises(TurtleValidationError):
+            generator.generate(class_info, sample_definition)
+
+    def test_generate_prefixes_custom_only(self) -> None:
+        """Test custom-only prefixes include additional and base prefixes."""
+        generator = TurtleGenerator(
+            base_namespace="http://myontology.org/classes#",
+            additional_prefixes={"ex": "http://example.org/ex#"},
+        )
+        prefixes = generator.generate_prefixes(custom_only=True)
+
+        assert "@prefix owl:" not in prefixes
+        assert "@prefix ex: <http://example.org/ex#> ." in prefixes
+        assert prefixes.endswith("@prefix : <http://myontology.org/classes#> .")
+        assert generator.generate_prefixes(custom_only=True) is prefixes
+
 
 class TestTurtleValidation:
     """Tests for Turtle validation."""
@@ -379,6 +433,30 @@ class TestTurtleValidation:
         assert is_valid is False
         assert error is not None
 
+    def test_validate_generated_output_skips_parse(
+        self, sample_class_info: ClassInfo, sample_definition: str
+    ) -> None:
+        """Test generator output is accepted by the structural fast path."""
+        generator = TurtleGenerator()
+        turtle = generator.generate(sample_class_info, sample_definition)
+
+        assert generator._quick_validate(turtle) is True
+        assert generator.validate(turtle) == (True, None)
+        assert generator.validate(turtle, deep=True) == (True, None)
+
+    def test_validate_undeclared_prefix_falls_back(self) -> None:
+        """Test fast-path-shaped Turtle with an undeclared prefix is rejected."""
+        generator = TurtleGenerator(include_comments=False)
+        turtle = generator.generate(
+            ClassInfo(iri=":A", label="A", parent_class="cco:B"), "Def."
+        )
+        turtle = turtle.replace("@prefix cco:", "@prefix xyz:")
+
+        assert generator._quick_validate(turtle) is False
+        is_valid, error = generator.validate(turtle)
+        assert is_valid is False
+        assert error is not None
+
     def test_validate_or_raise_valid(self) -> None:
         """Test validate_or_raise with valid Turtle."""
         generator = TurtleGenerator()
@@ -450,6 +528,31 @@ class TestTurtleDiff:
         assert "represents" in text
         assert "denotes" in text
 
+    def test_diff_reuses_token_ids(self) -> None:
+        """Test words seen in earlier diffs keep their token ids."""
+        differ = TurtleDiff()
+        differ.diff("An ICE that represents x.", "An ICE that denotes x.")
+        vocabulary = dict(differ._token_cache)
+
+        diff = differ.diff("An ICE that denotes y.", "An ICE that denotes x.")
+
+        assert {w: differ._token_cache[w] for w in vocabulary} == vocabulary
+        assert diff["added_words"] == ["x."]
+        assert diff["removed_words"] == ["y."]
+        assert diff["similarity"] == 4 / 6
+
+    def test_format_diff_from_tokens_matches_text(self) -> None:
+        """Test diffing pre-tokenized definitions matches format_diff_text."""
+        differ = TurtleDiff()
+        old = "An ICE that represents something."
+        new = "An ICE that denotes something."
+
+        text = differ.format_diff_from_tokens(
+            old, new, differ.tokenize(old), differ.tokenize(new)
+        )
+
+        assert text == differ.format_diff_text(old, new)
+
 
 class TestReportGenerator:
     """Tests for ReportGenerator."""
@@ -569,6 +672,52 @@ class TestReportGenerator:
         # In iteration 1, R2 failed - should be shown
         assert "R2" in markdown
 
+    def test_iteration_markdown_cache_respects_options(
+        self, multi_iteration_result: LoopResult
+    ) -> None:
+        """Test memoized iteration blocks follow option changes."""
+        generator = ReportGenerator()
+        full = generator.generate_markdown(multi_iteration_result)
+        assert generator.generate_markdown(multi_iteration_result) == full
+
+        generator.show_all_checks = False
+        failed_only = generator.generate_markdown(multi_iteration_result)
+
+        assert failed_only != full
+        assert failed_only == ReportGenerator(show_all_checks=False).generate_markdown(
+            multi_iteration_result
+        )
+
+    def test_write_markdown_matches_generate(
+        self, multi_iteration_result: LoopResult
+    ) -> None:
+        """Test streamed Markdown matches the in-memory report."""
+        generator = ReportGenerator()
+        buffer = io.StringIO()
+        generator.write_markdown(multi_iteration_result, buffer)
+
+        assert buffer.getvalue() == generator.generate_markdown(multi_iteration_result)
+
+    def test_write_json(self, sample_loop_result: LoopResult) -> None:
+        """Test streamed JSON parses to the same data."""
+        generator = ReportGenerator()
+        buffer = io.StringIO()
+        generator.write_json(sample_loop_result, buffer)
+
+        assert buffer.getvalue() == generator.generate_json(sample_loop_result)
+
+    def test_write_json_non_ascii(self, sample_loop_result: LoopResult) -> None:
+        """Test streamed and in-memory JSON agree on non-ASCII text."""
+        result = sample_loop_result.model_copy(
+            update={"final_definition": "An ICE that denotes a café's menu."}
+        )
+        generator = ReportGenerator()
+        buffer = io.StringIO()
+        generator.write_json(result, buffer)
+
+        assert buffer.getvalue() == generator.generate_json(result)
+        assert "café" in buffer.getvalue()
+
 
 class TestBatchReportGenerator:
     """Tests for BatchReportGenerator."""
@@ -664,6 +813,26 @@ class TestBatchReportGenerator:
         assert data["summary"]["failed"] == 1
         assert len(data["results"]) == 2
 
+    def test_generate_msgpack(self, batch_results: list[LoopResult]) -> None:
+        """Test MessagePack output decodes to the JSON report data."""
+        msgpack = pytest.importorskip("msgpack")
+        generator = BatchReportGenerator()
+
+        packed = generator.generate_msgpack(batch_results)
+
+        assert msgpack.unpackb(packed, raw=False) == json.loads(
+            generator.generate_json(batch_results)
+        )
+
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_write_json(self, batch_results: list[LoopResult], count: int) -> None:
+        """Test streamed batch JSON matches the in-memory report."""
+        generator = BatchReportGenerator()
+        buffer = io.StringIO()
+        generator.write_json(batch_results[:count], buffer)
+
+        assert buffer.getvalue() == generator.generate_json(batch_results[:count])
+
 
 class TestIntegration:
     """Integration tests for output generation."""
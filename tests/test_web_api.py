@@ -1,9 +1,24 @@
 """Tests for web API endpoints."""
 
+import asyncio
+import io
+import json
+import time
+import zipfile
+
 import pytest
 from fastapi.testclient import TestClient
 
+from ontoralph.llm import (
+    LLMAuthenticationError,
+    LLMRateLimitError,
+    LLMRequestError,
+    LLMResponseError,
+    LLMServiceError,
+    LLMTimeoutError,
+)
 from ontoralph.web.batch_manager import reset_batch_manager
+from ontoralph.web.routes.run import _classify_error, _offer_event
 from ontoralph.web.server import create_app
 from ontoralph.web.session_store import reset_session_store
 
@@ -35,6 +50,12 @@ class TestHealthEndpoint:
         assert isinstance(data["version"], str)
         assert len(data["version"]) > 0
 
+    def test_health_is_briefly_cacheable(self, client: TestClient) -> None:
+        """Test health responses allow short caching."""
+        response = client.get("/api/health")
+        assert response.headers["cache-control"] == "max-age=1"
+        assert response.headers["content-type"] == "application/json"
+
 
 class TestSessionEndpoint:
     """Tests for /api/session endpoint."""
@@ -335,6 +356,61 @@ class TestRunEndpoint:
             assert isinstance(iteration["failed_checks"], list)
 
 
+class TestRunErrorClassification:
+    """Tests for mapping loop errors to API errors."""
+
+    @pytest.mark.parametrize(
+        ("error", "status_code", "code"),
+        [
+            (
+                LLMRateLimitError("Rate limit exceeded", retry_after=5),
+                429,
+                "RATE_LIMIT",
+            ),
+            (LLMTimeoutError("Request timed out"), 504, "TIMEOUT"),
+            (LLMAuthenticationError("Authentication failed"), 400, "API_ERROR"),
+            (LLMRequestError("API error (400): bad request"), 400, "API_ERROR"),
+            (LLMServiceError("Server error: overloaded"), 502, "PROVIDER_UNAVAILABLE"),
+            (LLMServiceError("Connection error: refused"), 502, "PROVIDER_UNAVAILABLE"),
+            (LLMResponseError("Unexpected error: boom"), 500, "INTERNAL_ERROR"),
+            (RuntimeError("rate 429 timeout api key"), 500, "INTERNAL_ERROR"),
+        ],
+    )
+    def test_errors_classified_by_type(
+        self, error: Exception, status_code: int, code: str
+    ) -> None:
+        """Test that the error type, not its message, picks the response."""
+        result_status, detail = _classify_error(error)
+        assert result_status == status_code
+        assert detail["code"] == code
+
+    def test_rate_limit_uses_provider_retry_after(self) -> None:
+        """Test that a provider's retry-after hint is passed on."""
+        _, detail = _classify_error(LLMRateLimitError("slow down", retry_after=5))
+        assert detail["retry_after"] == 5
+        assert detail["retryable"] is True
+
+    def test_provider_outage_is_retryable(self) -> None:
+        """Test that server and connection errors can be retried."""
+        _, detail = _classify_error(LLMServiceError("Server error: overloaded"))
+        assert detail["retryable"] is True
+
+
+class TestRunEventQueue:
+    """Tests for the bounded run stream queue."""
+
+    def test_full_queue_drops_oldest_and_keeps_room(self) -> None:
+        """Test that progress events never take the terminal event's slot."""
+        event_queue: asyncio.Queue = asyncio.Queue(maxsize=3)
+        for i in range(5):
+            _offer_event(event_queue, {"event": "generate", "data": i})
+
+        event_queue.put_nowait({"event": "complete", "data": None})
+
+        events = [event_queue.get_nowait() for _ in range(3)]
+        assert [e["data"] for e in events] == [3, 4, None]
+
+
 class TestRootEndpoint:
     """Tests for root endpoint."""
 
@@ -344,6 +420,17 @@ class TestRootEndpoint:
         # Could be 200 (index.html) or 200 (JSON message)
         assert response.status_code == 200
 
+    def test_static_assets_support_conditional_get(self, client: TestClient) -> None:
+        """Test that stylesheets are served with validators for revalidation."""
+        response = client.get("/css/styles.css")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/css")
+
+        cached = client.get(
+            "/css/styles.css", headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert cached.status_code == 304
+
 
 class TestCORS:
     """Tests for CORS configuration."""
@@ -412,6 +499,40 @@ class TestRunStreamEndpoint:
         # Should have at least iteration_start and complete events
         assert "event:" in content or "data:" in content
 
+    def test_stream_events_arrive_in_loop_order(self, client: TestClient) -> None:
+        """Test that hook events precede the final complete event."""
+        session_response = client.post(
+            "/api/session",
+            json={"provider": "mock", "api_key": "test-key"},
+        )
+        token = session_response.json()["session_token"]
+
+        response = client.get(
+            "/api/run/stream",
+            params={
+                "token": token,
+                "iri": ":TestClass",
+                "label": "Test Class",
+                "parent_class": "owl:Thing",
+                "max_iterations": "1",
+            },
+        )
+
+        events = [
+            line.removeprefix("event:").strip()
+            for line in response.text.splitlines()
+            if line.startswith("event:")
+        ]
+        assert events[0] == "iteration_start"
+        assert events.index("generate") < events.index("iteration_end")
+        assert events[-1] == "complete"
+
+        last_data = [
+            line for line in response.text.splitlines() if line.startswith("data:")
+        ][-1]
+        complete = json.loads(last_data.removeprefix("data:"))
+        assert complete["total_iterations"] == 1
+
     def test_stream_invalid_token_returns_error_event(self, client: TestClient) -> None:
         """Test that invalid token returns an error SSE event."""
         response = client.get(
@@ -538,6 +659,65 @@ class TestBatchEndpoints:
         assert "passed" in data
         assert "failed" in data
 
+    def test_get_batch_status_summary(self, client: TestClient) -> None:
+        """Test that summary mode returns counts without results."""
+        create_response = client.post(
+            "/api/batch",
+            json={
+                "classes": [
+                    {
+                        "iri": f":TestClass{i}",
+                        "label": f"Test Class {i}",
+                        "parent_class": "owl:Thing",
+                    }
+                    for i in range(2)
+                ],
+                "provider": "mock",
+                "max_iterations": 1,
+            },
+        )
+        job_id = create_response.json()["job_id"]
+
+        response = client.get(f"/api/batch/{job_id}", params={"summary": True})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_classes"] == 2
+        assert data["results"] == []
+
+    def test_get_batch_status_long_poll(self, client: TestClient) -> None:
+        """Test that a long poll returns the classes completed since a cursor."""
+        with client:
+            create_response = client.post(
+                "/api/batch",
+                json={
+                    "classes": [
+                        {
+                            "iri": f":TestClass{i}",
+                            "label": f"Test Class {i}",
+                            "parent_class": "owl:Thing",
+                        }
+                        for i in range(3)
+                    ],
+                    "provider": "mock",
+                    "max_iterations": 1,
+                },
+            )
+            job_id = create_response.json()["job_id"]
+
+            seen: list[str] = []
+            since = 0
+            for _ in range(20):
+                data = client.get(
+                    f"/api/batch/{job_id}", params={"since": since, "wait": 5}
+                ).json()
+                seen.extend(r["iri"] for r in data["results"])
+                since = data["next_since"]
+                if data["status"] == "complete":
+                    break
+
+        assert data["status"] == "complete"
+        assert sorted(seen) == [f":TestClass{i}" for i in range(3)]
+
     def test_get_batch_status_not_found(self, client: TestClient) -> None:
         """Test getting status of non-existent job."""
         response = client.get("/api/batch/nonexistent-job-id")
@@ -644,6 +824,53 @@ class TestBatchEndpoints:
         # Should contain status or job_complete events
         assert "event:" in content or "data:" in content
 
+    def test_batch_stream_status_lists_completed_results(
+        self, client: TestClient
+    ) -> None:
+        """Test that the first stream event carries the completed classes."""
+        session_response = client.post(
+            "/api/session",
+            json={"provider": "mock", "api_key": "test-key"},
+        )
+        token = session_response.json()["session_token"]
+
+        with client:
+            create_response = client.post(
+                "/api/batch",
+                json={
+                    "classes": [
+                        {
+                            "iri": f":TestClass{i}",
+                            "label": f"Test Class {i}",
+                            "parent_class": "owl:Thing",
+                        }
+                        for i in range(2)
+                    ],
+                    "provider": "mock",
+                    "max_iterations": 1,
+                },
+            )
+            job_id = create_response.json()["job_id"]
+
+            for _ in range(100):
+                if client.get(f"/api/batch/{job_id}").json()["status"] == "complete":
+                    break
+                time.sleep(0.05)
+
+            response = client.get(
+                f"/api/batch/{job_id}/stream", params={"token": token}
+            )
+
+        first_data = next(
+            line for line in response.text.splitlines() if line.startswith("data:")
+        )
+        status_event = json.loads(first_data.removeprefix("data:"))
+        assert status_event["completed"] == 2
+        assert sorted(r["iri"] for r in status_event["results"]) == [
+            ":TestClass0",
+            ":TestClass1",
+        ]
+
     def test_batch_download_not_ready(self, client: TestClient) -> None:
         """Test downloading results before job is complete."""
         # Create a job with many classes so it won't complete instantly
@@ -669,6 +896,42 @@ class TestBatchEndpoints:
         # Either 400 (not complete) or 200 (if it completed very fast)
         assert response.status_code in (200, 400)
 
+    def test_batch_download_complete_job(self, client: TestClient) -> None:
+        """Test downloading a finished job returns a valid ZIP."""
+        with client:
+            create_response = client.post(
+                "/api/batch",
+                json={
+                    "classes": [
+                        {
+                            "iri": f":TestClass{i}",
+                            "label": f"Test Class {i}",
+                            "parent_class": "owl:Thing",
+                        }
+                        for i in range(3)
+                    ],
+                    "provider": "mock",
+                    "max_iterations": 1,
+                },
+            )
+            job_id = create_response.json()["job_id"]
+
+            for _ in range(100):
+                data = client.get(f"/api/batch/{job_id}").json()
+                if data["status"] == "complete":
+                    break
+                time.sleep(0.05)
+
+            response = client.get(f"/api/batch/{job_id}/download")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+            assert zf.testzip() is None
+            summary = zf.read("SUMMARY.md").decode("utf-8")
+        assert "# Batch Processing Summary" in summary
+        assert summary.count("(`:TestClass") == 3
+
     def test_batch_download_not_found(self, client: TestClient) -> None:
         """Test downloading results for non-existent job."""
         response = client.get("/api/batch/nonexistent-job/download")
@@ -0,0 +1,463 @@
+"""Tests for batch job manager."""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from ontoralph.core.models import ClassInfo
+from ontoralph.llm import FailingMockProvider, LoopPhase, MockProvider
+from ontoralph.web import batch_manager
+from ontoralph.web.batch_manager import (
+    BatchJobManager,
+    ClassResult,
+    ClassStatus,
+    JobQueue,
+    JobStatus,
+)
+from ontoralph.web.routes import batch as batch_routes
+from ontoralph.web.routes.batch import job_to_status_json
+
+
+def make_classes(count: int) -> list[ClassInfo]:
+    """Build a list of simple classes for batch tests."""
+    return [
+        ClassInfo(
+            iri=f":Class{i}",
+            label=f"Class {i}",
+            parent_class="owl:Thing",
+            sibling_classes=[],
+            is_ice=False,
+        )
+        for i in range(count)
+    ]
+
+
+class TestBatchJob:
+    """Tests for BatchJob bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_status_column(self) -> None:
+        """Test that counts track results written through the job."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(4), provider="mock", api_key="")
+        assert bytes(job.status_codes) == bytes([ClassStatus.PENDING] * 4)
+
+        job.set_status(0, "running")
+        job.set_result(0, ClassResult(iri=":Class0", label="Class 0", status="pass"))
+        job.set_result(1, ClassResult(iri=":Class1", label="Class 1", status="fail"))
+        job.set_result(2, ClassResult(iri=":Class2", label="Class 2", status="error"))
+        job.set_status(3, "running")
+
+        assert job.passed_count == 1
+        assert job.failed_count == 2
+        assert job.completed_count == 3
+        assert job.status_codes[3] == ClassStatus.RUNNING
+
+    def test_duration_frozen_once_finished(self) -> None:
+        """Test that duration is measured from start until the job ends."""
+        job = BatchJobManager().create_job(
+            classes=make_classes(1), provider="mock", api_key=""
+        )
+        assert job.duration_seconds is None
+
+        job.mark_started()
+        job.mark_finished(JobStatus.COMPLETE)
+        duration = job.duration_seconds
+
+        assert duration is not None and duration >= 0
+        assert job.duration_seconds == duration
+        assert job.completed_at is not None
+
+    def test_status_change_sets_changed_event(self) -> None:
+        """Test that watchers are woken on status changes and transitions."""
+        job = BatchJobManager().create_job(
+            classes=make_classes(1), provider="mock", api_key=""
+        )
+        changed = job.changed
+
+        job.set_status(0, "running")
+
+        assert changed.is_set()
+        assert not job.changed.is_set()
+
+        changed = job.changed
+        job.mark_finished(JobStatus.COMPLETE)
+        assert changed.is_set()
+
+    def test_render_files_only_for_passing_results(self) -> None:
+        """Test that download files are built once a result has passed."""
+        passed = ClassResult(
+            iri="ex:<A/B>",
+            label="A",
+            status="pass",
+            final_definition="An A is a thing.",
+            total_iterations=1,
+        )
+        failed = ClassResult(iri=":B", label="B", status="fail")
+
+        passed.render_files()
+        failed.render_files()
+
+        assert passed.safe_name == "ex_A_B"
+        assert passed.md_bytes is not None
+        assert b"An A is a thing." in passed.md_bytes
+        assert json.loads(passed.json_bytes or b"")["iterations"] == 1
+        assert failed.md_bytes is None and failed.json_bytes is None
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_render_files_non_ascii(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the JSON file is the same with or without orjson."""
+        if use_orjson and not batch_manager.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(batch_manager, "ORJSON_AVAILABLE", use_orjson)
+        result = ClassResult(
+            iri=":Cafe",
+            label="Café",
+            status="pass",
+            final_definition="A Café is a place that serves crème brûlée.",
+            total_iterations=1,
+        )
+
+        result.render_files()
+
+        assert (
+            result.json_bytes
+            == (
+                "{\n"
+                '  "iri": ":Cafe",\n'
+                '  "label": "Café",\n'
+                '  "definition": "A Café is a place that serves crème brûlée.",\n'
+                '  "status": "pass",\n'
+                '  "iterations": 1\n'
+                "}"
+            ).encode()
+        )
+
+    def test_status_json_reused_until_job_changes(self) -> None:
+        """Test that the encoded status is cached until the job changes."""
+        job = BatchJobManager().create_job(
+            classes=make_classes(2), provider="mock", api_key=""
+        )
+        first = job_to_status_json(job)
+
+        assert job_to_status_json(job) is first
+
+        job.set_status(0, "running")
+        second = job_to_status_json(job)
+
+        assert second is not first
+        assert b'"running"' in second
+
+
+class TestBatchJobManager:
+    """Tests for BatchJobManager processing."""
+
+    @pytest.mark.asyncio
+    async def test_process_job_concurrently(self) -> None:
+        """Test that classes run in parallel up to the job's concurrency."""
+        manager = BatchJobManager()
+        job = manager.create_job(
+            classes=make_classes(5), provider="mock", api_key="", concurrency=2
+        )
+        job.status = JobStatus.RUNNING
+        peak = 0
+
+        class SlowProvider(MockProvider):
+            async def generate(self, class_info: ClassInfo) -> str:
+                nonlocal peak
+                peak = max(peak, len(job.in_progress))
+                await asyncio.sleep(0.01)
+                return await super().generate(class_info)
+
+        await manager._process_job(job, SlowProvider())
+
+        assert job.status == JobStatus.COMPLETE
+        assert job.completed_count == 5
+        assert sorted(job.completed_order) == [0, 1, 2, 3, 4]
+        assert peak == 2
+        assert not job.in_progress
+        assert job.current_class is None
+
+    @pytest.mark.asyncio
+    async def test_slow_class_does_not_hold_back_later_classes(self) -> None:
+        """Test that a new class starts as soon as any running one finishes."""
+        manager = BatchJobManager()
+        job = manager.create_job(
+            classes=make_classes(12), provider="mock", api_key="", concurrency=10
+        )
+        job.status = JobStatus.RUNNING
+        released = asyncio.Event()
+
+        class BlockingProvider(MockProvider):
+            async def generate(self, class_info: ClassInfo) -> str:
+                # Class 0 only finishes once a class past the first window runs
+                if class_info.iri == ":Class0":
+                    await released.wait()
+                elif class_info.iri == ":Class10":
+                    released.set()
+                return await super().generate(class_info)
+
+        await asyncio.wait_for(manager._process_job(job, BlockingProvider()), 5)
+
+        assert job.status == JobStatus.COMPLETE
+        assert job.completed_count == 12
+
+    @pytest.mark.asyncio
+    async def test_events_delivered_in_batches(self) -> None:
+        """Test that the callback receives every event, grouped into lists."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(3), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+        batches: list[list[dict[str, Any]]] = []
+
+        async def on_events(events: list[dict[str, Any]]) -> None:
+            batches.append(events)
+
+        await manager._process_job(job, MockProvider(), on_events)
+
+        names = [e["event"] for batch in batches for e in batch]
+        assert names.count("class_start") == 3
+        assert names.count("class_complete") == 3
+        assert names[-1] == "job_complete"
+        assert len(batches) < len(names)
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_affect_classes(self) -> None:
+        """Test that a failing event callback leaves processing untouched."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(12), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+
+        async def on_events(_events: list[dict[str, Any]]) -> None:
+            raise RuntimeError("callback failed")
+
+        await manager._process_job(job, MockProvider(), on_events)
+
+        assert job.status == JobStatus.COMPLETE
+        assert job.completed_count == 12
+        assert sorted(job.completed_order) == list(range(12))
+
+    @pytest.mark.asyncio
+    async def test_jobs_assigned_to_queue_by_size(self) -> None:
+        """Test that small jobs go to the quick queue and large ones to long."""
+        manager = BatchJobManager(quick_job_max_classes=2)
+        quick = manager.create_job(classes=make_classes(2), provider="mock", api_key="")
+        long = manager.create_job(classes=make_classes(3), provider="mock", api_key="")
+
+        assert quick.queue == JobQueue.QUICK
+        assert long.queue == JobQueue.LONG
+
+    @pytest.mark.asyncio
+    async def test_queue_slots_shared_across_jobs(self) -> None:
+        """Test that a queue's slots cap classes in flight across its jobs."""
+        manager = BatchJobManager(quick_job_max_classes=1, long_slots=2)
+        jobs = [
+            manager.create_job(classes=make_classes(3), provider="mock", api_key="")
+            for _ in range(2)
+        ]
+        peak = 0
+
+        class SlowProvider(MockProvider):
+            async def generate(self, class_info: ClassInfo) -> str:
+                nonlocal peak
+                peak = max(peak, sum(len(j.in_progress) for j in jobs))
+                await asyncio.sleep(0.01)
+                return await super().generate(class_info)
+
+        for job in jobs:
+            job.status = JobStatus.RUNNING
+        await asyncio.gather(
+            *(manager._process_job(job, SlowProvider()) for job in jobs)
+        )
+
+        assert all(job.completed_count == 3 for job in jobs)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_large_finished_job_spilled_to_disk(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that definitions of a large job move to disk and load back."""
+        monkeypatch.setattr(batch_manager, "SPILL_THRESHOLD_CHARS", 0)
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(2), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+        # Stands in for a download that started before the job was spilled
+        held = job.results
+
+        await manager._process_job(job, MockProvider())
+
+        assert job.spill_path is not None and job.spill_path.exists()
+        assert all(r.final_definition is None for r in job.results)
+        assert all(r.final_definition for r in held)
+        assert job.passed_count + job.failed_count == 2
+
+        loaded = await manager.get_job(job.job_id)
+        assert loaded is not None
+        assert all(r.final_definition for r in loaded.results)
+        assert loaded.completed_count == 2
+        assert await manager.get_job(job.job_id, with_results=False) is job
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire_after_retention(self) -> None:
+        """Test that finished jobs are dropped once retention has passed."""
+        manager = BatchJobManager(job_retention_seconds=0)
+        job = manager.create_job(classes=make_classes(1), provider="mock", api_key="")
+        pending = manager.create_job(
+            classes=make_classes(1), provider="mock", api_key=""
+        )
+        job.status = JobStatus.RUNNING
+        await manager._process_job(job, MockProvider())
+
+        manager.create_job(classes=make_classes(1), provider="mock", api_key="")
+
+        assert await manager.get_job(job.job_id) is None
+        assert await manager.get_job(pending.job_id) is pending
+        assert manager.job_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_fails_job_and_cancels_classes(self) -> None:
+        """Test that an error escaping a class fails the whole job."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(4), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+        set_status = job.set_status
+
+        def broken_set_status(index: int, status: str) -> None:
+            if index == 1:
+                raise RuntimeError("bookkeeping failed")
+            set_status(index, status)
+
+        job.set_status = broken_set_status  # type: ignore[method-assign]
+        errors: list[str] = []
+
+        async def on_events(events: list[dict[str, Any]]) -> None:
+            errors.extend(
+                e["data"]["error"] for e in events if e["event"] == "job_error"
+            )
+
+        await manager._process_job(job, MockProvider(), on_events)
+
+        assert job.status == JobStatus.FAILED
+        assert errors == ["bookkeeping failed"]
+        assert not job.in_progress
+
+    @pytest.mark.asyncio
+    async def test_oldest_finished_job_evicted_beyond_cap(self) -> None:
+        """Test that only the most recent finished jobs are retained."""
+        manager = BatchJobManager(max_finished_jobs=2)
+        jobs = [
+            manager.create_job(classes=make_classes(1), provider="mock", api_key="")
+            for _ in range(3)
+        ]
+        running = manager.create_job(
+            classes=make_classes(1), provider="mock", api_key=""
+        )
+        for job in jobs:
+            job.status = JobStatus.RUNNING
+            await manager._process_job(job, MockProvider())
+
+        assert await manager.get_job(jobs[0].job_id) is None
+        assert await manager.get_job(jobs[1].job_id) is jobs[1]
+        assert await manager.get_job(jobs[2].job_id) is jobs[2]
+        assert await manager.get_job(running.job_id) is running
+
+    @pytest.mark.asyncio
+    async def test_events_skipped_without_subscribers(self) -> None:
+        """Test that no events are built while the callback has no listeners."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(2), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+
+        class Subscribers:
+            def __init__(self) -> None:
+                self.count = 0
+                self.received: list[dict[str, Any]] = []
+
+            def has_subscribers(self) -> bool:
+                return self.count > 0
+
+            async def __call__(self, events: list[dict[str, Any]]) -> None:
+                self.received.extend(events)
+
+        callback = Subscribers()
+        await manager._process_job(job, MockProvider(), callback)
+
+        assert job.completed_count == 2
+        assert callback.received == []
+
+    @pytest.mark.asyncio
+    async def test_results_updated_in_place(self) -> None:
+        """Test that class results fill in the pending placeholders."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(2), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+        placeholders = list(job.results)
+
+        await manager._process_job(job, FailingMockProvider(fail_on=LoopPhase.GENERATE))
+
+        assert all(a is b for a, b in zip(job.results, placeholders, strict=True))
+        assert all(r.status == "error" for r in job.results)
+        assert job.results[0].error == "Simulated failure"
+        assert job.failed_count == 2
+
+
+class TestStreamFanout:
+    """Tests for sharing a job's stream events between subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_each_event(self) -> None:
+        """Test that every subscriber receives the same events, built once."""
+        manager = BatchJobManager()
+        job = manager.create_job(classes=make_classes(3), provider="mock", api_key="")
+        job.status = JobStatus.RUNNING
+        fanout = batch_routes._StreamFanout(job)
+        queues = [fanout.subscribe(), fanout.subscribe()]
+
+        await manager._process_job(job, MockProvider())
+
+        received: list[list[dict[str, str]]] = []
+        for queue in queues:
+            events = []
+            while (event := await queue.get()) is not None:
+                events.append(event)
+            received.append(events)
+
+        first, second = received
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert first[-1]["event"] == "job_complete"
+        iris = [
+            r["iri"]
+            for e in first
+            if e["event"] == "batch_update"
+            for r in json.loads(e["data"])["new_results"]
+        ]
+        assert sorted(iris) == [":Class0", ":Class1", ":Class2"]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_backlog_coalesced(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a full queue is replaced by a status event, not ended."""
+        monkeypatch.setattr(batch_routes, "STREAM_SUBSCRIBER_QUEUE_SIZE", 2)
+        job = BatchJobManager().create_job(
+            classes=make_classes(1), provider="mock", api_key=""
+        )
+        job.status = JobStatus.RUNNING
+        fanout = batch_routes._StreamFanout(job)
+        queue = fanout.subscribe()
+
+        for n in range(3):
+            fanout._publish({"event": "batch_update", "data": str(n)})
+
+        resync = await queue.get()
+        assert resync["event"] == "status"
+        assert json.loads(resync["data"])["total"] == 1
+        assert await queue.get() == {"event": "batch_update", "data": "2"}
+        assert queue.empty()
+        assert queue in fanout._subscribers
+        fanout.unsubscribe(queue)
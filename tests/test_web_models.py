@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from ontoralph.core.models import ClassInfo
 from ontoralph.web.models import (
     BatchClassInput,
     BatchJobStatus,
@@ -266,6 +267,13 @@ class TestBatchModels:
         assert input_class.iri == ":EventTime"
         assert input_class.sibling_classes == []
 
+    def test_batch_class_input_matches_class_info(self) -> None:
+        """Test that batch inputs carry exactly the fields of ClassInfo.
+
+        Batch jobs build ClassInfo from inputs without revalidating them.
+        """
+        assert BatchClassInput.model_fields.keys() == ClassInfo.model_fields.keys()
+
     def test_batch_request(self) -> None:
         """Test BatchRequest validation."""
         request = BatchRequest(
@@ -27,7 +27,8 @@ class TestSessionStore:
         assert len(session.token) > 40  # Token should be substantial
         assert session.provider == "claude"
         assert session.api_key == "sk-ant-test123"
-        assert session.expires_at > datetime.now()
+        assert session.expires_at > time.monotonic()
+        assert session.expires_datetime > datetime.now()
 
     def test_session_token_uniqueness(self) -> None:
         """Test that each session gets a unique token."""
@@ -189,8 +190,8 @@ class TestSessionDataclass:
 
     def test_session_fields(self) -> None:
         """Test Session dataclass fields."""
-        now = datetime.now()
-        expires = now + timedelta(minutes=30)
+        now = time.time()
+        expires = time.monotonic() + 30 * 60
 
         session = Session(
             token="ort_test123",
@@ -205,3 +206,5 @@ class TestSessionDataclass:
         assert session.api_key == "sk-ant-abc"
         assert session.expires_at == expires
         assert session.created_at == now
+        remaining = session.expires_datetime - datetime.now()
+        assert timedelta(minutes=29) < remaining <= timedelta(minutes=30)